@@ -0,0 +1,51 @@
+import sys
+from timeit import timeit
+from typing import Any, Callable, Dict
+
+import simplejson as json
+
+from openslides_backend.shared.json_codec import codecs
+
+REPETITIONS = 200
+
+
+def benchmark(name: str, function: Callable[[], Any]) -> float:
+    seconds = timeit(function, number=REPETITIONS) / REPETITIONS
+    print(f"{name:<24} {seconds * 1000:8.3f} ms")
+    return seconds
+
+
+def main() -> int:
+    """
+    Compares encoding and decoding the given file, by default the example data,
+    with all JSON codecs against plain simplejson.
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else "global/data/example-data.json"
+    with open(path, "rb") as f:
+        data = f.read()
+    value = json.loads(data)
+    print(f"{path}: {len(data)} bytes, {REPETITIONS} repetitions\n")
+    results: Dict[str, Dict[str, float]] = {
+        "simplejson": {
+            "dumps": benchmark("simplejson dumps", lambda: json.dumps(value)),
+            "loads": benchmark("simplejson loads", lambda: json.loads(data)),
+        }
+    }
+    for name, codec_class in codecs.items():
+        codec = codec_class()
+        results[f"{name} codec"] = {
+            "dumps": benchmark(f"{name} codec dumps", lambda: codec.dumps(value)),
+            "loads": benchmark(f"{name} codec loads", lambda: codec.loads(data)),
+        }
+    print()
+    baseline = results["simplejson"]
+    for name, result in results.items():
+        print(
+            f"{name:<24} dumps {baseline['dumps'] / result['dumps']:5.1f}x, "
+            f"loads {baseline['loads'] / result['loads']:5.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
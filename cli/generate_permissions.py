@@ -27,7 +27,7 @@ FILE_TEMPLATE = dedent(
     # Code generated. DO NOT EDIT.
 
     from enum import Enum
-    from typing import Dict, List
+    from typing import Dict, FrozenSet, List
 
     from .base_classes import Permission
 
@@ -98,6 +98,24 @@ def main() -> None:
         dest.write("permission_parents: Dict[Permission, List[Permission]] = ")
         dest.write(repr(all_parents))
 
+        dest.write(
+            "\n# Holds each permission together with all permissions implying it.\n"
+        )
+        dest.write("permission_ancestors: Dict[Permission, FrozenSet[Permission]] = ")
+        dest.write(format_closure(get_closure(all_parents)))
+
+        all_children: Dict[str, List[str]] = {
+            permission: [] for permission in all_parents
+        }
+        for permission, direct_parents in all_parents.items():
+            for parent in direct_parents:
+                all_children[parent].append(permission)
+        dest.write(
+            "\n# Holds each permission together with all permissions implied by it.\n"
+        )
+        dest.write("permission_descendants: Dict[Permission, FrozenSet[Permission]] = ")
+        dest.write(format_closure(get_closure(all_children)))
+
     print(f"Permissions file {DESTINATION} successfully created.")
 
 
@@ -111,5 +129,31 @@ def process_permission_level(
         yield (Permission(collection + "." + child), parent)
 
 
+def get_closure(edges: Dict[str, List[str]]) -> Dict[str, Set[str]]:
+    """
+    Returns the reflexive transitive closure of the given edges for each permission.
+    """
+    closure: Dict[str, Set[str]] = {}
+    for permission in edges:
+        reachable = {permission}
+        queue = list(edges[permission])
+        while queue:
+            current = queue.pop()
+            if current not in reachable:
+                reachable.add(current)
+                queue.extend(edges[current])
+        closure[permission] = reachable
+    return closure
+
+
+def format_closure(closure: Dict[str, Set[str]]) -> str:
+    # sort the sets to keep the output stable
+    items = (
+        f"{permission!r}: frozenset({{{', '.join(repr(p) for p in sorted(related))}}})"
+        for permission, related in closure.items()
+    )
+    return "{" + ", ".join(items) + "}"
+
+
 if __name__ == "__main__":
     main()
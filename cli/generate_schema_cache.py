@@ -0,0 +1,42 @@
+import sys
+from typing import Iterable
+
+from openslides_backend.action.actions import prepare_actions_map
+from openslides_backend.action.util.actions_map import actions_map
+from openslides_backend.models.base import model_registry
+from openslides_backend.models.fields import TEMPLATE_FIELD_SCHEMA
+from openslides_backend.shared.schema_validator import (
+    SCHEMA_CACHE_PATH,
+    SchemaValidator,
+    build_schema_cache,
+)
+from openslides_backend.shared.typing import Schema
+
+
+def get_schemas() -> Iterable[Schema]:
+    yield TEMPLATE_FIELD_SCHEMA.schema
+    for model_class in model_registry.values():
+        for field in model_class().get_fields():
+            yield field.schema_validator.schema
+    prepare_actions_map()
+    for action_class in actions_map.values():
+        if isinstance(validator := action_class.schema_validator, SchemaValidator):
+            yield validator.schema
+
+
+def main() -> int:
+    """
+    Generates the module with the code of all field and action validators into the
+    given directory or the one of OPENSLIDES_BACKEND_SCHEMA_CACHE.
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else SCHEMA_CACHE_PATH
+    if not path:
+        print("No directory specified.")
+        return 1
+    amount = build_schema_cache(path, get_schemas())
+    print(f"Generated {amount} validators into {path}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,23 +53,26 @@ from ..shared.patterns import (
     fqid_from_fqfield,
     transform_to_fqids,
 )
+from ..shared.schema_validator import SchemaValidator
 from ..shared.typing import DeletedModel, HistoryInformation
 from .relations.relation_manager import RelationManager, RelationUpdates
 from .relations.typing import FieldUpdateElement, ListUpdateElement
 from .util.action_type import ActionType
 from .util.assert_belongs_to_meeting import assert_belongs_to_meeting
+from .util.number_allocator import NumberAllocator
+from .util.prefetch import PrefetchSpec, prefetch
 from .util.typing import ActionData, ActionResultElement, ActionResults
 
 
 class SchemaProvider(type):
     """
-    Metaclass to provide pre-compiled JSON schemas for faster validation.
+    Metaclass to provide JSON schema validators which are compiled on first use.
     """
 
     def __new__(cls, name, bases, attrs):  # type: ignore
         schema = attrs.get("schema")
         if schema is not None:
-            attrs["schema_validator"] = fastjsonschema.compile(schema)
+            attrs["schema_validator"] = SchemaValidator(schema)
         return super().__new__(cls, name, bases, attrs)
 
 
@@ -101,8 +104,11 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
     history_information: Optional[str] = None
     history_relation_field: Optional[str] = None
     add_self_history_information: bool = False
+    prefetch_spec: Optional[PrefetchSpec] = None
+    prefetch_use_changed_models: bool = True
 
     relation_manager: RelationManager
+    number_allocator: NumberAllocator
 
     action_data: ActionData
     instances: List[Dict[str, Any]]
@@ -122,6 +128,7 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
     ) -> None:
         super().__init__(services, datastore, logging)
         self.relation_manager = relation_manager
+        self.number_allocator = NumberAllocator(datastore)
         self.logger = logging.getLogger(__name__)
         self.env = env
         if skip_archived_meeting_check is not None:
@@ -163,6 +170,7 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
         action_data = self.prepare_action_data(action_data)
         self.action_data = deepcopy(action_data)
         self.instances = list(self.get_updated_instances(action_data))
+        self.relation_manager.prefetch_relations(self.model, self.instances)
         is_original_instances = hasattr(
             self.get_updated_instances, "_original_instances"
         )
@@ -194,8 +202,17 @@ class Action(BaseServiceProvider, metaclass=SchemaProvider):
 
     def prefetch(self, action_data: ActionData) -> None:
         """
-        Implement in subclasses to prefetch data for the action.
+        Fetches all models described by the prefetch_spec with one request per
+        relation level. Override in subclasses to prefetch additional data.
         """
+        if self.prefetch_spec:
+            prefetch(
+                self.datastore,
+                self.model.collection,
+                action_data,
+                self.prefetch_spec,
+                self.prefetch_use_changed_models,
+            )
 
     def check_permissions(self, instance: Dict[str, Any]) -> None:
         """
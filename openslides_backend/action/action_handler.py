@@ -4,6 +4,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 import fastjsonschema
 
+from ..permissions.permission_resolver import get_permission_resolver
 from ..shared.exceptions import (
     ActionException,
     DatastoreLockedException,
@@ -130,12 +131,16 @@ class ActionHandler(BaseHandler):
                         error = cast(ActionError, exception.get_json())
                         results.append(error)
                     self.datastore.reset()
+                    get_permission_resolver(self.datastore).reset()
 
             # execute cleanup methods
             for on_success in self.on_success:
                 on_success()
 
             # Return action result
+            self.logger.debug(
+                f"Permission resolver: {get_permission_resolver(self.datastore).get_stats()}"
+            )
             self.logger.info("Request was successful. Send response now.")
             return ActionsResponse(
                 status_code=HTTPStatus.OK.value,
@@ -163,6 +168,7 @@ class ActionHandler(BaseHandler):
                         raise ActionException(exception.message)
                     else:
                         self.datastore.reset()
+                        get_permission_resolver(self.datastore).reset()
 
     def parse_actions(
         self, payload: Payload
@@ -1,3 +1,4 @@
+import contextvars
 import logging
 import threading
 from http import HTTPStatus
@@ -227,13 +228,19 @@ class ActionWorker(threading.Thread):
         self.lock = lock
         self.internal = internal
         self.started: bool = False
+        # run in the context of the request, e.g. with its translation language
+        self.context = contextvars.copy_context()
 
     def run(self):  # type: ignore
         with self.lock:
             self.started = True
             try:
-                self.response = self.handler.handle_request(
-                    self.payload, self.user_id, self.is_atomic, self.internal
+                self.response = self.context.run(
+                    self.handler.handle_request,
+                    self.payload,
+                    self.user_id,
+                    self.is_atomic,
+                    self.internal,
                 )
             except Exception as exception:
                 self.exception = exception
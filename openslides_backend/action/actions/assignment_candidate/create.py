@@ -1,7 +1,6 @@
 from typing import Any, Dict
 
 from ....models.models import AssignmentCandidate
-from ....services.datastore.commands import GetManyRequest
 from ....shared.exceptions import ActionException
 from ....shared.patterns import fqid_from_collection_and_id
 from ...mixins.create_action_with_inferred_meeting import (
@@ -9,7 +8,6 @@ from ...mixins.create_action_with_inferred_meeting import (
 )
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
-from ...util.typing import ActionData
 from .mixins import PermissionMixin
 
 
@@ -28,23 +26,7 @@ class AssignmentCandidateCreate(PermissionMixin, CreateActionWithInferredMeeting
     history_relation_field = "assignment_id"
 
     relation_field_for_meeting = "assignment_id"
-
-    def prefetch(self, action_data: ActionData) -> None:
-        self.datastore.get_many(
-            [
-                GetManyRequest(
-                    "assignment",
-                    list(
-                        {
-                            instance["assignment_id"]
-                            for instance in action_data
-                            if instance.get("assignment_id")
-                        }
-                    ),
-                    ["meeting_id", "phase", "candidate_ids"],
-                )
-            ]
-        )
+    prefetch_spec = {"assignment_id": ["meeting_id", "phase", "candidate_ids"]}
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         instance = super().update_instance(instance)
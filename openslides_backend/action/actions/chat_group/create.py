@@ -27,5 +27,5 @@ class ChatGroupCreate(
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         instance = super().update_instance(instance)
         self.check_name_unique(instance)
-        instance["weight"] = self.get_weight(instance["meeting_id"])
+        instance["weight"] = self.allocate_weight(instance["meeting_id"])
         return instance
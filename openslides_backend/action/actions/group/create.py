@@ -29,5 +29,5 @@ class GroupCreate(WeightMixin, CreateAction):
             instance["permissions"] = filter_surplus_permissions(
                 instance["permissions"]
             )
-        instance["weight"] = self.get_weight(instance["meeting_id"])
+        instance["weight"] = self.allocate_weight(instance["meeting_id"])
         return instance
@@ -139,6 +139,8 @@ class MeetingClone(MeetingImport):
             checker.run_check()
         except CheckException as ce:
             raise ActionException(str(ce))
+        finally:
+            self.logger.debug(f"Checked meeting data: {checker.format_timings()}")
         self.allowed_collections = checker.allowed_collections
 
         # set active
@@ -188,12 +190,12 @@ class MeetingClone(MeetingImport):
                 entry["user_ids"] = list(user_ids)
 
     def duplicate_mediafiles(self, json_data: Dict[str, Any]) -> None:
-        for mediafile_id in json_data["mediafile"]:
-            mediafile = json_data["mediafile"][mediafile_id]
-            if not mediafile.get("is_directory"):
-                self.media.duplicate_mediafile(
-                    mediafile["id"], self.replace_map["mediafile"][mediafile["id"]]
-                )
+        if ids := [
+            (mediafile["id"], self.replace_map["mediafile"][mediafile["id"]])
+            for mediafile in json_data["mediafile"].values()
+            if not mediafile.get("is_directory")
+        ]:
+            self.media.duplicate_mediafiles(ids)
 
     def append_extra_events(
         self, events: List[Event], json_data: Dict[str, Any]
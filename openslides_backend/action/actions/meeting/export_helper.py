@@ -1,4 +1,5 @@
-from typing import Any, Dict, Iterable, List
+from time import perf_counter
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple
 
 from datastore.shared.util import is_reserved_field
 
@@ -26,9 +27,107 @@ from ....shared.patterns import (
     id_from_fqid,
 )
 
+EXPORT_BATCH_SIZE = 1000
 
-def export_meeting(datastore: DatastoreService, meeting_id: int) -> Dict[str, Any]:
-    export: Dict[str, Any] = {}
+FetchPlan = List[Tuple[str, List[int], List[str]]]
+
+
+class ExportFetcher:
+    """
+    Fetches the models of an export according to a fetch plan, which lists the ids
+    and fields to fetch per collection. The ids of every collection are split into
+    batches of at most batch_size ids, which are only read when the consumer needs
+    them, so that the memory usage stays bounded if the results are streamed. All
+    batches are read one after another in the database context of the caller, so
+    that the export is a consistent snapshot.
+
+    The accumulated fetch time of every collection is recorded in timings and the
+    highest meta_position of all fetched models in position.
+    """
+
+    def __init__(
+        self,
+        datastore: DatastoreService,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> None:
+        self.datastore = datastore
+        self.batch_size = batch_size
+        self.timings: Dict[str, float] = {}
+        self.position = 0
+
+    def fetch(
+        self, plan: FetchPlan
+    ) -> Generator[Tuple[str, Dict[int, Any]], None, None]:
+        """
+        Yields the models of every collection of the plan in the order of the plan.
+        """
+        batches = [
+            (collection, ids[i : i + self.batch_size], fields)
+            for collection, ids, fields in plan
+            for i in range(0, len(ids), self.batch_size)
+        ]
+        results = (self.fetch_batch(*batch) for batch in batches)
+        try:
+            for collection, ids, _ in plan:
+                models: Dict[int, Any] = {}
+                for _ in range(0, len(ids), self.batch_size):
+                    batch_models, duration = next(results)
+                    models.update(batch_models)
+                    self.update_position(batch_models)
+                    self.timings[collection] = (
+                        self.timings.get(collection, 0.0) + duration
+                    )
+                yield collection, models
+        finally:
+            results.close()
+
+    def update_position(self, models: Dict[Any, Any]) -> None:
+        for model in models.values():
+            if model.get("meta_position", 0) > self.position:
+                self.position = model["meta_position"]
+
+    def format_timings(self) -> str:
+        return ", ".join(
+            f"{collection} {duration * 1000:.1f}ms"
+            for collection, duration in sorted(
+                self.timings.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+
+    def fetch_batch(
+        self, collection: str, ids: List[int], fields: List[str]
+    ) -> Tuple[Dict[int, Any], float]:
+        start = perf_counter()
+        results = self.datastore.get_many(
+            [GetManyRequest(collection, ids, fields)],
+            lock_result=False,
+            use_changed_models=False,
+        )
+        return results.get(collection) or {}, perf_counter() - start
+
+
+def export_meeting(
+    datastore: DatastoreService,
+    meeting_id: int,
+    fetcher: Optional[ExportFetcher] = None,
+) -> Dict[str, Any]:
+    return dict(export_meeting_collections(datastore, meeting_id, fetcher))
+
+
+def export_meeting_collections(
+    datastore: DatastoreService,
+    meeting_id: int,
+    fetcher: Optional[ExportFetcher] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the exported collections of the meeting one after another, starting with
+    the meeting itself and the migration index and ending with the users. The models
+    are read in batches by the given fetcher, so that only a few batches have to be
+    kept in memory in addition to the current collection if the result is consumed
+    lazily.
+    """
+    if fetcher is None:
+        fetcher = ExportFetcher(datastore)
 
     # fetch meeting
     meeting = datastore.get(
@@ -37,86 +136,130 @@ def export_meeting(datastore: DatastoreService, meeting_id: int) -> Dict[str, An
         lock_result=False,
         use_changed_models=False,
     )
-    export["meeting"] = remove_meta_fields(transfer_keys({meeting_id: meeting}))
-    export["_migration_index"] = get_backend_migration_index()
+    fetcher.update_position({meeting_id: meeting})
+    exported_meeting = remove_meta_fields(transfer_keys({meeting_id: meeting}))
+    yield "meeting", exported_meeting
+    yield "_migration_index", get_backend_migration_index()
 
     # initialize user_ids
     user_ids = set(meeting.get("user_ids", []))
+    update_user_ids(user_ids, "meeting", exported_meeting)
 
-    # fetch related models
-    relation_fields = list(get_relation_fields())
-    get_many_requests = [
-        GetManyRequest(field.get_target_collection(), ids)
-        for field in relation_fields
-        if (ids := meeting.get(field.get_own_field_name()))
+    # fetch related models, multiple fields may point to the same collection
+    ids_per_collection: Dict[str, List[int]] = {}
+    for field in get_relation_fields():
+        ids_per_collection.setdefault(str(field.get_target_collection()), []).extend(
+            meeting.get(field.get_own_field_name()) or []
+        )
+    plan: FetchPlan = [
+        (collection, ids, []) for collection, ids in ids_per_collection.items()
     ]
-    if get_many_requests:
-        results = datastore.get_many(
-            get_many_requests, lock_result=False, use_changed_models=False
+    for collection, results in fetcher.fetch(plan):
+        models = remove_meta_fields(transfer_keys(results))
+        update_user_ids(user_ids, collection, models)
+        yield collection, models
+
+    if user_ids:
+        fields, template_fields = get_user_fields(meeting_id)
+        fields.append("meta_position")
+        for _, results in fetcher.fetch([("user", list(user_ids), fields)]):
+            users = remove_meta_fields(transfer_keys(results))
+            update_users(users, template_fields, meeting_id)
+            yield "user", users
+
+
+def get_meeting_position(datastore: DatastoreService, meeting_id: int) -> int:
+    """
+    Returns the highest meta_position of the meeting and the models which are
+    exported with it, including the users referenced by any of them. Only the
+    positions and the fields referencing users are read, which is much cheaper than
+    the export itself.
+    """
+    fields = [field.get_own_field_name() for field in get_relation_fields()]
+    meeting = datastore.get(
+        fqid_from_collection_and_id("meeting", meeting_id),
+        ["meta_position", "user_ids", *get_user_reference_fields("meeting"), *fields],
+        lock_result=False,
+        use_changed_models=False,
+    )
+    fetcher = ExportFetcher(datastore)
+    fetcher.update_position({meeting_id: meeting})
+    user_ids = set(meeting.get("user_ids", []))
+    update_user_ids(user_ids, "meeting", {str(meeting_id): meeting})
+    ids_per_collection: Dict[str, List[int]] = {}
+    for field in get_relation_fields():
+        ids_per_collection.setdefault(str(field.get_target_collection()), []).extend(
+            meeting.get(field.get_own_field_name()) or []
         )
-    else:
-        results = {}
-
-    for field in relation_fields:
-        collection = field.get_target_collection()
-        if collection in results:
-            export[str(collection)] = remove_meta_fields(
-                transfer_keys(results[collection])
-            )
-        else:
-            export[str(collection)] = {}
-
-    # update user_ids
-    for collection in export:
-        if collection == "_migration_index":
-            continue
-        model = model_registry[collection]()
-        user_fields: Iterable[BaseRelationField] = model.get_relation_fields()
-        for user_field in user_fields:
-            if (
-                isinstance(user_field, RelationField)
-                and user_field.get_target_collection() == "user"
-            ):
-                user_ids.update(
-                    set(
-                        entry.get(user_field.get_own_field_name())
-                        for entry in export[collection].values()
-                        if entry.get(user_field.get_own_field_name())
-                    )
+    plan: FetchPlan = [
+        (collection, ids, ["meta_position", *get_user_reference_fields(collection)])
+        for collection, ids in ids_per_collection.items()
+    ]
+    for collection, results in fetcher.fetch(plan):
+        update_user_ids(user_ids, collection, transfer_keys(results))
+    if user_ids:
+        for _ in fetcher.fetch([("user", list(user_ids), ["meta_position"])]):
+            pass
+    return fetcher.position
+
+
+def get_user_reference_fields(collection: str) -> List[str]:
+    """
+    Returns the fields of the collection which are read by update_user_ids.
+    """
+    model = model_registry[collection]()
+    return [
+        field.get_own_field_name() for field in model.get_relation_fields_to("user")
+    ]
+
+
+def update_user_ids(
+    user_ids: Set[int], collection: str, models: Dict[str, Any]
+) -> None:
+    """
+    Adds the ids of all users referenced by the given models to user_ids.
+    """
+    model = model_registry[collection]()
+    user_fields: Iterable[BaseRelationField] = model.get_relation_fields_to("user")
+    for user_field in user_fields:
+        if (
+            isinstance(user_field, RelationField)
+            and user_field.get_target_collection() == "user"
+        ):
+            user_ids.update(
+                set(
+                    entry.get(user_field.get_own_field_name())
+                    for entry in models.values()
+                    if entry.get(user_field.get_own_field_name())
                 )
-            if (
-                isinstance(user_field, RelationListField)
-                and user_field.get_target_collection() == "user"
-            ):
-                for entry in export[collection].values():
-                    if entry.get(user_field.get_own_field_name()):
-                        user_ids.update(
-                            set(
-                                id_
-                                for id_ in entry.get(user_field.get_own_field_name())
-                                or []
-                            )
+            )
+        if (
+            isinstance(user_field, RelationListField)
+            and user_field.get_target_collection() == "user"
+        ):
+            for entry in models.values():
+                if entry.get(user_field.get_own_field_name()):
+                    user_ids.update(
+                        set(
+                            id_
+                            for id_ in entry.get(user_field.get_own_field_name()) or []
                         )
-            if isinstance(user_field, GenericRelationField):
-                for entry in export[collection].values():
-                    field_name = user_field.get_own_field_name()
-                    if (
-                        entry.get(field_name)
-                        and collection_from_fqid(entry[field_name]) == "user"
-                    ):
-                        user_ids.add(id_from_fqid(entry[field_name]))
-    add_users(list(user_ids), export, meeting_id, datastore)
-    return export
-
-
-def add_users(
-    user_ids: List[int],
-    export_data: Dict[str, Any],
-    meeting_id: int,
-    datastore: DatastoreService,
-) -> None:
-    if not user_ids:
-        return
+                    )
+        if isinstance(user_field, GenericRelationField):
+            for entry in models.values():
+                field_name = user_field.get_own_field_name()
+                if (
+                    entry.get(field_name)
+                    and collection_from_fqid(entry[field_name]) == "user"
+                ):
+                    user_ids.add(id_from_fqid(entry[field_name]))
+
+
+def get_user_fields(meeting_id: int) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Returns the fields of the exported users and the pairs of structured and
+    template field names of all template fields for the given meeting.
+    """
     fields = []
     template_fields = []
     for field in User().get_fields():
@@ -139,20 +282,12 @@ def add_users(
             fields.append(struct_field)
         else:
             fields.append(field.own_field_name)
+    return fields, template_fields
 
-    gmr = GetManyRequest(
-        "user",
-        user_ids,
-        fields,
-    )
-    users = remove_meta_fields(
-        transfer_keys(
-            datastore.get_many([gmr], lock_result=False, use_changed_models=False)[
-                "user"
-            ]
-        )
-    )
 
+def update_users(
+    users: Dict[str, Any], template_fields: List[Tuple[str, str]], meeting_id: int
+) -> None:
     for user in users.values():
         for field_name, field_template_name in template_fields:
             if user.get(field_name):
@@ -163,8 +298,6 @@ def add_users(
         else:
             user["is_present_in_meeting_ids"] = None
 
-    export_data["user"] = users
-
 
 def remove_meta_fields(res: Dict[str, Any]) -> Dict[str, Any]:
     dict_without_meta_fields = {}
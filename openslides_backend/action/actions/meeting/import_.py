@@ -5,16 +5,16 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from datastore.migrations import BaseEvent, CreateEvent, ListUpdateEvent, UpdateEvent
 
-from openslides_backend.migrations import get_backend_migration_index
+from openslides_backend.migrations import (
+    get_backend_migration_index,
+    get_migrations_after,
+)
+from openslides_backend.migrations.dict_migration import DictMigrationMixin
 from openslides_backend.migrations.migrate import MigrationWrapper
 from openslides_backend.models.base import model_registry
 from openslides_backend.models.checker import Checker, CheckException
 from openslides_backend.models.fields import (
-    BaseGenericRelationField,
-    BaseRelationField,
     BaseTemplateField,
-    GenericRelationField,
-    GenericRelationListField,
     RelationField,
     RelationListField,
     TemplateCharField,
@@ -33,7 +33,6 @@ from openslides_backend.shared.filters import FilterOperator, Or
 from openslides_backend.shared.interfaces.event import EventType
 from openslides_backend.shared.interfaces.write_request import WriteRequest
 from openslides_backend.shared.patterns import (
-    KEYSEPARATOR,
     collection_and_id_from_fqid,
     collection_from_fqid,
     fqid_from_collection_and_id,
@@ -41,14 +40,15 @@ from openslides_backend.shared.patterns import (
 from openslides_backend.shared.util import ONE_ORGANIZATION_FQID
 
 from ....shared.interfaces.event import Event, ListFields
+from ....shared.typing import ModelMap
 from ....shared.util import ONE_ORGANIZATION_ID
 from ...action import RelationUpdates
 from ...mixins.singular_action_mixin import SingularActionMixin
 from ...util.crypto import get_random_string
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.remap import Remapper, get_remapper
 from ...util.typing import ActionData, ActionResultElement, ActionResults
-from ..motion.update import EXTENSION_REFERENCE_IDS_PATTERN
 from ..user.user_mixin import LimitOfUserMixin, UsernameMixin
 
 
@@ -220,6 +220,8 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
             checker.run_check()
         except CheckException as ce:
             raise ActionException(str(ce))
+        finally:
+            self.logger.debug(f"Checked meeting data: {checker.format_timings()}")
         self.allowed_collections = checker.allowed_collections
 
         for entry in meeting_json.get("motion", {}).values():
@@ -373,121 +375,32 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
 
     def replace_fields(self, instance: Dict[str, Any]) -> None:
         json_data = instance["meeting"]
+        allowed_collections = tuple(self.allowed_collections)
         new_json_data = {}
+        changed_models: ModelMap = {}
         for collection in json_data:
             if collection.startswith("_"):
                 continue
             new_collection = {}
+            remappers: Dict[str, Remapper] = {}
             for entry in json_data[collection].values():
                 old_entry_id = entry["id"]
                 for field in list(entry.keys()):
-                    self.replace_field_ids(collection, entry, field)
+                    if (remapper := remappers.get(field)) is None:
+                        remapper = remappers[field] = get_remapper(
+                            collection, field, allowed_collections
+                        )
+                    remapper(entry, field, self.replace_map)
                 new_collection[str(entry["id"])] = entry
                 if collection != "user" or old_entry_id not in self.merge_user_map:
                     entry["meta_new"] = True
-                self.datastore.apply_changed_model(
-                    fqid_from_collection_and_id(collection, entry["id"]), entry
-                )
+                changed_models[
+                    fqid_from_collection_and_id(collection, entry["id"])
+                ] = entry
             new_json_data[collection] = new_collection
+        self.datastore.apply_changed_models(changed_models)
         instance["meeting"] = new_json_data
 
-    def replace_field_ids(
-        self,
-        collection: str,
-        entry: Dict[str, Any],
-        field: str,
-    ) -> None:
-        model_field = model_registry[collection]().try_get_field(field)
-        if model_field is None:
-            raise ActionException(f"{collection}/{field} is not allowed.")
-        if isinstance(model_field, BaseRelationField):
-            if isinstance(model_field, BaseGenericRelationField):
-                content_list = (
-                    content
-                    if isinstance(content := entry.get(field), list)
-                    else [content]
-                )
-                target_collections = [
-                    item.split(KEYSEPARATOR)[0] for item in content_list if item
-                ]
-            else:
-                target_collections = list(model_field.to.keys())
-            if all(c not in self.allowed_collections for c in target_collections):
-                return
-        if field == "id":
-            entry["id"] = self.replace_map[collection][entry["id"]]
-        elif collection == "meeting" and field == "user_ids":
-            entry[field] = None
-        elif collection == "user" and field == "meeting_ids":
-            entry[field] = None
-        elif collection == "motion" and field in (
-            "recommendation_extension",
-            "state_extension",
-        ):
-            if entry[field]:
-
-                def replace_fn(match: re.Match[str]) -> str:
-                    # replace the reference patterns in the extension fields with the new ids
-                    collection, id = collection_and_id_from_fqid(match.group("fqid"))
-                    new_id = self.replace_map[collection][id]
-                    return f"[{fqid_from_collection_and_id(collection, new_id)}]"
-
-                entry[field] = EXTENSION_REFERENCE_IDS_PATTERN.sub(
-                    replace_fn, entry[field]
-                )
-        else:
-            if (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.is_template_field(field)
-                and model_field.replacement_collection
-            ):
-                entry[field] = [
-                    str(self.replace_map[model_field.replacement_collection][int(id_)])
-                    for id_ in entry[field]
-                ]
-            elif (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.is_template_field(field)
-                and not model_field.replacement_collection
-            ):
-                pass
-            elif isinstance(model_field, RelationField):
-                target_collection = model_field.get_target_collection()
-                if entry[field]:
-                    entry[field] = self.replace_map[target_collection][entry[field]]
-            elif isinstance(model_field, RelationListField):
-                target_collection = model_field.get_target_collection()
-                entry[field] = [
-                    self.replace_map[target_collection][id_]
-                    for id_ in entry.get(field) or []
-                ]
-            elif isinstance(model_field, GenericRelationField):
-                if entry[field]:
-                    name, id_ = entry[field].split(KEYSEPARATOR)
-                    entry[field] = (
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-            elif isinstance(model_field, GenericRelationListField):
-                new_fqid_list = []
-                for fqid in entry[field]:
-                    name, id_ = fqid.split(KEYSEPARATOR)
-                    new_fqid_list.append(
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-                entry[field] = new_fqid_list
-            if (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.replacement_collection
-                and not model_field.is_template_field(field)
-            ):
-                replacement = model_field.get_replacement(field)
-                id_ = int(replacement)
-                new_id_ = self.replace_map[model_field.replacement_collection][id_]
-                new_field = model_field.get_structured_field_name(new_id_)
-                tmp = entry[field]
-                del entry[field]
-                entry[new_field] = tmp
-
     def update_admin_group(self, data_json: Dict[str, Any]) -> None:
         meeting = self.get_meeting_from_json(data_json)
         admin_group_id = meeting.get("admin_group_id")
@@ -504,9 +417,13 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
         self.new_group_for_request_user = admin_group_id
 
     def upload_mediadata(self) -> None:
-        for blob, id_, mimetype in self.mediadata:
-            replaced_id = self.replace_map["mediafile"][id_]
-            self.media.upload_mediafile(blob, replaced_id, mimetype)
+        if self.mediadata:
+            self.media.upload_mediafiles(
+                [
+                    (blob, self.replace_map["mediafile"][id_], mimetype)
+                    for blob, id_, mimetype in self.mediadata
+                ]
+            )
 
     def create_events(
         self, instance: Dict[str, Any], pure_create_events: bool = False
@@ -729,6 +646,9 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
         3. do the migrations
         4. get the migrated events from migration wrapper
         5. Convert only create events back to json-data
+
+        If all needed migrations are dict migrations, they are applied directly to
+        the json-data instead.
         """
         start_migration_index = instance.get("meeting", {}).pop(
             "_migration_index", None
@@ -742,7 +662,12 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
             raise ActionException(
                 f"Your data migration index '{start_migration_index}' is higher than the migration index of this backend '{backend_migration_index}'! Please, update your backend!"
             )
-        if backend_migration_index > start_migration_index:
+        migrations = get_migrations_after(start_migration_index)
+        if migrations and all(
+            isinstance(migration, DictMigrationMixin) for migration in migrations
+        ):
+            self.migrate_models(instance, cast(List[DictMigrationMixin], migrations))
+        elif backend_migration_index > start_migration_index:
             migration_wrapper = MigrationWrapper(
                 verbose=True,
                 memory_only=True,
@@ -781,6 +706,19 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, UsernameMixin):
         instance["meeting"]["_migration_index"] = backend_migration_index
         return instance
 
+    def migrate_models(
+        self, instance: Dict[str, Any], migrations: List[DictMigrationMixin]
+    ) -> None:
+        models = instance["meeting"]
+        for collection in models.values():
+            for entry in collection.values():
+                # the same as for the create events of the migration wrapper
+                for k, v in list(entry.items()):
+                    if v is None:
+                        entry.pop(k)
+        for migration in migrations:
+            migration.migrate_models(models)
+
     def create_instance_from_migrated_events(
         self, instance: Dict[str, Any], migrated_events: List[BaseEvent]
     ) -> Dict[str, Any]:
@@ -64,11 +64,13 @@ class MotionStateCreateAction(WeightMixin, CreateActionWithInferredMeeting):
                 )
 
         # set weight to max+1 if not set
+        filter = And(
+            FilterOperator("meeting_id", "=", workflow["meeting_id"]),
+            FilterOperator("workflow_id", "=", workflow["id"]),
+        )
         if "weight" not in instance:
-            filter = And(
-                FilterOperator("meeting_id", "=", workflow["meeting_id"]),
-                FilterOperator("workflow_id", "=", workflow["id"]),
-            )
-            instance["weight"] = self.get_weight(filter)
+            instance["weight"] = self.allocate_weight(filter)
+        else:
+            self.reserve_weight(instance["weight"], filter)
 
         return instance
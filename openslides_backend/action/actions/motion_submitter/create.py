@@ -60,10 +60,12 @@ class MotionSubmitterCreateAction(
         exists = self.datastore.exists(collection=self.model.collection, filter=filter)
         if exists:
             raise ActionException("(user_id, motion_id) must be unique.")
+        filter = And(
+            FilterOperator("meeting_id", "=", instance["meeting_id"]),
+            FilterOperator("motion_id", "=", instance["motion_id"]),
+        )
         if instance.get("weight") is None:
-            filter = And(
-                FilterOperator("meeting_id", "=", instance["meeting_id"]),
-                FilterOperator("motion_id", "=", instance["motion_id"]),
-            )
-            instance["weight"] = self.get_weight(filter)
+            instance["weight"] = self.allocate_weight(filter)
+        else:
+            self.reserve_weight(instance["weight"], filter)
         return instance
@@ -3,7 +3,6 @@ from typing import Any, Callable, Dict
 from openslides_backend.action.mixins.extend_history_mixin import ExtendHistoryMixin
 
 from ....models.models import Poll
-from ....services.datastore.commands import GetManyRequest
 from ....shared.exceptions import ActionException, VoteServiceException
 from ....shared.patterns import fqid_from_collection_and_id
 from ...generics.update import UpdateAction
@@ -29,52 +28,25 @@ class PollStopAction(
     schema = DefaultSchema(Poll()).get_update_schema()
     poll_history_information = "stopped"
     extend_history_to = "content_object_id"
-
-    def prefetch(self, action_data: ActionData) -> None:
-        result = self.datastore.get_many(
-            [
-                GetManyRequest(
-                    "poll",
-                    list({instance["id"] for instance in action_data}),
-                    [
-                        "content_object_id",
-                        "meeting_id",
-                        "state",
-                        "voted_ids",
-                        "pollmethod",
-                        "global_option_id",
-                        "entitled_group_ids",
-                    ],
-                ),
-            ],
-            use_changed_models=False,
-        )
-        polls = result["poll"].values()
-        meeting_ids = list({poll["meeting_id"] for poll in polls})
-        requests = [
-            GetManyRequest(
-                "meeting",
-                meeting_ids,
-                [
-                    "poll_couple_countdown",
-                    "poll_countdown_id",
-                    "users_enable_vote_weight",
-                    "vote_ids",
-                ],
-            ),
-            GetManyRequest(
-                "group",
-                list(
-                    {
-                        group_id
-                        for poll in polls
-                        for group_id in poll.get("entitled_group_ids", [])
-                    }
-                ),
-                ["user_ids"],
-            ),
-        ]
-        self.datastore.get_many(requests, use_changed_models=False)
+    prefetch_spec = {
+        "id": [
+            "content_object_id",
+            "meeting_id",
+            "state",
+            "voted_ids",
+            "pollmethod",
+            "global_option_id",
+            "entitled_group_ids",
+        ],
+        "id.meeting_id": [
+            "poll_couple_countdown",
+            "poll_countdown_id",
+            "users_enable_vote_weight",
+            "vote_ids",
+        ],
+        "id.entitled_group_ids": ["user_ids"],
+    }
+    prefetch_use_changed_models = False
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         poll = self.datastore.get(
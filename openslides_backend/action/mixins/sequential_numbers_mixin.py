@@ -15,18 +15,15 @@ class SequentialNumbersMixin(CreateAction):
 
     def get_sequential_number(self, meeting_id: int) -> int:
         """
-        Creates a sequential number, unique per meeting and returns it
+        Creates a sequential number, unique per meeting and returns it. The current
+        maximum is only fetched once per meeting and action.
         """
-        filter = FilterOperator("meeting_id", "=", meeting_id)
-
-        number = self.datastore.max(
-            collection=self.model.collection,
-            filter=filter,
-            field="sequential_number",
-            get_deleted_models=DeletedModelsBehaviour.ALL_MODELS,
+        return self.number_allocator.allocate(
+            self.model.collection,
+            FilterOperator("meeting_id", "=", meeting_id),
+            "sequential_number",
+            DeletedModelsBehaviour.ALL_MODELS,
         )
-        number = 1 if number is None else number + 1
-        return number
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         instance = super().update_instance(instance)
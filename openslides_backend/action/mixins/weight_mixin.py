@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from ...shared.filters import Filter, FilterOperator
 from ...shared.patterns import Collection
@@ -12,9 +12,38 @@ class WeightMixin(Action):
         """
         Returns the current maximum weight + 1.
         """
+        collection, filter = self.get_weight_filter(filter, collection)
+        weight = self.datastore.max(collection, filter, "weight")
+        return (weight or 0) + 1
+
+    def allocate_weight(
+        self, filter: Union[int, Filter], collection: Optional[Collection] = None
+    ) -> int:
+        """
+        Returns the current maximum weight + 1 like get_weight, but only fetches the
+        maximum once per filter and action. Use this only if all models matching the
+        filter are created by the action itself.
+        """
+        collection, filter = self.get_weight_filter(filter, collection)
+        return self.number_allocator.allocate(collection, filter, "weight")
+
+    def reserve_weight(
+        self,
+        weight: int,
+        filter: Union[int, Filter],
+        collection: Optional[Collection] = None,
+    ) -> None:
+        """
+        Marks an explicitly given weight as used for allocate_weight.
+        """
+        collection, filter = self.get_weight_filter(filter, collection)
+        self.number_allocator.reserve(collection, filter, "weight", weight)
+
+    def get_weight_filter(
+        self, filter: Union[int, Filter], collection: Optional[Collection]
+    ) -> Tuple[Collection, Filter]:
         if not collection:
             collection = self.model.collection
         if isinstance(filter, int):
             filter = FilterOperator("meeting_id", "=", filter)
-        weight = self.datastore.max(collection, filter, "weight")
-        return (weight or 0) + 1
+        return collection, filter
@@ -1,16 +1,22 @@
-from typing import Any, Dict, List, cast
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple, cast
 
 from ...models.base import Model, model_registry
 from ...models.fields import BaseRelationField, BaseTemplateField, Field
+from ...services.datastore.commands import GetManyRequest
 from ...services.datastore.interface import DatastoreService
 from ...shared.exceptions import ActionException, DatastoreException
 from ...shared.patterns import (
+    Collection,
     FullQualifiedField,
+    FullQualifiedId,
     collection_from_fqfield,
+    collection_from_fqid,
     field_from_fqfield,
     fqid_from_collection_and_id,
     fqid_from_fqfield,
     id_from_fqfield,
+    id_from_fqid,
     transform_to_fqids,
 )
 from ..util.assert_belongs_to_meeting import assert_belongs_to_meeting
@@ -34,6 +40,112 @@ class RelationManager:
         self.datastore = datastore
         self.relation_field_updates = {}
 
+    def prefetch_relations(
+        self, model: Model, instances: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Fetches the current values of the relation fields of all given instances and
+        the reverse fields of all models whose relation will change. One get_many
+        request per collection and side is issued, so that the following calls of
+        get_relation_updates are served from the cache of the datastore.
+        Relations with a structured reverse field are not prefetched.
+        """
+        relations: List[Tuple[FullQualifiedId, str, BaseRelationField, Any]] = []
+        for instance in instances:
+            if "id" not in instance:
+                continue
+            fqid = fqid_from_collection_and_id(model.collection, instance["id"])
+            for field_name, field, value in self.get_relation_field_values(
+                model, instance
+            ):
+                relations.append((fqid, field_name, field, value))
+        if not relations:
+            return
+
+        # fetch the current values of all relation fields which exist in the db
+        current_fields: Dict[FullQualifiedId, Set[str]] = defaultdict(set)
+        for fqid, field_name, _, _ in relations:
+            if not self.datastore.is_new(fqid):
+                current_fields[fqid].add(field_name)
+        current_models = (
+            self.get_many_per_collection(current_fields, use_changed_models=False)
+            if current_fields
+            else {}
+        )
+
+        # fetch the reverse fields of all added and removed models
+        reverse_fields: Dict[FullQualifiedId, Set[str]] = defaultdict(set)
+        for fqid, field_name, field, value in relations:
+            current_value = (
+                current_models.get(model.collection, {})
+                .get(id_from_fqid(fqid), {})
+                .get(field_name)
+            )
+            target_collection = field.get_target_collection()
+            changed_fqids = set(transform_to_fqids(value, target_collection)) ^ set(
+                transform_to_fqids(current_value, target_collection)
+            )
+            for changed_fqid in changed_fqids:
+                collection = collection_from_fqid(changed_fqid)
+                if (
+                    collection in field.to
+                    and not self.datastore.is_new(changed_fqid)
+                    and not self.datastore.is_deleted(changed_fqid)
+                ):
+                    reverse_fields[changed_fqid].add(field.to[collection])
+        if reverse_fields:
+            self.get_many_per_collection(reverse_fields)
+
+    def get_relation_field_values(
+        self, model: Model, instance: Dict[str, Any]
+    ) -> Iterable[Tuple[str, BaseRelationField, Any]]:
+        """
+        Yields all relation fields of the instance with their new values. Template
+        fields are resolved to their structured fields.
+        """
+        for field_name, value in instance.items():
+            field = model.try_get_field(field_name)
+            if not isinstance(field, BaseRelationField) or any(
+                isinstance(
+                    model_registry[collection]().try_get_field(related_name),
+                    BaseTemplateField,
+                )
+                for collection, related_name in field.to.items()
+            ):
+                continue
+            if isinstance(field, BaseTemplateField) and field.is_template_field(
+                field_name
+            ):
+                if isinstance(value, dict):
+                    for replacement, structured_value in value.items():
+                        yield (
+                            field.get_structured_field_name(replacement),
+                            field,
+                            structured_value,
+                        )
+            else:
+                yield (field_name, field, value)
+
+    def get_many_per_collection(
+        self,
+        fields_per_fqid: Dict[FullQualifiedId, Set[str]],
+        use_changed_models: bool = True,
+    ) -> Dict[Collection, Dict[int, Dict[str, Any]]]:
+        requests: Dict[Collection, Tuple[List[int], Set[str]]] = {}
+        for fqid, fields in fields_per_fqid.items():
+            ids, mapped_fields = requests.setdefault(
+                collection_from_fqid(fqid), ([], set())
+            )
+            ids.append(id_from_fqid(fqid))
+            mapped_fields.update(fields)
+        return self.datastore.get_many(
+            [
+                GetManyRequest(collection, ids, mapped_fields)
+                for collection, (ids, mapped_fields) in requests.items()
+            ],
+            use_changed_models=use_changed_models,
+        )
+
     def get_relation_updates(
         self,
         model: Model,
@@ -1,8 +1,6 @@
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
-from datastore.shared.util import DeletedModelsBehaviour
-
 from ...models.base import model_registry
 from ...models.fields import (
     BaseGenericRelationField,
@@ -144,13 +142,20 @@ class SingleRelationHandler:
 
             # acquire all related models with the related fields
             rels: Dict[FullQualifiedId, PartialModel] = defaultdict(dict)
+            related_models = self.datastore.get_many(
+                [
+                    GetManyRequest(
+                        collection,
+                        [
+                            id_from_fqid(fqid)
+                            for fqid in changed_fqids_per_collection[collection]
+                        ],
+                        [related_name],
+                    )
+                ]
+            ).get(collection, {})
             for fqid in changed_fqids_per_collection[collection]:
-                related_model = self.datastore.get(
-                    fqid,
-                    [related_name],
-                    get_deleted_models=DeletedModelsBehaviour.NO_DELETED,
-                    raise_exception=False,
-                )
+                related_model = related_models.get(id_from_fqid(fqid), {})
                 # again, we transform everything to lists of fqids
                 rels[fqid][related_name] = transform_to_fqids(
                     related_model.get(related_name), self.model.collection
@@ -0,0 +1,56 @@
+from typing import Dict, Tuple
+
+from datastore.shared.util import DeletedModelsBehaviour
+
+from ...services.datastore.interface import DatastoreService
+from ...shared.filters import Filter
+from ...shared.patterns import Collection
+
+
+class NumberAllocator:
+    """
+    Hands out consecutive numbers above the current maximum of a field. The maximum
+    is only queried once per collection, field and filter; all further numbers are
+    counted up in memory. The query locks the filtered collection field, so that
+    concurrent writes are still detected by the datastore.
+
+    This is only correct as long as all models matching the filter which are
+    created in the meantime get their number from the same allocator, which is the
+    case for sequential numbers and weights of the instances of a single action.
+    """
+
+    def __init__(self, datastore: DatastoreService) -> None:
+        self.datastore = datastore
+        self.numbers: Dict[Tuple[Collection, str, Filter], int] = {}
+
+    def allocate(
+        self,
+        collection: Collection,
+        filter: Filter,
+        field: str,
+        get_deleted_models: DeletedModelsBehaviour = DeletedModelsBehaviour.NO_DELETED,
+    ) -> int:
+        key = (collection, field, filter)
+        if key in self.numbers:
+            number = self.numbers[key] + 1
+        else:
+            max_number = self.datastore.max(
+                collection=collection,
+                filter=filter,
+                field=field,
+                get_deleted_models=get_deleted_models,
+            )
+            number = (max_number or 0) + 1
+        self.numbers[key] = number
+        return number
+
+    def reserve(
+        self, collection: Collection, filter: Filter, field: str, number: int
+    ) -> None:
+        """
+        Registers a number which was set explicitly, so that it is not handed out
+        again.
+        """
+        key = (collection, field, filter)
+        if key in self.numbers and self.numbers[key] < number:
+            self.numbers[key] = number
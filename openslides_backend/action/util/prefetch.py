@@ -0,0 +1,102 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from ...models.base import model_registry
+from ...models.fields import BaseGenericRelationField, BaseRelationField
+from ...services.datastore.commands import GetManyRequest
+from ...services.datastore.interface import DatastoreService, PartialModel
+from ...shared.patterns import FQID_PATTERN, Collection, collection_and_id_from_fqid
+
+# Maps relation paths to the fields which should be fetched from the models at the
+# end of the path. A path is a dot-separated chain of relation fields starting at
+# the instances of the action data, e.g. "meeting_id.default_group_id". The special
+# field "id" refers to the model of the action itself.
+PrefetchSpec = Dict[str, List[str]]
+
+Path = Tuple[str, ...]
+ModelReference = Tuple[Collection, int]
+
+
+def prefetch(
+    datastore: DatastoreService,
+    collection: Collection,
+    action_data: Iterable[Dict[str, Any]],
+    prefetch_spec: PrefetchSpec,
+    use_changed_models: bool = True,
+) -> None:
+    """
+    Resolves the given prefetch spec level by level. All models of one level are
+    fetched with a single get_many request, so the number of requests only depends
+    on the length of the longest path and not on the number of instances.
+    use_changed_models is passed to every get_many request.
+    """
+    fields_per_path: Dict[Path, Set[str]] = defaultdict(set)
+    for path_str, spec_fields in prefetch_spec.items():
+        path = tuple(path_str.split("."))
+        fields_per_path[path].update(spec_fields)
+        # all intermediate models must provide the relation field for the next hop
+        for i in range(1, len(path)):
+            fields_per_path[path[:i]].add(path[i])
+
+    models_per_path: Dict[Path, List[Tuple[Collection, PartialModel]]] = {
+        (): [(collection, instance) for instance in action_data]
+    }
+    max_depth = max((len(path) for path in fields_per_path), default=0)
+    for depth in range(1, max_depth + 1):
+        paths = [path for path in fields_per_path if len(path) == depth]
+        references_per_path: Dict[Path, Set[ModelReference]] = {}
+        requested: Dict[Collection, Tuple[Set[int], Set[str]]] = {}
+        for path in paths:
+            references = references_per_path[path] = set()
+            for parent_collection, parent in models_per_path.get(path[:-1], []):
+                references.update(get_references(parent_collection, parent, path[-1]))
+            for target_collection, id in references:
+                ids, mapped_fields = requested.setdefault(
+                    target_collection, (set(), set())
+                )
+                ids.add(id)
+                mapped_fields.update(fields_per_path[path])
+        if not requested:
+            break
+        result = datastore.get_many(
+            [
+                GetManyRequest(target_collection, list(ids), mapped_fields)
+                for target_collection, (ids, mapped_fields) in requested.items()
+            ],
+            use_changed_models=use_changed_models,
+        )
+        for path, references in references_per_path.items():
+            models_per_path[path] = [
+                (target_collection, result[target_collection][id])
+                for target_collection, id in references
+                if id in result.get(target_collection, {})
+            ]
+
+
+def get_references(
+    collection: Collection, model: PartialModel, field_name: str
+) -> Iterable[ModelReference]:
+    """
+    Yields the collection and id of all models referenced by the given field.
+    Malformed values are skipped since the action data is not validated yet.
+    """
+    value = model.get(field_name)
+    if value is None:
+        return
+    if field_name == "id":
+        if isinstance(value, int):
+            yield (collection, value)
+        return
+    field = model_registry[collection]().get_field(field_name)
+    if not isinstance(field, BaseRelationField):
+        raise ValueError(f"Field {collection}/{field_name} is no relation field.")
+    values = value if isinstance(value, list) else [value]
+    if isinstance(field, BaseGenericRelationField):
+        for fqid in values:
+            if isinstance(fqid, str) and FQID_PATTERN.match(fqid):
+                yield collection_and_id_from_fqid(fqid)
+    else:
+        target_collection = field.get_target_collection()
+        for id in values:
+            if isinstance(id, int):
+                yield (target_collection, id)
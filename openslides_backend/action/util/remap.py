@@ -0,0 +1,207 @@
+from functools import lru_cache
+from re import Match
+from typing import Any, Callable, Dict, Tuple
+
+from ...models.base import model_registry
+from ...models.fields import (
+    BaseGenericRelationField,
+    BaseRelationField,
+    BaseTemplateField,
+    Field,
+    GenericRelationField,
+    GenericRelationListField,
+    RelationField,
+    RelationListField,
+)
+from ...shared.exceptions import ActionException
+from ...shared.patterns import (
+    EXTENSION_REFERENCE_IDS_PATTERN,
+    KEYSEPARATOR,
+    Collection,
+    collection_and_id_from_fqid,
+    fqid_from_collection_and_id,
+)
+
+REMAPPER_CACHE_SIZE = 4096
+
+# Maps the old ids of each collection to the new ones.
+ReplaceMap = Dict[Collection, Dict[int, int]]
+
+# Replaces the ids in the given field of the given entry in place.
+Remapper = Callable[[Dict[str, Any], str, ReplaceMap], None]
+
+
+@lru_cache(maxsize=REMAPPER_CACHE_SIZE)
+def get_remapper(
+    collection: Collection, field: str, allowed_collections: Tuple[Collection, ...]
+) -> Remapper:
+    """
+    Returns the remapper for the given field of the given collection. All decisions
+    which only depend on the model metadata are made once here, so that the returned
+    remapper only has to handle the value. Relations to collections which are not
+    in allowed_collections are left untouched.
+    """
+    model_field = model_registry[collection]().try_get_field(field)
+    if model_field is None:
+        raise ActionException(f"{collection}/{field} is not allowed.")
+    if isinstance(model_field, BaseGenericRelationField):
+        # the target collections of generic relations are only known from the value
+        return guard_generic_targets(
+            get_field_remapper(collection, field, model_field), allowed_collections
+        )
+    if isinstance(model_field, BaseRelationField) and all(
+        c not in allowed_collections for c in model_field.to
+    ):
+        return keep
+    return get_field_remapper(collection, field, model_field)
+
+
+def get_field_remapper(
+    collection: Collection, field: str, model_field: Field
+) -> Remapper:
+    if field == "id":
+        return remap_id(collection)
+    if (collection, field) in (("meeting", "user_ids"), ("user", "meeting_ids")):
+        return clear
+    if collection == "motion" and field in (
+        "recommendation_extension",
+        "state_extension",
+    ):
+        return remap_extension
+    if isinstance(model_field, BaseTemplateField) and model_field.is_template_field(
+        field
+    ):
+        if model_field.replacement_collection:
+            return remap_template(model_field.replacement_collection)
+        return keep
+    if isinstance(model_field, RelationField):
+        remapper = remap_relation(model_field.get_target_collection())
+    elif isinstance(model_field, RelationListField):
+        remapper = remap_relation_list(model_field.get_target_collection())
+    elif isinstance(model_field, GenericRelationField):
+        remapper = remap_generic_relation
+    elif isinstance(model_field, GenericRelationListField):
+        remapper = remap_generic_relation_list
+    else:
+        remapper = keep
+    if (
+        isinstance(model_field, BaseTemplateField)
+        and model_field.replacement_collection
+    ):
+        return rename_structured(
+            remapper,
+            model_field,
+            model_field.replacement_collection,
+            int(model_field.get_replacement(field)),
+        )
+    return remapper
+
+
+def keep(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+    pass
+
+
+def clear(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+    entry[field] = None
+
+
+def remap_id(collection: Collection) -> Remapper:
+    def remapper(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        entry[field] = replace_map[collection][entry[field]]
+
+    return remapper
+
+
+def remap_relation(target_collection: Collection) -> Remapper:
+    def remapper(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        if entry[field]:
+            entry[field] = replace_map[target_collection][entry[field]]
+
+    return remapper
+
+
+def remap_relation_list(target_collection: Collection) -> Remapper:
+    def remapper(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        ids = replace_map[target_collection]
+        entry[field] = [ids[id_] for id_ in entry.get(field) or []]
+
+    return remapper
+
+
+def remap_template(replacement_collection: Collection) -> Remapper:
+    def remapper(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        ids = replace_map[replacement_collection]
+        entry[field] = [str(ids[int(id_)]) for id_ in entry[field]]
+
+    return remapper
+
+
+def remap_fqid(fqid: str, replace_map: ReplaceMap) -> str:
+    name, id_ = fqid.split(KEYSEPARATOR)
+    return name + KEYSEPARATOR + str(replace_map[name][int(id_)])
+
+
+def remap_generic_relation(
+    entry: Dict[str, Any], field: str, replace_map: ReplaceMap
+) -> None:
+    if entry[field]:
+        entry[field] = remap_fqid(entry[field], replace_map)
+
+
+def remap_generic_relation_list(
+    entry: Dict[str, Any], field: str, replace_map: ReplaceMap
+) -> None:
+    entry[field] = [remap_fqid(fqid, replace_map) for fqid in entry[field]]
+
+
+def remap_extension(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+    if not entry[field]:
+        return
+
+    def replace_fn(match: Match[str]) -> str:
+        # replace the reference patterns in the extension fields with the new ids
+        collection, id = collection_and_id_from_fqid(match.group("fqid"))
+        new_id = replace_map[collection][id]
+        return f"[{fqid_from_collection_and_id(collection, new_id)}]"
+
+    entry[field] = EXTENSION_REFERENCE_IDS_PATTERN.sub(replace_fn, entry[field])
+
+
+def guard_generic_targets(
+    remapper: Remapper, allowed_collections: Tuple[Collection, ...]
+) -> Remapper:
+    """
+    Only calls the given remapper if the value references at least one model of the
+    allowed collections.
+    """
+
+    def guarded(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        content = entry.get(field)
+        content_list = content if isinstance(content, list) else [content]
+        if any(
+            item.split(KEYSEPARATOR)[0] in allowed_collections
+            for item in content_list
+            if item
+        ):
+            remapper(entry, field, replace_map)
+
+    return guarded
+
+
+def rename_structured(
+    remapper: Remapper,
+    model_field: BaseTemplateField,
+    replacement_collection: Collection,
+    replacement: int,
+) -> Remapper:
+    """
+    Calls the given remapper and moves the value to the structured field of the new
+    id of the replacement.
+    """
+
+    def renamed(entry: Dict[str, Any], field: str, replace_map: ReplaceMap) -> None:
+        remapper(entry, field, replace_map)
+        new_id = replace_map[replacement_collection][replacement]
+        entry[model_field.get_structured_field_name(new_id)] = entry.pop(field)
+
+    return renamed
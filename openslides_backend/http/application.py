@@ -1,12 +1,14 @@
+import threading
 from typing import Any, Iterable, Union
 
-import simplejson as json
 from werkzeug.wrappers import Response
 
 from ..services.auth.adapter import AUTHENTICATION_HEADER
+from ..shared import json_codec
 from ..shared.env import is_truthy
 from ..shared.exceptions import ViewException
-from ..shared.interfaces.wsgi import StartResponse, WSGIEnvironment
+from ..shared.interfaces.wsgi import StartResponse, View, WSGIEnvironment
+from ..shared.json_stream import contains_stream, iter_encode
 from .http_exceptions import (
     BadRequest,
     Forbidden,
@@ -31,6 +33,8 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug("Initialize OpenSlides Backend WSGI application.")
         self.view = view
         self.services = services
+        # view instances are reused by the thread which handles the request
+        self.local = threading.local()
 
     def dispatch_request(self, request: Request) -> Union[Response, HTTPException]:
         """
@@ -39,7 +43,7 @@ class OpenSlidesBackendWSGIApplication:
         applications themselves.
         """
         # Dispatch view and return response.
-        view_instance = self.view(self.env, self.logging, self.services)
+        view_instance = self.get_view()
         try:
             response_body, access_token = view_instance.dispatch(request)
         except ViewException as exception:
@@ -73,8 +77,14 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug(
             f"All done. Application sends HTTP {status_code} with body {response_body}."
         )
+        if contains_stream(response_body):
+            # streamed results are encoded while the response is sent, so errors
+            # can only be reported in the body
+            body: Any = iter_encode(response_body, self.handle_stream_error)
+        else:
+            body = json_codec.dumps(response_body)
         response = Response(
-            json.dumps(response_body),
+            body,
             status=status_code,
             content_type="application/json",
         )
@@ -82,6 +92,19 @@ class OpenSlidesBackendWSGIApplication:
             response.headers[AUTHENTICATION_HEADER] = access_token
         return response
 
+    def handle_stream_error(self, exception: Exception) -> str:
+        self.logger.exception("Streaming the response failed.")
+        if isinstance(exception, ViewException):
+            return exception.message
+        return "Streaming the response failed."
+
+    def get_view(self) -> View:
+        view_instance = getattr(self.local, "view", None)
+        if view_instance is None:
+            view_instance = self.view(self.env, self.logging, self.services)
+            self.local.view = view_instance
+        return view_instance
+
     def wsgi_application(
         self, environ: WSGIEnvironment, start_response: StartResponse
     ) -> Iterable[bytes]:
@@ -2,6 +2,7 @@ from typing import Any
 
 from werkzeug.wrappers import Request as WerkzeugRequest
 
+from ..shared import json_codec
 from .http_exceptions import BadRequest
 
 
@@ -10,6 +11,8 @@ class Request(WerkzeugRequest):
     Customized request object to make sure a value is returned by json().
     """
 
+    json_module = json_codec
+
     @property
     def json(self) -> Any:
         if json := self.get_json():
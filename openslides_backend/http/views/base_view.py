@@ -1,6 +1,7 @@
 import inspect
 import re
-from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from werkzeug.exceptions import BadRequest as WerkzeugBadRequest
 
@@ -16,6 +17,7 @@ from ..request import Request
 ROUTE_OPTIONS_ATTR = "__route_options"
 
 RouteFunction = Callable[[Any, Request], Tuple[ResponseBody, Optional[str]]]
+RouteOptions = Dict[str, Any]
 
 
 def route(
@@ -56,21 +58,60 @@ def route(
     return wrapper
 
 
+class RouteTable:
+    """
+    Routes of a view class. Routes are looked up by their exact path, the regular
+    expressions are only matched if no path matches.
+    """
+
+    def __init__(self, view_class: Type["BaseView"]) -> None:
+        self.paths: Dict[str, RouteOptions] = {}
+        self.patterns: List[RouteOptions] = []
+        functions = inspect.getmembers(
+            view_class,
+            predicate=lambda attr: inspect.isfunction(attr)
+            and hasattr(attr, ROUTE_OPTIONS_ATTR),
+        )
+        for _, func in functions:
+            for route_options in getattr(func, ROUTE_OPTIONS_ATTR):
+                self.patterns.append({**route_options, "function": func})
+        for route_options in self.patterns:
+            for path in (route_options["raw_path"], route_options["raw_path"] + "/"):
+                # the first matching route wins, as if all were matched in order
+                if (first_route_options := self.match(path)) is not None:
+                    self.paths.setdefault(path, first_route_options)
+
+    def get(self, path: str) -> Optional[RouteOptions]:
+        if (route_options := self.paths.get(path)) is not None:
+            return route_options
+        return self.match(path)
+
+    def match(self, path: str) -> Optional[RouteOptions]:
+        for route_options in self.patterns:
+            if route_options["path"].match(path):
+                return route_options
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_route_table(view_class: Type["BaseView"]) -> RouteTable:
+    return RouteTable(view_class)
+
+
 class BaseView(View):
     """
     Base class for views of this service.
 
-    During initialization we bind the dependencies to the instance.
+    During initialization we bind the dependencies to the instance. Instances do
+    not hold any state of a request, so they may be reused for further requests.
     """
 
-    routes: Dict[Pattern, Callable[[Request], Tuple[ResponseBody, Optional[str]]]]
-
     def __init__(self, env: Env, logging: LoggingModule, services: Services) -> None:
         self.services = services
         self.env = env
         self.logging = logging
         self.logger = logging.getLogger(__name__)
-        self.routes = {}
+        self.route_table = get_route_table(type(self))
 
     def get_user_id_from_headers(
         self, headers: Headers, cookies: Dict
@@ -85,34 +126,25 @@ class BaseView(View):
         return user_id, access_token
 
     def dispatch(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
-        functions = inspect.getmembers(
-            self,
-            predicate=lambda attr: inspect.ismethod(attr)
-            and hasattr(attr, ROUTE_OPTIONS_ATTR),
-        )
         with make_span(self.env, "base view"):
-            for _, func in functions:
-                route_options_list = getattr(func, ROUTE_OPTIONS_ATTR)
-                for route_options in route_options_list:
-                    if route_options["path"].match(request.environ["RAW_URI"]):
-                        # Check request method
-                        if request.method != route_options["method"]:
-                            raise MethodNotAllowed(
-                                valid_methods=[route_options["method"]]
-                            )
-                        self.logger.debug(f"Request method is {request.method}.")
-
-                        if route_options["json"]:
-                            # Check mimetype and parse JSON body. The result is cached in request.json
-                            if not request.is_json:
-                                raise View400Exception(
-                                    "Wrong media type. Use 'Content-Type: application/json' instead."
-                                )
-                            try:
-                                request_body = request.get_json()
-                            except WerkzeugBadRequest as exception:
-                                raise View400Exception(exception.description)
-                            self.logger.debug(f"Request contains JSON: {request_body}.")
-
-                        return func(request)
-            raise NotFound()
+            route_options = self.route_table.get(request.environ["RAW_URI"])
+            if route_options is None:
+                raise NotFound()
+            # Check request method
+            if request.method != route_options["method"]:
+                raise MethodNotAllowed(valid_methods=[route_options["method"]])
+            self.logger.debug(f"Request method is {request.method}.")
+
+            if route_options["json"]:
+                # Check mimetype and parse JSON body. The result is cached in request.json
+                if not request.is_json:
+                    raise View400Exception(
+                        "Wrong media type. Use 'Content-Type: application/json' instead."
+                    )
+                try:
+                    request_body = request.get_json()
+                except WerkzeugBadRequest as exception:
+                    raise View400Exception(exception.description)
+                self.logger.debug(f"Request contains JSON: {request_body}.")
+
+            return route_options["function"](self, request)
@@ -0,0 +1,91 @@
+import mmap
+import struct
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Union
+
+from babel.messages.mofile import write_mo
+from babel.messages.pofile import read_po
+
+MESSAGES_PATH = Path(__file__).parent / "messages"
+
+# magic number of gnu mo files
+MO_MAGIC = 0x950412DE
+
+
+class MessageCatalog:
+    """
+    Translations of one language in the binary gnu mo format. The compiled file is
+    memory mapped, so that only the looked up pages are read and they are shared
+    between all processes. The messages in mo files are sorted, so they are looked
+    up by binary search without building any index.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        self.buffer = buffer
+        for byte_order in ("<", ">"):
+            if struct.unpack_from(f"{byte_order}I", buffer)[0] == MO_MAGIC:
+                break
+        else:
+            raise ValueError("Invalid mo file.")
+        self.entry_format = f"{byte_order}2I"
+        self.size, self.key_start, self.value_start = struct.unpack_from(
+            f"{byte_order}3I", buffer, 8
+        )
+
+    @classmethod
+    def load(cls, language: str) -> "MessageCatalog":
+        """
+        Maps the compiled catalog of the language. If it was not compiled or the po
+        file was changed since, the po file is compiled in memory instead.
+        """
+        po_file = MESSAGES_PATH / f"{language}.po"
+        mo_file = MESSAGES_PATH / f"{language}.mo"
+        if mo_file.exists() and mo_file.stat().st_mtime >= po_file.stat().st_mtime:
+            with mo_file.open("rb") as f:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return cls(compile_catalog(po_file))
+
+    def get(self, msg: str) -> Optional[str]:
+        key = msg.encode()
+        if not key:
+            # the empty message is the header of the catalog
+            return None
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            length, offset = struct.unpack_from(
+                self.entry_format, self.buffer, self.key_start + middle * 8
+            )
+            current = self.buffer[offset : offset + length]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                length, offset = struct.unpack_from(
+                    self.entry_format, self.buffer, self.value_start + middle * 8
+                )
+                return self.buffer[offset : offset + length].decode()
+        return None
+
+
+def compile_catalog(po_file: Path) -> bytes:
+    with po_file.open("r") as f:
+        catalog = read_po(f)
+    mo = BytesIO()
+    # fuzzy translations are used as well
+    write_mo(mo, catalog, use_fuzzy=True)
+    return mo.getvalue()
+
+
+def compile_catalogs() -> None:
+    """
+    Compiles the po files of all languages into mo files next to them.
+    """
+    for po_file in MESSAGES_PATH.glob("*.po"):
+        po_file.with_suffix(".mo").write_bytes(compile_catalog(po_file))
+
+
+if __name__ == "__main__":
+    compile_catalogs()
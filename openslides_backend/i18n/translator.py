@@ -1,30 +1,35 @@
-from pathlib import Path
+from contextvars import ContextVar
 from typing import Dict, List, Optional
 
-from babel.messages.catalog import Catalog
-from babel.messages.pofile import read_po
+from .catalog import MESSAGES_PATH, MessageCatalog
 
 DEFAULT_LANGUAGE = "en"
 
+# The language of the current request. Each thread has its own context, so
+# concurrent requests do not interfere.
+current_language: ContextVar[str] = ContextVar(
+    "current_language", default=DEFAULT_LANGUAGE
+)
+
 
 class _Translator:
-    translations: Dict[str, Catalog] = {}
-    current_language: str
+    translations: Dict[str, Optional[MessageCatalog]] = {}
 
     def __init__(self) -> None:
-        # read all po files at startup
-        path = Path(__file__).parent / "messages"
-        for file in path.glob("*.po"):
-            with file.open("r") as f:
-                self.translations[file.stem] = read_po(f)
-        # empty catalog for en since it is not used anyway
-        self.translations[DEFAULT_LANGUAGE] = Catalog()
-        self.current_language = DEFAULT_LANGUAGE
+        # map all compiled catalogs at startup
+        for file in MESSAGES_PATH.glob("*.po"):
+            self.translations[file.stem] = MessageCatalog.load(file.stem)
+        # no catalog for en since it is not used anyway
+        self.translations[DEFAULT_LANGUAGE] = None
+
+    @property
+    def current_language(self) -> str:
+        return current_language.get()
 
     def translate(self, msg: str) -> str:
-        translation = self.translations[self.current_language].get(msg)
-        if translation:
-            return translation.string
+        catalog = self.translations[current_language.get()]
+        if catalog and (translation := catalog.get(msg)):
+            return translation
         else:
             return msg
 
@@ -34,10 +39,10 @@ class _Translator:
             langs = self.parse_language_header(lang_header)
         for lang in langs:
             if lang in self.translations:
-                self.current_language = lang
+                current_language.set(lang)
                 break
         else:
-            self.current_language = DEFAULT_LANGUAGE
+            current_language.set(DEFAULT_LANGUAGE)
 
     def parse_language_header(self, lang_header: str) -> List[str]:
         # each language is separated by a comma
@@ -6,17 +6,28 @@ import sys
 import time
 from typing import Any
 
-from datastore.reader.app import register_services
-from gunicorn.app.base import BaseApplication
-
-from .action.action_worker import gunicorn_post_request, gunicorn_worker_abort
 from .shared.env import Environment
-from .shared.interfaces.logging import LoggingModule
-from .shared.interfaces.wsgi import WSGIApplication
-from .shared.otel import init as otel_init
-from .shared.otel import instrument_requests as otel_instrument_requests
+from .shared.startup_profiler import StartupBudgetExceeded, StartupProfiler
+
+# The profiler is started before all other imports of the backend. It is stopped
+# before the workers are forked and started again by every worker in load.
+startup_profiler = StartupProfiler(Environment(os.environ).is_startup_profile_enabled())
+startup_profiler.start()
+
+with startup_profiler.phase("import"):
+    from datastore.reader.app import register_services
+    from gunicorn.app.base import BaseApplication
+
+    from .action.action_worker import gunicorn_post_request, gunicorn_worker_abort
+    from .shared.interfaces.logging import LoggingModule
+    from .shared.interfaces.wsgi import WSGIApplication
+    from .shared.otel import init as otel_init
+    from .shared.otel import instrument_requests as otel_instrument_requests
 
-register_services()
+with startup_profiler.phase("register_services"):
+    register_services()
+
+startup_profiler.stop()
 
 # ATTENTION: We use the Python builtin logging module. To change this use
 # something like "import custom_logging as logging".
@@ -73,15 +84,38 @@ class OpenSlidesBackendGunicornApplication(BaseApplication):  # pragma: no cover
             self.cfg.set(key, value)
 
     def load(self) -> WSGIApplication:
-        # We import this here so Gunicorn can use its reload feature properly.
-        from .wsgi import create_wsgi_application
+        startup_profiler.start()
+        with startup_profiler.phase("wsgi"):
+            # We import this here so Gunicorn can use its reload feature properly.
+            from .wsgi import create_wsgi_application
 
         # TODO: Fix this typing problem.
         logging_module: LoggingModule = logging  # type: ignore
 
-        otel_instrument_requests()
-        otel_init(self.env, "backend")
-        return create_wsgi_application(logging_module, self.view_name, self.env)
+        with startup_profiler.phase("otel"):
+            otel_instrument_requests()
+            otel_init(self.env, "backend")
+        with startup_profiler.phase("application"):
+            application = create_wsgi_application(
+                logging_module, self.view_name, self.env
+            )
+        startup_profiler.stop()
+        if startup_profiler.enabled:
+            path = os.path.join(
+                self.env.OPENSLIDES_BACKEND_STARTUP_PROFILE,
+                f"startup-{self.view_name}-{os.getpid()}.json",
+            )
+            startup_profiler.write_report(path)
+            logger = logging.getLogger(__name__)
+            logger.info(
+                f"Startup of {self.view_name} took {startup_profiler.seconds:.2f} "
+                f"seconds, wrote profile to {path}."
+            )
+            try:
+                startup_profiler.check_budget(self.env.get_startup_budget())
+            except StartupBudgetExceeded as e:
+                logger.warning(e.message)
+        return application
 
 
 def start_action_server(env: Environment) -> None:  # pragma: no cover
@@ -1,3 +1,6 @@
+from typing import List
+
+from datastore.migrations import BaseMigration
 from datastore.shared.di import injector
 from datastore.shared.postgresql_backend import ConnectionHandler
 from datastore.shared.services import ReadDatabase
@@ -17,6 +20,19 @@ def get_backend_migration_index() -> int:
     return backend_migration_index
 
 
+def get_migrations_after(migration_index: int) -> List[BaseMigration]:
+    """
+    Returns the migrations which are needed to migrate data of the given migration
+    index to the backend migration index, ordered by their target migration index.
+    """
+    migrations = [
+        migration_class()
+        for migration_class in MigrationWrapper.load_migrations()
+        if migration_class.target_migration_index > migration_index
+    ]
+    return sorted(migrations, key=lambda migration: migration.target_migration_index)
+
+
 def get_datastore_migration_index() -> int:
     read_db = injector.get(ReadDatabase)
     with read_db.get_context():
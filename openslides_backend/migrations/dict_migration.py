@@ -0,0 +1,17 @@
+from typing import Any, Dict
+
+# The models of a meeting import: collection -> id -> model
+ImportModels = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+class DictMigrationMixin:
+    """
+    Declares that a migration can also be applied directly to the models of a
+    meeting import. If all migrations which an import needs are dict migrations,
+    the import data is migrated in place and not converted into events and back.
+
+    The given models do not contain None values, the same as the create events.
+    """
+
+    def migrate_models(self, models: ImportModels) -> None:
+        raise NotImplementedError()
@@ -1,8 +1,9 @@
 import pkgutil
 import sys
 from argparse import ArgumentParser
+from functools import lru_cache
 from importlib import import_module
-from typing import Any, Dict, List, Optional, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from datastore.migrations import (
     BaseEvent,
@@ -17,6 +18,12 @@ from datastore.migrations.core.migration_handler import (
 )
 from datastore.shared.typing import Fqid, Model
 
+from openslides_backend.migrations.migration_stats import (
+    instrument_migration,
+    migration_stats,
+)
+from openslides_backend.migrations.position_local import position_local_pool
+
 
 class BadMigrationModule(MigrationException):
     pass
@@ -35,6 +42,10 @@ class MigrationWrapper:
         memory_only: bool = False,
     ) -> None:
         migrations = MigrationWrapper.load_migrations()
+        if not memory_only:
+            migrations = [
+                instrument_migration(migration_class) for migration_class in migrations
+            ]
         self.handler = setup(verbose, print_fn, memory_only)
         self.handler.register_migrations(*migrations)
 
@@ -42,6 +53,17 @@ class MigrationWrapper:
     def load_migrations(
         base_migration_module_pypath: Optional[str] = None,
     ) -> List[Type[BaseMigration]]:
+        """
+        Returns the migration classes of the given module path. The modules are only
+        searched and imported once per process.
+        """
+        return list(MigrationWrapper._load_migrations(base_migration_module_pypath))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_migrations(
+        base_migration_module_pypath: Optional[str],
+    ) -> Tuple[Type[BaseMigration], ...]:
         if not base_migration_module_pypath:
             base_module = __name__.rsplit(".", 1)[0]
             if base_module == "__main__":
@@ -70,22 +92,44 @@ class MigrationWrapper:
                     f"The class 'Migration' in module {module_pypath} does not inherit from 'BaseMigration'"
                 )
             migration_classes.append(migration_class)
-        return migration_classes
+        return tuple(migration_classes)
 
     def execute_command(self, command: str) -> Any:
         if command == "migrate":
-            self.handler.migrate()
+            migration_stats.reset()
+            position_local_pool.start()
+            try:
+                self.handler.migrate()
+            finally:
+                position_local_pool.stop()
         elif command == "finalize":
-            self.handler.finalize()
+            migration_stats.reset()
+            position_local_pool.start()
+            try:
+                self.handler.finalize()
+            finally:
+                position_local_pool.stop()
         elif command == "reset":
             self.handler.reset()
         elif command == "clear-collectionfield-tables":
             self.handler.delete_collectionfield_aux_tables()
         elif command == "stats":
-            return self.handler.get_stats()
+            return self.get_stats()
         else:
             raise InvalidMigrationCommand(command)
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the stats of the datastore together with the throughput of the
+        migrations run by this process and the estimated remaining seconds.
+        """
+        stats = self.handler.get_stats()
+        remaining_positions = None
+        if isinstance(positions := stats.get("positions"), int):
+            remaining_positions = positions - stats.get("fully_migrated_positions", 0)
+        stats.update(migration_stats.get_stats(remaining_positions))
+        return stats
+
     def set_additional_data(
         self,
         import_create_events: List[CreateEvent],
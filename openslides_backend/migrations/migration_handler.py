@@ -80,7 +80,7 @@ class MigrationHandler(BaseHandler):
                     # Migration already finished/had nothing to do
                     return self.get_migration_result()
             elif command == "stats":
-                stats = self.migration_wrapper.handler.get_stats()
+                stats = self.migration_wrapper.get_stats()
                 return {
                     "stats": stats,
                 }
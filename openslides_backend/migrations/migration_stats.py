@@ -0,0 +1,111 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from datastore.migrations import BaseEvent, BaseMigration
+
+from .position_local import PositionLocalMigrationMixin, position_local_pool
+
+
+class MigrationStats:
+    """
+    Collects the number of migrated positions and events and the time spent per
+    migration. The numbers are updated by the migrating thread and read by the
+    stats command.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.migrations: Dict[str, Dict[str, Any]] = {}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.migrations = {}
+
+    def add_position(self, name: str, events: int, seconds: float) -> None:
+        with self.lock:
+            stats = self.migrations.setdefault(
+                name, {"positions": 0, "events": 0, "seconds": 0.0}
+            )
+            stats["positions"] += 1
+            stats["events"] += events
+            stats["seconds"] += seconds
+
+    def get_stats(self, remaining_positions: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Returns the throughput of each migration and the estimated number of
+        seconds until the given number of positions are migrated, if it is known.
+        """
+        with self.lock:
+            migrations = {
+                name: {
+                    **stats,
+                    "events_per_second": get_rate(stats["events"], stats["seconds"]),
+                    "positions_per_second": get_rate(
+                        stats["positions"], stats["seconds"]
+                    ),
+                }
+                for name, stats in self.migrations.items()
+            }
+            seconds_per_position = sum(
+                stats["seconds"] / stats["positions"]
+                for stats in self.migrations.values()
+            )
+        eta = None
+        if remaining_positions is not None and migrations:
+            eta = round(remaining_positions * seconds_per_position)
+        return {"migrations": migrations, "eta": eta}
+
+
+def get_rate(amount: int, seconds: float) -> Optional[float]:
+    return round(amount / seconds, 2) if seconds else None
+
+
+migration_stats = MigrationStats()
+
+
+def instrument_migration(
+    migration_class: Type[BaseMigration],
+) -> Type[BaseMigration]:
+    """
+    Returns a subclass of the given migration which reports its positions to the
+    migration stats. Position-local migrations take the results of positions which
+    were migrated ahead by the position-local pool.
+    """
+    name = migration_class.__module__.rsplit(".", 1)[-1]
+    position_local = issubclass(migration_class, PositionLocalMigrationMixin)
+
+    class Migration(migration_class):  # type: ignore
+        def position_init(self) -> None:
+            self.position_start = perf_counter()
+            self.position_events = 0
+            self.migrated_events: Optional[Iterator[Optional[List[BaseEvent]]]] = None
+            self.migrated_additional_events: Optional[List[BaseEvent]] = None
+            super().position_init()
+
+        def order_events(self, events: List[BaseEvent]) -> Iterable[BaseEvent]:
+            if position_local:
+                results = position_local_pool.get_results(migration_class, events)
+                if results is not None:
+                    self.migrated_events = iter(results[0])
+                    self.migrated_additional_events = results[1]
+            return super().order_events(events)
+
+        def migrate_event(self, event: BaseEvent) -> Optional[List[BaseEvent]]:
+            self.position_events += 1
+            if self.migrated_events is not None:
+                return next(self.migrated_events)
+            return super().migrate_event(event)
+
+        def get_additional_events(self) -> Optional[List[BaseEvent]]:
+            if self.migrated_events is not None:
+                events = self.migrated_additional_events
+            else:
+                events = super().get_additional_events()
+            migration_stats.add_position(
+                name, self.position_events, perf_counter() - self.position_start
+            )
+            return events
+
+    Migration.__module__ = migration_class.__module__
+    return Migration
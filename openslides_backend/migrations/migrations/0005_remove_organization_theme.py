@@ -9,8 +9,10 @@ from datastore.migrations.core.events import (
 )
 from datastore.shared.util import collection_from_fqid
 
+from openslides_backend.migrations.position_local import PositionLocalMigrationMixin
 
-class Migration(BaseMigration):
+
+class Migration(BaseMigration, PositionLocalMigrationMixin):
     """
     This migration removes `organization/theme`.
     """
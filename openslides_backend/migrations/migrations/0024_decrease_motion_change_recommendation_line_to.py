@@ -3,8 +3,10 @@ from typing import List, Optional
 from datastore.migrations import BaseEvent, BaseMigration, CreateEvent
 from datastore.shared.util import collection_and_id_from_fqid
 
+from openslides_backend.migrations.position_local import PositionLocalMigrationMixin
 
-class Migration(BaseMigration):
+
+class Migration(BaseMigration, PositionLocalMigrationMixin):
     """
     This migration decriments motion_change_recommendation line_to, if
     line_from < line_to.
@@ -10,8 +10,10 @@ from datastore.migrations import (
 )
 from datastore.shared.util import collection_from_fqid
 
+from openslides_backend.migrations.position_local import PositionLocalMigrationMixin
 
-class Migration(BaseMigration):
+
+class Migration(BaseMigration, PositionLocalMigrationMixin):
     """
     This migration renames default_projector_$.._id into
       default_projector_$.._ids and changes value to list.
@@ -11,8 +11,13 @@ from datastore.migrations.migrations.remove_fields_migration import (
 )
 from datastore.shared.util import collection_from_fqid
 
+from openslides_backend.migrations.dict_migration import (
+    DictMigrationMixin,
+    ImportModels,
+)
+
 
-class Migration(RemoveFieldsMigration):
+class Migration(RemoveFieldsMigration, DictMigrationMixin):
     """
     This migration removes the field `meeting/default_projector_$user_ids`.
     """
@@ -52,3 +57,12 @@ class Migration(RemoveFieldsMigration):
             self.remove_replacement(event.add, fields)
             self.remove_replacement(event.remove, fields)
         return [event]
+
+    def migrate_models(self, models: ImportModels) -> None:
+        for collection, fields in self.collection_fields_map.items():
+            for model in models.get(collection, {}).values():
+                for field in fields:
+                    model.pop(field, None)
+                self.remove_replacement(
+                    model, self.collection_fields_replacement_map[collection]
+                )
@@ -1,7 +1,12 @@
 from datastore.migrations import AddFieldsMigration
 
+from openslides_backend.migrations.dict_migration import (
+    DictMigrationMixin,
+    ImportModels,
+)
 
-class Migration(AddFieldsMigration):
+
+class Migration(AddFieldsMigration, DictMigrationMixin):
     """
     This migration adds default_language to organization.
     """
@@ -9,3 +14,9 @@ class Migration(AddFieldsMigration):
     target_migration_index = 40
 
     defaults = {"organization": {"default_language": "en"}}
+
+    def migrate_models(self, models: ImportModels) -> None:
+        for collection, defaults in self.defaults.items():
+            for model in models.get(collection, {}).values():
+                for field, value in defaults.items():
+                    model.setdefault(field, value)
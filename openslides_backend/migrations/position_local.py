@@ -0,0 +1,279 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple, Type
+
+from datastore.migrations import BaseEvent, BaseMigration
+from datastore.migrations.core.events import (
+    CreateEvent,
+    DeleteEvent,
+    DeleteFieldsEvent,
+    ListUpdateEvent,
+    RestoreEvent,
+    UpdateEvent,
+)
+from datastore.shared.di import injector
+from datastore.shared.postgresql_backend import ConnectionHandler
+
+POSITION_LOCAL_BATCH_SIZE = 100
+POSITION_LOCAL_PROCESSES = min(4, os.cpu_count() or 1)
+
+# The event classes by the type stored in the events table.
+EVENT_CLASSES: Dict[str, Type[BaseEvent]] = {
+    "create": CreateEvent,
+    "update": UpdateEvent,
+    "deletefields": DeleteFieldsEvent,
+    "listfields": ListUpdateEvent,
+    "delete": DeleteEvent,
+    "restore": RestoreEvent,
+}
+
+# The results of migrate_event for the ordered events of a position and the
+# additional events of the position.
+PositionResult = Tuple[List[Optional[List[BaseEvent]]], Optional[List[BaseEvent]]]
+
+# Reads the events of at most the given number of positions after the given one,
+# which still have the given migration index.
+ReadPositions = Callable[[int, int, int], List[Tuple[int, List[BaseEvent]]]]
+
+# The events of the positions of a batch and the future of their results.
+Batch = Tuple[List[List[BaseEvent]], Optional["Future[List[PositionResult]]"]]
+
+
+class PositionLocalMigrationMixin:
+    """
+    Declares that a migration only depends on the events of the position it
+    migrates: It must neither use the accessors or the position data nor keep any
+    state between the positions, and it must return the changed events instead of
+    only changing them in place. The positions are then migrated ahead in batches of
+    whole positions on the process pool of the migrate run.
+    """
+
+
+def migrate_positions(
+    migration_class: Type[BaseMigration], positions: Sequence[List[BaseEvent]]
+) -> List[PositionResult]:
+    """
+    Migrates the events of every given position like the datastore does. This runs
+    in the worker processes and must therefore be a module level function.
+    """
+    results: List[PositionResult] = []
+    for events in positions:
+        migration = migration_class()
+        migration.position_init()
+        migrated_events = [
+            migration.migrate_event(event) for event in migration.order_events(events)
+        ]
+        results.append((migrated_events, migration.get_additional_events()))
+    return results
+
+
+def read_positions(
+    migration_index: int, after_position: int, limit: int
+) -> List[Tuple[int, List[BaseEvent]]]:
+    """
+    Reads the stored events of the next positions with the given migration index.
+    These are the events which the datastore passes to the first migration applied
+    to them. Positions with unknown event types are left out.
+    """
+    connection = injector.get(ConnectionHandler)
+    with connection.get_connection_context():
+        positions = connection.query(
+            "select position from positions where position > %s and migration_index = %s order by position asc limit %s",
+            [after_position, migration_index, limit],
+        )
+        if not positions:
+            return []
+        rows = connection.query(
+            "select position, type, fqid, data from events where position = any(%s) order by id asc",
+            [[row["position"] for row in positions]],
+        )
+    events: Dict[int, Optional[List[BaseEvent]]] = {
+        row["position"]: [] for row in positions
+    }
+    for row in rows:
+        position_events = events[row["position"]]
+        if position_events is None:
+            continue
+        if (event_class := EVENT_CLASSES.get(row["type"])) is None:
+            events[row["position"]] = None
+        else:
+            position_events.append(event_class(row["fqid"], row["data"]))  # type: ignore
+    return [
+        (position, position_events)
+        for position, position_events in events.items()
+        if position_events is not None
+    ]
+
+
+def is_same_events(events: List[BaseEvent], other_events: List[BaseEvent]) -> bool:
+    return len(events) == len(other_events) and all(
+        type(event) is type(other) and vars(event) == vars(other)
+        for event, other in zip(events, other_events)
+    )
+
+
+class PositionBatches:
+    """
+    Migrates the positions for which the given migration is the first one to apply
+    ahead of the datastore. A thread reads batches of whole positions one after
+    another and sends them to the process pool, at most two batches per process are
+    pending. The datastore then migrates the positions one after another and gets
+    the results of the matching positions with get_results.
+    """
+
+    def __init__(
+        self,
+        migration_class: Type[BaseMigration],
+        executor: ProcessPoolExecutor,
+        read_positions: ReadPositions,
+        batch_size: int,
+        processes: int,
+    ) -> None:
+        self.migration_class = migration_class
+        self.executor = executor
+        self.read_positions = read_positions
+        self.batch_size = batch_size
+        self.max_batches = 2 * processes
+        self.reader = ThreadPoolExecutor(max_workers=1)
+        self.last_position = 0
+        self.done = False
+        self.batches: Deque["Future[Batch]"] = deque()
+        self.positions: Deque[
+            Tuple[List[BaseEvent], "Future[List[PositionResult]]", int]
+        ] = deque()
+        self.misses = 0
+
+    def read_batch(self) -> Batch:
+        """
+        Reads the positions after the last read one and submits them to the pool.
+        This runs in the reader thread, which has its own database connection.
+        """
+        positions = self.read_positions(
+            self.migration_class.target_migration_index - 1,
+            self.last_position,
+            self.batch_size,
+        )
+        if not positions:
+            return [], None
+        self.last_position = positions[-1][0]
+        events = [position_events for _, position_events in positions]
+        return events, self.executor.submit(
+            migrate_positions, self.migration_class, events
+        )
+
+    def fill(self) -> None:
+        while not self.done and len(self.batches) < self.max_batches:
+            self.batches.append(self.reader.submit(self.read_batch))
+
+    def load_batch(self) -> bool:
+        """
+        Moves the positions of the next read batch into the queue of positions.
+        Returns False if there are no more positions.
+        """
+        self.fill()
+        if not self.batches:
+            return False
+        batch = self.batches.popleft()
+        if batch.exception() is not None:
+            # the positions are only read ahead to speed up the migration, so they
+            # are migrated one after another by the datastore if reading fails
+            self.done = True
+            return False
+        events, future = batch.result()
+        if future is None:
+            self.done = True
+            return False
+        self.positions.extend(
+            (position_events, future, index)
+            for index, position_events in enumerate(events)
+        )
+        self.fill()
+        return True
+
+    def get_results(self, events: List[BaseEvent]) -> Optional[PositionResult]:
+        """
+        Returns the results of the position with the given events if it was migrated
+        ahead. The positions before it were skipped by the datastore and are
+        dropped. If the position is not found in the queue, the queue is kept for
+        the following positions, unless there were more misses in a row than
+        positions queued, e.g. because the datastore continues an interrupted
+        migration.
+        """
+        while len(self.positions) < self.batch_size and self.load_batch():
+            pass
+        for i, (position_events, future, index) in enumerate(self.positions):
+            if is_same_events(position_events, events):
+                for _ in range(i + 1):
+                    self.positions.popleft()
+                self.misses = 0
+                return future.result()[index]
+        self.misses += 1
+        if self.misses > len(self.positions):
+            self.positions.clear()
+            self.misses = 0
+        return None
+
+    def close(self) -> None:
+        self.done = True
+        self.reader.shutdown(cancel_futures=True)
+        self.batches.clear()
+        self.positions.clear()
+
+
+class PositionLocalPool:
+    """
+    Holds the process pool of the current migrate run, which is shared by all
+    position-local migrations. The processes are only spawned when the first batch
+    of positions is submitted.
+    """
+
+    def __init__(
+        self,
+        read_positions: ReadPositions = read_positions,
+        batch_size: int = POSITION_LOCAL_BATCH_SIZE,
+        processes: int = POSITION_LOCAL_PROCESSES,
+    ) -> None:
+        self.read_positions = read_positions
+        self.batch_size = batch_size
+        self.processes = processes
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.position_batches: Dict[Type[BaseMigration], PositionBatches] = {}
+
+    def start(self) -> None:
+        if self.processes > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=get_context("spawn")
+            )
+
+    def stop(self) -> None:
+        for position_batches in self.position_batches.values():
+            position_batches.close()
+        self.position_batches = {}
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def get_results(
+        self, migration_class: Type[BaseMigration], events: List[BaseEvent]
+    ) -> Optional[PositionResult]:
+        """
+        Returns the results of the position with the given events if it was migrated
+        ahead by the pool. The results belong to the events in the order of
+        order_events.
+        """
+        if self.executor is None:
+            return None
+        if (position_batches := self.position_batches.get(migration_class)) is None:
+            position_batches = self.position_batches[migration_class] = PositionBatches(
+                migration_class,
+                self.executor,
+                self.read_positions,
+                self.batch_size,
+                self.processes,
+            )
+        return position_batches.get_results(events)
+
+
+position_local_pool = PositionLocalPool()
@@ -1,5 +1,7 @@
-import re
-from typing import Dict, Iterable, Optional, Type
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type
 
 from ..shared.exceptions import ActionException
 from ..shared.patterns import Collection
@@ -7,6 +9,9 @@ from . import fields
 
 model_registry: Dict[Collection, Type["Model"]] = {}
 
+# Maximum number of structured field names which are memoized per model.
+STRUCTURED_FIELD_CACHE_SIZE = 4096
+
 
 class ModelMetaClass(type):
     """
@@ -15,7 +20,9 @@ class ModelMetaClass(type):
     This metaclass ensures that all fields get attributes set so that they
     know its own collection and its own field name.
 
-    It also creates the registry for models and collections.
+    It also creates the registry for models and collections and precomputes
+    immutable tuples of the fields of the model, so that they do not have to be
+    searched on every access.
     """
 
     def __new__(metaclass, class_name, class_parents, class_attributes):  # type: ignore
@@ -35,9 +42,66 @@ class ModelMetaClass(type):
                     if isinstance(attr, fields.BaseTemplateField):
                         prefix = attr_name[: attr.index]
                         new_class.field_prefix_map[prefix] = attr
+            metaclass.set_field_tuples(new_class)
+            new_class.try_get_structured_field = create_structured_field_lookup(
+                new_class.field_prefix_map
+            )
             model_registry[new_class.collection] = new_class
         return new_class
 
+    @staticmethod
+    def set_field_tuples(new_class: Any) -> None:
+        # keep the order of dir(), which is sorted by attribute name
+        all_fields = tuple(
+            attr
+            for attr_name in dir(new_class)
+            if isinstance(attr := getattr(new_class, attr_name), fields.Field)
+        )
+        relation_fields = tuple(
+            field for field in all_fields if isinstance(field, fields.BaseRelationField)
+        )
+        relation_fields_by_collection: Dict[
+            Collection, List[fields.BaseRelationField]
+        ] = defaultdict(list)
+        for field in relation_fields:
+            for collection in field.to:
+                relation_fields_by_collection[collection].append(field)
+        new_class.all_fields = all_fields
+        new_class.relation_fields = relation_fields
+        new_class.required_fields = tuple(
+            field for field in all_fields if field.required
+        )
+        new_class.template_fields = tuple(
+            field for field in all_fields if isinstance(field, fields.BaseTemplateField)
+        )
+        new_class.relation_fields_by_collection = MappingProxyType(
+            {
+                collection: tuple(collection_fields)
+                for collection, collection_fields in relation_fields_by_collection.items()
+            }
+        )
+
+
+def create_structured_field_lookup(
+    field_prefix_map: Dict[str, fields.BaseRelationField]
+) -> Callable[[str], Optional[fields.Field]]:
+    """
+    Returns a memoized lookup of the field for field names containing a $. This
+    avoids matching the template field pattern for every access of the same
+    structured field, e.g. group_$42_ids.
+    """
+
+    @lru_cache(maxsize=STRUCTURED_FIELD_CACHE_SIZE)
+    def try_get_structured_field(field_name: str) -> Optional[fields.Field]:
+        field = field_prefix_map.get(field_name.split("$")[0])
+        if isinstance(field, fields.BaseTemplateField) and not field.regex.match(
+            field_name
+        ):
+            return None
+        return field
+
+    return staticmethod(try_get_structured_field)  # type: ignore
+
 
 class Model(metaclass=ModelMetaClass):
     """
@@ -52,6 +116,22 @@ class Model(metaclass=ModelMetaClass):
     # once only with the prefix.
     field_prefix_map: Dict[str, fields.BaseRelationField]
 
+    # Precomputed by the metaclass, see ModelMetaClass.set_field_tuples.
+    all_fields: Tuple[fields.Field, ...]
+    relation_fields: Tuple[fields.BaseRelationField, ...]
+    required_fields: Tuple[fields.Field, ...]
+    template_fields: Tuple[fields.BaseTemplateField, ...]
+    relation_fields_by_collection: Mapping[
+        Collection, Tuple[fields.BaseRelationField, ...]
+    ]
+    try_get_structured_field: Callable[[str], Optional[fields.Field]]
+
+    def __new__(cls) -> "Model":
+        # models are stateless, so a single instance per class suffices
+        if "_instance" not in cls.__dict__:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __str__(self) -> str:
         return self.verbose_name
 
@@ -80,33 +160,37 @@ class Model(metaclass=ModelMetaClass):
 
         Returns None if field is not found.
         """
-        prefix = field_name.split("$")[0]
-        if prefix not in self.field_prefix_map:
-            return None
-
-        field = self.field_prefix_map[prefix]
-        if isinstance(field, fields.BaseTemplateField):
-            # We use the regex here since we want to also match template fields.
-            if "$" in field_name and not re.match(field.get_regex(), field_name):
-                return None
-        return field
+        if "$" in field_name:
+            # Template and structured fields are matched against the regex of the
+            # template field, the results are memoized.
+            return self.try_get_structured_field(field_name)
+        return self.field_prefix_map.get(field_name)
 
     def get_fields(self) -> Iterable[fields.Field]:
         """
-        Yields all fields of this model.
+        Returns all fields of this model.
         """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, fields.Field):
-                yield attr
+        return self.all_fields
 
     def get_relation_fields(self) -> Iterable[fields.BaseRelationField]:
         """
-        Yields all relation fields (using BaseRelationField).
+        Returns all relation fields (using BaseRelationField).
+        """
+        return self.relation_fields
+
+    def get_relation_fields_to(
+        self, collection: Collection
+    ) -> Iterable[fields.BaseRelationField]:
+        """
+        Returns all relation fields which may point to the given collection.
+        """
+        return self.relation_fields_by_collection.get(collection, ())
+
+    def get_template_fields(self) -> Iterable[fields.BaseTemplateField]:
+        """
+        Returns all template fields.
         """
-        for model_field in self.get_fields():
-            if isinstance(model_field, fields.BaseRelationField):
-                yield model_field
+        return self.template_fields
 
     def get_property(
         self, field_name: str, replacement_pattern: Optional[str] = None
@@ -135,20 +219,19 @@ class Model(metaclass=ModelMetaClass):
         """
         Yields all required fields
         """
-        for model_field in self.get_fields():
-            if model_field.required:
-                if isinstance(
-                    model_field,
-                    (
-                        fields.RelationListField,
-                        fields.GenericRelationListField,
-                        fields.BaseTemplateField,
-                    ),
-                ) and (
-                    not hasattr(model_field, "replacement_enum")
-                    or not model_field.replacement_enum  # type: ignore
-                ):
-                    raise NotImplementedError(
-                        f"{self.collection}.{model_field.own_field_name}"
-                    )
-                yield model_field
+        for model_field in self.required_fields:
+            if isinstance(
+                model_field,
+                (
+                    fields.RelationListField,
+                    fields.GenericRelationListField,
+                    fields.BaseTemplateField,
+                ),
+            ) and (
+                not hasattr(model_field, "replacement_enum")
+                or not model_field.replacement_enum  # type: ignore
+            ):
+                raise NotImplementedError(
+                    f"{self.collection}.{model_field.own_field_name}"
+                )
+            yield model_field
@@ -1,6 +1,20 @@
+import re
 from collections import defaultdict
 from decimal import InvalidOperation
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, cast
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 
 import fastjsonschema
 
@@ -32,7 +46,9 @@ from openslides_backend.models.helper import calculate_inherited_groups_helper
 from openslides_backend.models.models import Meeting, Model
 from openslides_backend.shared.patterns import (
     COLOR_PATTERN,
+    COLOR_REGEX,
     DECIMAL_PATTERN,
+    DECIMAL_REGEX,
     EXTENSION_REFERENCE_IDS_PATTERN,
     collection_and_id_from_fqid,
 )
@@ -65,6 +81,9 @@ SCHEMA = fastjsonschema.compile(
 )
 
 
+MODEL_ID_PATTERN = re.compile(r"[1-9][0-9]*")
+
+
 class CheckException(Exception):
     pass
 
@@ -144,6 +163,109 @@ checker_map: Dict[Type[Field], Callable[..., bool]] = {
 }
 
 
+def find_invalid_values(values: List[Any], checker: Callable[..., bool]) -> List[int]:
+    """
+    Returns the indexes of all values for which the checker fails. For the most
+    common checkers, the whole column is checked at once without calling the
+    checker for every single value.
+    """
+    if column_checker := column_checker_map.get(checker):
+        return column_checker(values)
+    return [index for index, value in enumerate(values) if not checker(value)]
+
+
+def find_invalid_strings(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None and not isinstance(value, str)
+    ]
+
+
+def find_invalid_numbers(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None and type(value) != int
+    ]
+
+
+def find_invalid_floats(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None and type(value) not in (int, float)
+    ]
+
+
+def find_invalid_booleans(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None and value is not False and value is not True
+    ]
+
+
+def find_invalid_number_lists(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None
+        and not (
+            isinstance(value, list) and all(v is None or type(v) == int for v in value)
+        )
+    ]
+
+
+def find_invalid_string_lists(values: List[Any]) -> List[int]:
+    return [
+        index
+        for index, value in enumerate(values)
+        if value is not None
+        and not (
+            isinstance(value, list)
+            and all(v is None or isinstance(v, str) for v in value)
+        )
+    ]
+
+
+def find_invalid_by_pattern(
+    values: List[Any], pattern: Pattern, checker: Callable[..., bool]
+) -> List[int]:
+    """
+    Matches all strings of the column at once by joining them linewise. Only if
+    not all of them match, the invalid ones are searched value by value.
+    """
+    strings = [value for value in values if value is not None]
+    if all(type(value) == str and "\n" not in value for value in strings):
+        if len(pattern.findall("\n".join(strings))) == len(strings):
+            return []
+    return [index for index, value in enumerate(values) if not checker(value)]
+
+
+def find_invalid_decimals(values: List[Any]) -> List[int]:
+    return find_invalid_by_pattern(values, DECIMAL_COLUMN_PATTERN, check_decimal)
+
+
+def find_invalid_colors(values: List[Any]) -> List[int]:
+    return find_invalid_by_pattern(values, COLOR_COLUMN_PATTERN, check_color)
+
+
+DECIMAL_COLUMN_PATTERN = re.compile(DECIMAL_REGEX, re.MULTILINE)
+COLOR_COLUMN_PATTERN = re.compile(COLOR_REGEX, re.MULTILINE)
+
+column_checker_map: Dict[Callable[..., bool], Callable[[List[Any]], List[int]]] = {
+    check_string: find_invalid_strings,
+    check_number: find_invalid_numbers,
+    check_float: find_invalid_floats,
+    check_boolean: find_invalid_booleans,
+    check_number_list: find_invalid_number_lists,
+    check_string_list: find_invalid_string_lists,
+    check_decimal: find_invalid_decimals,
+    check_color: find_invalid_colors,
+}
+
+
 class Checker:
     modes = ("internal", "external", "all")
 
@@ -241,6 +363,11 @@ class Checker:
             self.allowed_collections.append("user")
 
         self.errors: List[str] = []
+        self.reverse_index: Dict[Tuple[str, str], Dict[int, Any]] = {}
+        self.type_check_models: Dict[
+            str, List[Tuple[Dict[str, Any], int]]
+        ] = defaultdict(list)
+        self.timings: Dict[str, float] = {}
 
         self.template_prefixes: Dict[
             str, Dict[str, Tuple[str, int, int]]
@@ -322,15 +449,21 @@ class Checker:
         self.check_json()
         self.check_migration_index()
         self.check_collections()
+        for collection in self.data:
+            if not collection.startswith("_"):
+                self.remove_fields(collection)
         for collection, models in self.data.items():
             if collection.startswith("_"):
                 continue
+            start = perf_counter()
             for id_, model in models.items():
                 if model["id"] != int(id_):
                     self.errors.append(
                         f"{collection}/{id_}: Id must be the same as model['id']"
                     )
                 self.check_model(collection, model)
+            self.check_column_types(collection)
+            self.timings[collection] = perf_counter() - start
         if self.errors:
             errors = [f"\t{error}" for error in self.errors]
             raise CheckException("\n".join(errors))
@@ -353,10 +486,25 @@ class Checker:
             err += f" Invalid collections: {', '.join(c1-c2)}."
             raise CheckException(err)
 
-    def check_model(self, collection: str, model: Dict[str, Any]) -> None:
+    def format_timings(self) -> str:
+        return ", ".join(
+            f"{collection} {duration * 1000:.1f}ms"
+            for collection, duration in sorted(
+                self.timings.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+
+    def remove_fields(self, collection: str) -> None:
+        """
+        Removes the fields_to_remove from all models of the collection. This is done
+        before any model is checked, so that the reverse index never contains them.
+        """
         if self.repair and collection in self.fields_to_remove:
-            [model.pop(field, None) for field in self.fields_to_remove[collection]]
+            for model in self.data[collection].values():
+                for field in self.fields_to_remove[collection]:
+                    model.pop(field, None)
 
+    def check_model(self, collection: str, model: Dict[str, Any]) -> None:
         errors = self.check_normal_fields(model, collection)
 
         if not errors:
@@ -416,6 +564,10 @@ class Checker:
             field = self.get_model(collection).get_field(fieldname)
             if field.default is not None:
                 model[fieldname] = field.default
+                if (
+                    index := self.reverse_index.get((collection, fieldname))
+                ) is not None:
+                    index[model["id"]] = self.to_index_value(field.default)
             else:
                 remaining_fields.add(fieldname)
         return remaining_fields
@@ -506,14 +658,39 @@ class Checker:
         return errors
 
     def check_types(self, model: Dict[str, Any], collection: str) -> None:
-        for field in model.keys():
-            if self.is_template_field(field):
-                continue
+        """
+        Queues the model for the type check of its collection, which is done column
+        by column in check_column_types. The current number of errors is remembered,
+        so that the type errors of the model can be inserted at this point later.
+        """
+        self.type_check_models[collection].append((model, len(self.errors)))
+
+    def check_column_types(self, collection: str) -> None:
+        """
+        Checks the types of all queued models of the collection. The values of each
+        field are checked together in a single pass. The errors are then inserted
+        into the other errors at the point where the model was queued, in the order
+        of its fields, so that they appear in the same order as if every model was
+        checked on its own.
+        """
+        queued = self.type_check_models.pop(collection, [])
+        columns: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for model, _ in queued:
+            for field in model:
+                if not self.is_template_field(field):
+                    columns[field].append(model)
+        model_errors: Dict[int, Dict[str, List[str]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
 
+        # committee_id is a special case, because it is filled after the
+        # replacement
+        # is_active_in_organization_id is also skipped, see PR #901
+        skip_fields = (Meeting.committee_id, Meeting.is_active_in_organization_id)
+        for field, models in columns.items():
             field_type = self.get_type_from_collection(field, collection)
             enum = self.get_enum_from_collection_field(field, collection)
 
-            checker: Optional[Callable[..., bool]] = None
             for _type in type(field_type).mro():
                 if _type in checker_map:
                     checker = checker_map[_type]
@@ -523,26 +700,37 @@ class Checker:
                     f"TODO implement check for field type {field_type}"
                 )
 
-            if not checker(model[field]):
-                error = f"{collection}/{model['id']}/{field}: Type error: Type is not {field_type}"
-                self.errors.append(error)
+            values = [model[field] for model in models]
+            for index in find_invalid_values(values, checker):
+                error = f"{collection}/{models[index]['id']}/{field}: Type error: Type is not {field_type}"
+                model_errors[id(models[index])][field].append(error)
 
             # check if required field is not empty
-            # committee_id is a special case, because it is filled after the
-            # replacement
-            # is_active_in_organization_id is also skipped, see PR #901
-            skip_fields = (Meeting.committee_id, Meeting.is_active_in_organization_id)
-            if (
-                field_type.required
-                and field_type.check_required_not_fulfilled(model, False)
-                and field_type not in skip_fields
-            ):
-                error = f"{collection}/{model['id']}/{field}: Field required but empty."
-                self.errors.append(error)
-
-            if enum and model[field] not in enum:
-                error = f"{collection}/{model['id']}/{field}: Value error: Value {model[field]} is not a valid enum value"
-                self.errors.append(error)
+            if field_type.required and field_type not in skip_fields:
+                for model in models:
+                    if field_type.check_required_not_fulfilled(model, False):
+                        error = f"{collection}/{model['id']}/{field}: Field required but empty."
+                        model_errors[id(model)][field].append(error)
+
+            if enum:
+                for model in models:
+                    if model[field] not in enum:
+                        error = f"{collection}/{model['id']}/{field}: Value error: Value {model[field]} is not a valid enum value"
+                        model_errors[id(model)][field].append(error)
+
+        if not model_errors:
+            return
+        errors: List[str] = []
+        last_position = 0
+        for model, position in queued:
+            if (field_errors := model_errors.get(id(model))) is None:
+                continue
+            errors.extend(self.errors[last_position:position])
+            last_position = position
+            for field in model:
+                errors.extend(field_errors.get(field, []))
+        errors.extend(self.errors[last_position:])
+        self.errors = errors
 
     def get_type_from_collection(self, field: str, collection: str) -> Field:
         if self.is_structured_field(field):
@@ -576,6 +764,10 @@ class Checker:
             return
 
         field_type = self.get_type_from_collection(field, collection)
+        if not isinstance(field_type, BaseRelationField) and not (
+            collection == "motion" and field.endswith("_extension")
+        ):
+            return
         basemsg = f"{collection}/{model['id']}/{field}: Relation Error: "
 
         replacement = None
@@ -779,12 +971,85 @@ class Checker:
                     cast(BaseTemplateField, foreign_field_type), replacement
                 )
 
-        foreign_model = self.find_model(foreign_collection, foreign_id)
-        foreign_value = (
-            foreign_model.get(actual_foreign_field)
-            if foreign_model is not None
-            else None
+        self.check_reverse_value(
+            collection,
+            id,
+            foreign_collection,
+            foreign_id,
+            actual_foreign_field,
+            foreign_field_type,
+            basemsg,
         )
+
+    def check_reverse_value(
+        self,
+        collection: str,
+        id: int,
+        foreign_collection: str,
+        foreign_id: int,
+        foreign_field: str,
+        foreign_field_type: Field,
+        basemsg: str,
+    ) -> None:
+        self.check_foreign_value(
+            collection,
+            id,
+            foreign_collection,
+            foreign_id,
+            foreign_field,
+            foreign_field_type,
+            basemsg,
+            self.get_reverse_index(foreign_collection, foreign_field).get(
+                self.get_model_id(foreign_id)
+            ),
+        )
+
+    def get_model_id(self, id: Any) -> int:
+        """
+        Returns the id of the model which find_model would return for the given id,
+        which may be of any type in invalid data. Returns 0, which is never a valid
+        id, if the given id can not match any model.
+        """
+        if type(id) == int:
+            return id
+        key = str(id)
+        return int(key) if MODEL_ID_PATTERN.fullmatch(key) else 0
+
+    def get_reverse_index(self, collection: str, field: str) -> Dict[int, Any]:
+        """
+        Returns the values of the field for all models of the collection which have
+        it. Lists are converted to sets, so that each reverse relation is verified in
+        constant time instead of scanning the list of the foreign model.
+        """
+        key = (collection, field)
+        index = self.reverse_index.get(key)
+        if index is None:
+            index = self.reverse_index[key] = {}
+            for id_, model in self.data.get(collection, {}).items():
+                value = model.get(field)
+                if value is not None:
+                    index[int(id_)] = self.to_index_value(value)
+        return index
+
+    def to_index_value(self, value: Any) -> Any:
+        if isinstance(value, list):
+            try:
+                return frozenset(value)
+            except TypeError:
+                pass
+        return value
+
+    def check_foreign_value(
+        self,
+        collection: str,
+        id: int,
+        foreign_collection: str,
+        foreign_id: int,
+        foreign_field: str,
+        foreign_field_type: Field,
+        basemsg: str,
+        foreign_value: Any,
+    ) -> None:
         fqid = f"{collection}/{id}"
         error = False
         if isinstance(foreign_field_type, RelationField):
@@ -800,7 +1065,7 @@ class Checker:
 
         if error:
             self.errors.append(
-                f"{basemsg} points to {foreign_collection}/{foreign_id}/{actual_foreign_field},"
+                f"{basemsg} points to {foreign_collection}/{foreign_id}/{foreign_field},"
                 " but the reverse relation for it is corrupt"
             )
 
@@ -1,7 +1,8 @@
 import re
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union, cast
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Pattern, Set, Union, cast
 
 import fastjsonschema
 
@@ -19,6 +20,7 @@ from ..shared.schema import (
     required_fqid_schema,
     required_id_schema,
 )
+from ..shared.schema_validator import SchemaValidator
 from ..shared.typing import Schema
 from ..shared.util import (
     ALLOWED_HTML_TAGS_PERMISSIVE,
@@ -26,7 +28,7 @@ from ..shared.util import (
     validate_html,
 )
 
-TEMPLATE_FIELD_SCHEMA = fastjsonschema.compile(
+TEMPLATE_FIELD_SCHEMA = SchemaValidator(
     {
         "type": ["array", "null"],
         "items": {"type": "string"},
@@ -62,7 +64,7 @@ class Field:
         if not self.required and constraints and "enum" in constraints:
             constraints["enum"].append(None)
         self.constraints = constraints or {}
-        self.schema_validator = fastjsonschema.compile(self.get_schema())
+        self.schema_validator = SchemaValidator(self.get_schema())
 
     def get_schema(self) -> Schema:
         """
@@ -395,6 +397,14 @@ class BaseTemplateField(Field):
             )
         return schema
 
+    @cached_property
+    def regex(self) -> Pattern[str]:
+        """
+        The compiled pattern of get_regex. Must only be accessed after the field was
+        bound to its model.
+        """
+        return re.compile(self.get_regex())
+
     def get_regex(self) -> str:
         """
         For internal usage. To find the replacement, please use [try_]get_replacement.
@@ -431,7 +441,7 @@ class BaseTemplateField(Field):
         return field_name == self.get_template_field_name()
 
     def try_get_replacement(self, field_name: str) -> Optional[str]:
-        match = re.match(self.get_regex(), field_name)
+        match = self.regex.match(field_name)
         if not match:
             return None
         replacement = match.group(1)
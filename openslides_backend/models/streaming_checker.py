@@ -0,0 +1,243 @@
+from array import array
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .base import model_registry
+from .checker import Checker, CheckException
+from .fields import BaseRelationField, Field
+
+CollectionLoader = Callable[[str], Dict[str, Dict[str, Any]]]
+
+# collection, id, foreign id, foreign field, foreign field type, base message
+PendingRelation = Tuple[str, int, int, str, Field, str]
+
+
+def get_check_order(collections: Iterable[str]) -> List[str]:
+    """
+    Orders the given collections along the relation graph of the models: Starting
+    with the collection with the most relations, the collection with the most
+    relations to the already ordered collections is always taken next. This way,
+    collections are processed close to the collections they are related to, which
+    keeps the number of relations which have to be remembered between them small.
+    """
+    remaining = set(collections)
+    weights: Dict[str, Dict[str, int]] = {
+        collection: defaultdict(int) for collection in remaining
+    }
+    for collection in remaining:
+        for field in model_registry[collection]().get_relation_fields():
+            for target in field.to:
+                if target in remaining and target != collection:
+                    weights[collection][target] += 1
+                    weights[target][collection] += 1
+    order: List[str] = []
+    while remaining:
+        collection = max(
+            sorted(remaining),
+            key=lambda c: (
+                sum(weights[c][o] for o in order),
+                sum(weights[c].values()),
+            ),
+        )
+        order.append(collection)
+        remaining.remove(collection)
+    return order
+
+
+def compact(value: Any) -> Any:
+    """
+    Converts id lists into arrays, which need a fraction of the memory of lists.
+    """
+    if isinstance(value, list):
+        try:
+            return array("q", value)
+        except (TypeError, OverflowError):
+            return tuple(value)
+    return value
+
+
+class StreamingChecker(Checker):
+    """
+    Checks the data collection by collection without keeping all of it in memory.
+    The models of each collection are loaded with the given loader and released
+    again after they were checked. The ids of all collections have to be given in
+    advance to check the existence of models.
+
+    Reverse relations to collections which were already checked are verified with
+    an index of their relation fields, which only contains the compacted values and
+    is dropped as soon as all target collections of a field are checked. Reverse
+    relations to collections which were not loaded yet are remembered and verified
+    once the collection is loaded.
+    """
+
+    def __init__(
+        self,
+        loader: CollectionLoader,
+        ids: Dict[str, Set[int]],
+        migration_index: int,
+        mode: str = "all",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__({}, mode, **kwargs)
+        self.loader = loader
+        self.ids = ids
+        self.migration_index = migration_index
+        self.set_data({})
+        self.current_collection: Optional[str] = None
+        self.checked_collections: Set[str] = set()
+        self.index: Dict[Tuple[str, str], Dict[int, Any]] = {}
+        self.index_targets: Dict[Tuple[str, str], Set[str]] = {}
+        self.pending: Dict[str, List[PendingRelation]] = defaultdict(list)
+
+    def run_check(self) -> None:
+        self.check_migration_index()
+        self.check_collections()
+        for collection in get_check_order(self.allowed_collections):
+            start = perf_counter()
+            models = self.loader(collection)
+            self.set_data({collection: models})
+            self.check_json()
+            self.remove_fields(collection)
+            self.current_collection = collection
+            for id_, model in models.items():
+                if model["id"] != int(id_):
+                    self.errors.append(
+                        f"{collection}/{id_}: Id must be the same as model['id']"
+                    )
+                self.check_model(collection, model)
+            self.check_column_types(collection)
+            self.check_pending_relations(collection)
+            self.checked_collections.add(collection)
+            self.update_index(collection, models)
+            self.set_data({})
+            self.current_collection = None
+            self.timings[collection] = perf_counter() - start
+        if self.errors:
+            errors = [f"\t{error}" for error in self.errors]
+            raise CheckException("\n".join(errors))
+
+    def set_data(self, collections: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Only the given collections are kept in the data besides the migration index.
+        """
+        data: Dict[str, Any] = {"_migration_index": self.migration_index}
+        data.update(collections)
+        self.data = data
+        self.reverse_index = {}
+
+    def check_collections(self) -> None:
+        self.set_data({collection: {} for collection in self.ids})
+        super().check_collections()
+        self.set_data({})
+
+    def find_model(self, collection: str, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Models of other collections than the current one are not available, so only
+        a placeholder is returned for them if they exist.
+        """
+        if collection == self.current_collection:
+            return super().find_model(collection, id)
+        model_id = self.get_model_id(id)
+        if model_id in self.ids.get(collection, ()):
+            return {"id": model_id}
+        return None
+
+    def check_reverse_value(
+        self,
+        collection: str,
+        id: int,
+        foreign_collection: str,
+        foreign_id: int,
+        foreign_field: str,
+        foreign_field_type: Field,
+        basemsg: str,
+    ) -> None:
+        if foreign_collection == self.current_collection:
+            super().check_reverse_value(
+                collection,
+                id,
+                foreign_collection,
+                foreign_id,
+                foreign_field,
+                foreign_field_type,
+                basemsg,
+            )
+        elif foreign_collection in self.checked_collections:
+            foreign_value = self.index.get((foreign_collection, foreign_field), {}).get(
+                self.get_model_id(foreign_id)
+            )
+            self.check_foreign_value(
+                collection,
+                id,
+                foreign_collection,
+                foreign_id,
+                foreign_field,
+                foreign_field_type,
+                basemsg,
+                foreign_value,
+            )
+        else:
+            self.pending[foreign_collection].append(
+                (collection, id, foreign_id, foreign_field, foreign_field_type, basemsg)
+            )
+
+    def check_pending_relations(self, collection: str) -> None:
+        models = self.data[collection]
+        for (
+            other_collection,
+            id,
+            foreign_id,
+            foreign_field,
+            foreign_field_type,
+            basemsg,
+        ) in self.pending.pop(collection, []):
+            foreign_model = models.get(str(foreign_id))
+            self.check_foreign_value(
+                other_collection,
+                id,
+                collection,
+                foreign_id,
+                foreign_field,
+                foreign_field_type,
+                basemsg,
+                foreign_model.get(foreign_field) if foreign_model else None,
+            )
+
+    def update_index(self, collection: str, models: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Drops all indexed fields whose target collections are all checked now and
+        indexes the relation fields of the given collection which may still be
+        needed by collections which are not checked yet.
+        """
+        for key, targets in list(self.index_targets.items()):
+            targets.discard(collection)
+            if not targets:
+                del self.index_targets[key]
+                self.index.pop(key, None)
+        targets_per_field: Dict[str, Set[str]] = {}
+        for model in models.values():
+            for field, value in model.items():
+                if field not in targets_per_field:
+                    targets_per_field[field] = self.get_unchecked_targets(
+                        collection, field
+                    )
+                if targets_per_field[field] and value is not None:
+                    key = (collection, field)
+                    if key not in self.index:
+                        self.index[key] = {}
+                        self.index_targets[key] = set(targets_per_field[field])
+                    self.index[key][model["id"]] = compact(value)
+
+    def get_unchecked_targets(self, collection: str, field: str) -> Set[str]:
+        if self.is_template_field(field):
+            return set()
+        try:
+            field_type = self.get_type_from_collection(field, collection)
+        except (CheckException, ValueError):
+            return set()
+        if not isinstance(field_type, BaseRelationField):
+            return set()
+        return (
+            set(field_type.to) & set(self.allowed_collections)
+        ) - self.checked_collections
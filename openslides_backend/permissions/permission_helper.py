@@ -1,87 +1,46 @@
-from typing import List, cast
+from itertools import chain
+from typing import Iterable, List, cast
 
 from openslides_backend.models.models import User
 
-from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import DatastoreService
-from ..shared.exceptions import PermissionDenied
 from ..shared.patterns import fqid_from_collection_and_id
 from .management_levels import CommitteeManagementLevel, OrganizationManagementLevel
-from .permissions import Permission, permission_parents
+from .permission_resolver import get_permission_resolver
+from .permissions import Permission, permission_ancestors
 
 
 def has_perm(
     datastore: DatastoreService, user_id: int, permission: Permission, meeting_id: int
 ) -> bool:
-    # anonymous cannot be fetched from db
-    if user_id > 0:
-        user = datastore.get(
-            fqid_from_collection_and_id("user", user_id),
-            [
-                f"group_${meeting_id}_ids",
-                "organization_management_level",
-            ],
-            lock_result=False,
-        )
-    else:
-        user = {}
-
-    # superadmins have all permissions
-    if (
-        user.get("organization_management_level")
-        == OrganizationManagementLevel.SUPERADMIN
-    ):
-        return True
-
-    # get correct group ids for this user
-    if user.get(f"group_${meeting_id}_ids"):
-        group_ids = user[f"group_${meeting_id}_ids"]
-    else:
-        # anonymous users are in the default group
-        if user_id == 0:
-            meeting = datastore.get(
-                fqid_from_collection_and_id("meeting", meeting_id),
-                ["default_group_id", "enable_anonymous"],
-            )
-            # check if anonymous is allowed
-            if not meeting.get("enable_anonymous"):
-                raise PermissionDenied(
-                    f"Anonymous is not enabled for meeting {meeting_id}"
-                )
-            group_ids = [meeting["default_group_id"]]
-        else:
-            return False
-
-    gmr = GetManyRequest(
-        "group",
-        group_ids,
-        ["permissions", "admin_group_for_meeting_id"],
+    """
+    Checks whether the user has the given permission in the meeting. The group
+    permissions are resolved once per request, see PermissionResolver.
+    """
+    resolver = get_permission_resolver(datastore)
+    return is_implied_by_any(
+        permission, resolver.get_group_permissions(datastore, user_id, meeting_id)
     )
-    result = datastore.get_many([gmr])
-    for group in result["group"].values():
-        # admins implicitly have all permissions
-        if group.get("admin_group_for_meeting_id") == meeting_id:
-            return True
-        # check if the current group has the needed permission (or a higher one)
-        for group_permission in group.get("permissions", []):
-            if is_child_permission(permission, group_permission):
-                return True
-    return False
 
 
 def is_child_permission(child: Permission, parent: Permission) -> bool:
     """
-    Iterate the permission tree (represented in the permissions object) from child to
-    parent or until there are no parents anymore
+    Checks whether the parent permission implies the child permission with the help of
+    the precomputed closure of the permission tree.
     """
-    queue: List[Permission] = [child]
-    while queue:
-        current = queue.pop()
-        if current == parent:
-            return True
-        parents = permission_parents[current]
-        queue.extend(parents)
-    return False
+    return parent in permission_ancestors[child]
+
+
+def is_implied_by_any(
+    permission: Permission, permission_lists: Iterable[Iterable[Permission]]
+) -> bool:
+    """
+    Checks whether any permission of the given lists (e.g. the permissions of all
+    groups of a user) implies the given permission.
+    """
+    return not permission_ancestors[permission].isdisjoint(
+        chain.from_iterable(permission_lists)
+    )
 
 
 def has_organization_management_level(
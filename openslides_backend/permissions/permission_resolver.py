@@ -0,0 +1,177 @@
+import threading
+from typing import Dict, FrozenSet, List, Tuple
+from weakref import WeakKeyDictionary
+
+from ..services.datastore.commands import GetManyRequest
+from ..services.datastore.interface import CollectionFieldLock, DatastoreService
+from ..shared.exceptions import PermissionDenied
+from ..shared.patterns import FullQualifiedId, fqid_from_collection_and_id
+from .management_levels import OrganizationManagementLevel
+from .permissions import Permission, permission_descendants
+
+ALL_PERMISSIONS: FrozenSet[Permission] = frozenset(permission_descendants)
+
+# The permissions of each group of a user
+GroupPermissions = Tuple[FrozenSet[Permission], ...]
+
+
+class PermissionCacheEntry:
+    """
+    The group permissions of a user in a meeting together with the fqids of all
+    models they were computed from and the locks which were acquired while doing so.
+    """
+
+    def __init__(
+        self,
+        permissions: GroupPermissions,
+        fqids: List[FullQualifiedId],
+        locks: Dict[str, CollectionFieldLock],
+    ) -> None:
+        self.permissions = permissions
+        self.fqids = fqids
+        self.locks = locks
+
+
+class PermissionResolver:
+    """
+    Resolves the group permissions of users in meetings for a single datastore
+    instance, i.e. for a single request. The permissions of each user and meeting
+    are read once, so that every further check only compares them with the
+    precomputed ancestors of the permission, see is_implied_by_any.
+
+    Since the datastore may be reset between actions, the locks of the original
+    reads are re-applied whenever a cached result is used. Results are discarded as
+    soon as one of the underlying models was changed in the current request. After
+    a write or a failed write attempt, the resolver has to be reset together with
+    the datastore.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple[int, int], PermissionCacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_group_permissions(
+        self, datastore: DatastoreService, user_id: int, meeting_id: int
+    ) -> GroupPermissions:
+        """
+        Returns the permissions of every group of the user in the meeting. Admins
+        and superadmins get a single group with all permissions.
+        """
+        entry = self.entries.get((user_id, meeting_id))
+        if entry is not None and not any(
+            fqid in datastore.changed_models for fqid in entry.fqids
+        ):
+            self.hits += 1
+            self._apply_locks(datastore, entry.locks)
+            return entry.permissions
+        self.misses += 1
+        locked_fields = dict(datastore.locked_fields)
+        permissions, fqids = self._compute_permissions(datastore, user_id, meeting_id)
+        locks = {
+            key: lock
+            for key, lock in datastore.locked_fields.items()
+            if locked_fields.get(key) != lock
+        }
+        self.entries[(user_id, meeting_id)] = PermissionCacheEntry(
+            permissions, fqids, locks
+        )
+        return permissions
+
+    def reset(self) -> None:
+        self.entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _compute_permissions(
+        self, datastore: DatastoreService, user_id: int, meeting_id: int
+    ) -> Tuple[GroupPermissions, List[FullQualifiedId]]:
+        fqids: List[FullQualifiedId] = []
+        # anonymous cannot be fetched from db
+        if user_id > 0:
+            user_fqid = fqid_from_collection_and_id("user", user_id)
+            fqids.append(user_fqid)
+            user = datastore.get(
+                user_fqid,
+                [
+                    f"group_${meeting_id}_ids",
+                    "organization_management_level",
+                ],
+                lock_result=False,
+            )
+        else:
+            user = {}
+
+        # superadmins have all permissions
+        if (
+            user.get("organization_management_level")
+            == OrganizationManagementLevel.SUPERADMIN
+        ):
+            return (ALL_PERMISSIONS,), fqids
+
+        # get correct group ids for this user
+        if user.get(f"group_${meeting_id}_ids"):
+            group_ids = user[f"group_${meeting_id}_ids"]
+        else:
+            # anonymous users are in the default group
+            if user_id == 0:
+                meeting_fqid = fqid_from_collection_and_id("meeting", meeting_id)
+                fqids.append(meeting_fqid)
+                meeting = datastore.get(
+                    meeting_fqid,
+                    ["default_group_id", "enable_anonymous"],
+                )
+                # check if anonymous is allowed
+                if not meeting.get("enable_anonymous"):
+                    raise PermissionDenied(
+                        f"Anonymous is not enabled for meeting {meeting_id}"
+                    )
+                group_ids = [meeting["default_group_id"]]
+            else:
+                return (), fqids
+
+        fqids.extend(fqid_from_collection_and_id("group", id) for id in group_ids)
+        gmr = GetManyRequest(
+            "group",
+            group_ids,
+            ["permissions", "admin_group_for_meeting_id"],
+        )
+        with datastore.get_read_only_context():
+            result = datastore.get_many([gmr])
+        permissions: List[FrozenSet[Permission]] = []
+        for group in result["group"].values():
+            # admins implicitly have all permissions
+            if group.get("admin_group_for_meeting_id") == meeting_id:
+                return (ALL_PERMISSIONS,), fqids
+            permissions.append(frozenset(group.get("permissions", [])))
+        return tuple(permissions), fqids
+
+    def _apply_locks(
+        self, datastore: DatastoreService, locks: Dict[str, CollectionFieldLock]
+    ) -> None:
+        for key, lock in locks.items():
+            current = datastore.locked_fields.get(key)
+            if current is None:
+                datastore.locked_fields[key] = lock
+            elif isinstance(current, int) and isinstance(lock, int) and lock < current:
+                # keep the smaller position
+                datastore.locked_fields[key] = lock
+
+
+permission_resolvers: "WeakKeyDictionary[DatastoreService, PermissionResolver]" = (
+    WeakKeyDictionary()
+)
+permission_resolvers_lock = threading.Lock()
+
+
+def get_permission_resolver(datastore: DatastoreService) -> PermissionResolver:
+    """
+    Returns the permission resolver of the given datastore. Since a new datastore
+    instance is created for every request, the resolver lives as long as the request.
+    """
+    with permission_resolvers_lock:
+        resolver = permission_resolvers.get(datastore)
+        if resolver is None:
+            resolver = permission_resolvers[datastore] = PermissionResolver()
+        return resolver
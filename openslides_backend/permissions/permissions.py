@@ -1,7 +1,7 @@
 # Code generated. DO NOT EDIT.
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 from .base_classes import Permission
 
@@ -142,3 +142,151 @@ permission_parents: Dict[Permission, List[Permission]] = {
     _User.CAN_MANAGE_PRESENCE: [_User.CAN_MANAGE],
     _User.CAN_MANAGE: [],
 }
+# Holds each permission together with all permissions implying it.
+permission_ancestors: Dict[Permission, FrozenSet[Permission]] = {
+    _AgendaItem.CAN_SEE: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_SEE_INTERNAL: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_MANAGE: frozenset({_AgendaItem.CAN_MANAGE}),
+    _Assignment.CAN_SEE: frozenset(
+        {
+            _Assignment.CAN_MANAGE,
+            _Assignment.CAN_NOMINATE_OTHER,
+            _Assignment.CAN_NOMINATE_SELF,
+            _Assignment.CAN_SEE,
+        }
+    ),
+    _Assignment.CAN_NOMINATE_OTHER: frozenset(
+        {_Assignment.CAN_MANAGE, _Assignment.CAN_NOMINATE_OTHER}
+    ),
+    _Assignment.CAN_MANAGE: frozenset({_Assignment.CAN_MANAGE}),
+    _Assignment.CAN_NOMINATE_SELF: frozenset({_Assignment.CAN_NOMINATE_SELF}),
+    _Chat.CAN_MANAGE: frozenset({_Chat.CAN_MANAGE}),
+    _ListOfSpeakers.CAN_SEE: frozenset(
+        {
+            _ListOfSpeakers.CAN_BE_SPEAKER,
+            _ListOfSpeakers.CAN_MANAGE,
+            _ListOfSpeakers.CAN_SEE,
+        }
+    ),
+    _ListOfSpeakers.CAN_MANAGE: frozenset({_ListOfSpeakers.CAN_MANAGE}),
+    _ListOfSpeakers.CAN_BE_SPEAKER: frozenset({_ListOfSpeakers.CAN_BE_SPEAKER}),
+    _Mediafile.CAN_SEE: frozenset({_Mediafile.CAN_MANAGE, _Mediafile.CAN_SEE}),
+    _Mediafile.CAN_MANAGE: frozenset({_Mediafile.CAN_MANAGE}),
+    _Meeting.CAN_MANAGE_SETTINGS: frozenset({_Meeting.CAN_MANAGE_SETTINGS}),
+    _Meeting.CAN_MANAGE_LOGOS_AND_FONTS: frozenset(
+        {_Meeting.CAN_MANAGE_LOGOS_AND_FONTS}
+    ),
+    _Meeting.CAN_SEE_FRONTPAGE: frozenset({_Meeting.CAN_SEE_FRONTPAGE}),
+    _Meeting.CAN_SEE_AUTOPILOT: frozenset({_Meeting.CAN_SEE_AUTOPILOT}),
+    _Meeting.CAN_SEE_LIVESTREAM: frozenset({_Meeting.CAN_SEE_LIVESTREAM}),
+    _Meeting.CAN_SEE_HISTORY: frozenset({_Meeting.CAN_SEE_HISTORY}),
+    _Motion.CAN_SEE: frozenset(
+        {
+            _Motion.CAN_CREATE,
+            _Motion.CAN_CREATE_AMENDMENTS,
+            _Motion.CAN_FORWARD,
+            _Motion.CAN_MANAGE,
+            _Motion.CAN_MANAGE_METADATA,
+            _Motion.CAN_MANAGE_POLLS,
+            _Motion.CAN_SEE,
+            _Motion.CAN_SEE_INTERNAL,
+            _Motion.CAN_SUPPORT,
+        }
+    ),
+    _Motion.CAN_MANAGE_METADATA: frozenset(
+        {_Motion.CAN_MANAGE, _Motion.CAN_MANAGE_METADATA}
+    ),
+    _Motion.CAN_MANAGE_POLLS: frozenset({_Motion.CAN_MANAGE, _Motion.CAN_MANAGE_POLLS}),
+    _Motion.CAN_SEE_INTERNAL: frozenset({_Motion.CAN_MANAGE, _Motion.CAN_SEE_INTERNAL}),
+    _Motion.CAN_CREATE: frozenset({_Motion.CAN_CREATE, _Motion.CAN_MANAGE}),
+    _Motion.CAN_CREATE_AMENDMENTS: frozenset(
+        {_Motion.CAN_CREATE_AMENDMENTS, _Motion.CAN_MANAGE}
+    ),
+    _Motion.CAN_FORWARD: frozenset({_Motion.CAN_FORWARD, _Motion.CAN_MANAGE}),
+    _Motion.CAN_MANAGE: frozenset({_Motion.CAN_MANAGE}),
+    _Motion.CAN_SUPPORT: frozenset({_Motion.CAN_SUPPORT}),
+    _Poll.CAN_MANAGE: frozenset({_Poll.CAN_MANAGE}),
+    _Projector.CAN_SEE: frozenset({_Projector.CAN_MANAGE, _Projector.CAN_SEE}),
+    _Projector.CAN_MANAGE: frozenset({_Projector.CAN_MANAGE}),
+    _Tag.CAN_MANAGE: frozenset({_Tag.CAN_MANAGE}),
+    _User.CAN_SEE: frozenset(
+        {_User.CAN_MANAGE, _User.CAN_MANAGE_PRESENCE, _User.CAN_SEE}
+    ),
+    _User.CAN_MANAGE_PRESENCE: frozenset({_User.CAN_MANAGE, _User.CAN_MANAGE_PRESENCE}),
+    _User.CAN_MANAGE: frozenset({_User.CAN_MANAGE}),
+}
+# Holds each permission together with all permissions implied by it.
+permission_descendants: Dict[Permission, FrozenSet[Permission]] = {
+    _AgendaItem.CAN_SEE: frozenset({_AgendaItem.CAN_SEE}),
+    _AgendaItem.CAN_SEE_INTERNAL: frozenset(
+        {_AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _AgendaItem.CAN_MANAGE: frozenset(
+        {_AgendaItem.CAN_MANAGE, _AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL}
+    ),
+    _Assignment.CAN_SEE: frozenset({_Assignment.CAN_SEE}),
+    _Assignment.CAN_NOMINATE_OTHER: frozenset(
+        {_Assignment.CAN_NOMINATE_OTHER, _Assignment.CAN_SEE}
+    ),
+    _Assignment.CAN_MANAGE: frozenset(
+        {_Assignment.CAN_MANAGE, _Assignment.CAN_NOMINATE_OTHER, _Assignment.CAN_SEE}
+    ),
+    _Assignment.CAN_NOMINATE_SELF: frozenset(
+        {_Assignment.CAN_NOMINATE_SELF, _Assignment.CAN_SEE}
+    ),
+    _Chat.CAN_MANAGE: frozenset({_Chat.CAN_MANAGE}),
+    _ListOfSpeakers.CAN_SEE: frozenset({_ListOfSpeakers.CAN_SEE}),
+    _ListOfSpeakers.CAN_MANAGE: frozenset(
+        {_ListOfSpeakers.CAN_MANAGE, _ListOfSpeakers.CAN_SEE}
+    ),
+    _ListOfSpeakers.CAN_BE_SPEAKER: frozenset(
+        {_ListOfSpeakers.CAN_BE_SPEAKER, _ListOfSpeakers.CAN_SEE}
+    ),
+    _Mediafile.CAN_SEE: frozenset({_Mediafile.CAN_SEE}),
+    _Mediafile.CAN_MANAGE: frozenset({_Mediafile.CAN_MANAGE, _Mediafile.CAN_SEE}),
+    _Meeting.CAN_MANAGE_SETTINGS: frozenset({_Meeting.CAN_MANAGE_SETTINGS}),
+    _Meeting.CAN_MANAGE_LOGOS_AND_FONTS: frozenset(
+        {_Meeting.CAN_MANAGE_LOGOS_AND_FONTS}
+    ),
+    _Meeting.CAN_SEE_FRONTPAGE: frozenset({_Meeting.CAN_SEE_FRONTPAGE}),
+    _Meeting.CAN_SEE_AUTOPILOT: frozenset({_Meeting.CAN_SEE_AUTOPILOT}),
+    _Meeting.CAN_SEE_LIVESTREAM: frozenset({_Meeting.CAN_SEE_LIVESTREAM}),
+    _Meeting.CAN_SEE_HISTORY: frozenset({_Meeting.CAN_SEE_HISTORY}),
+    _Motion.CAN_SEE: frozenset({_Motion.CAN_SEE}),
+    _Motion.CAN_MANAGE_METADATA: frozenset(
+        {_Motion.CAN_MANAGE_METADATA, _Motion.CAN_SEE}
+    ),
+    _Motion.CAN_MANAGE_POLLS: frozenset({_Motion.CAN_MANAGE_POLLS, _Motion.CAN_SEE}),
+    _Motion.CAN_SEE_INTERNAL: frozenset({_Motion.CAN_SEE, _Motion.CAN_SEE_INTERNAL}),
+    _Motion.CAN_CREATE: frozenset({_Motion.CAN_CREATE, _Motion.CAN_SEE}),
+    _Motion.CAN_CREATE_AMENDMENTS: frozenset(
+        {_Motion.CAN_CREATE_AMENDMENTS, _Motion.CAN_SEE}
+    ),
+    _Motion.CAN_FORWARD: frozenset({_Motion.CAN_FORWARD, _Motion.CAN_SEE}),
+    _Motion.CAN_MANAGE: frozenset(
+        {
+            _Motion.CAN_CREATE,
+            _Motion.CAN_CREATE_AMENDMENTS,
+            _Motion.CAN_FORWARD,
+            _Motion.CAN_MANAGE,
+            _Motion.CAN_MANAGE_METADATA,
+            _Motion.CAN_MANAGE_POLLS,
+            _Motion.CAN_SEE,
+            _Motion.CAN_SEE_INTERNAL,
+        }
+    ),
+    _Motion.CAN_SUPPORT: frozenset({_Motion.CAN_SEE, _Motion.CAN_SUPPORT}),
+    _Poll.CAN_MANAGE: frozenset({_Poll.CAN_MANAGE}),
+    _Projector.CAN_SEE: frozenset({_Projector.CAN_SEE}),
+    _Projector.CAN_MANAGE: frozenset({_Projector.CAN_MANAGE, _Projector.CAN_SEE}),
+    _Tag.CAN_MANAGE: frozenset({_Tag.CAN_MANAGE}),
+    _User.CAN_SEE: frozenset({_User.CAN_SEE}),
+    _User.CAN_MANAGE_PRESENCE: frozenset({_User.CAN_MANAGE_PRESENCE, _User.CAN_SEE}),
+    _User.CAN_MANAGE: frozenset(
+        {_User.CAN_MANAGE, _User.CAN_MANAGE_PRESENCE, _User.CAN_SEE}
+    ),
+}
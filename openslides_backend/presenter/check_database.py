@@ -1,17 +1,29 @@
-from typing import Any, Dict, List
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import fastjsonschema
 from datastore.shared.util import DeletedModelsBehaviour
 
-from ..action.actions.meeting.export_helper import export_meeting
+from ..action.actions.meeting.export_helper import (
+    ExportFetcher,
+    export_meeting,
+    get_meeting_position,
+)
 from ..models.checker import Checker, CheckException
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
 from ..shared.exceptions import PermissionDenied
+from ..shared.json_stream import StreamedDict
 from ..shared.schema import optional_id_schema, schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
 
+CHECK_PROCESSES = min(4, os.cpu_count() or 1)
+
 check_database_schema = fastjsonschema.compile(
     {
         "$schema": schema_version,
@@ -20,6 +32,8 @@ check_database_schema = fastjsonschema.compile(
         "description": "check database",
         "properties": {
             "meeting_id": optional_id_schema,
+            "incremental": {"type": "boolean"},
+            "stream": {"type": "boolean"},
         },
         "required": [],
         "additionalProperties": False,
@@ -27,10 +41,94 @@ check_database_schema = fastjsonschema.compile(
 )
 
 
+class CleanChecks:
+    """
+    Remembers the position up to which each meeting was last checked without errors.
+    In incremental mode, meetings whose export did not advance beyond this position
+    are not checked again, so that an interrupted check of all meetings can be
+    resumed. The positions are only kept in the memory of the current process, so
+    they are not shared between the gunicorn workers: A request which is handled by
+    another worker checks all meetings again.
+    """
+
+    def __init__(self) -> None:
+        self.positions: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    def is_clean(self, meeting_id: int, position: int) -> bool:
+        with self.lock:
+            return self.positions.get(meeting_id, -1) >= position
+
+    def set_clean(self, meeting_id: int, position: int) -> None:
+        with self.lock:
+            self.positions[meeting_id] = position
+
+    def discard(self, meeting_id: int) -> None:
+        with self.lock:
+            self.positions.pop(meeting_id, None)
+
+
+clean_checks = CleanChecks()
+
+executor: Optional[ProcessPoolExecutor] = None
+executor_lock = threading.Lock()
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """
+    Returns the process pool of the current worker process. It is created on first
+    use and kept for further requests, since every spawned process has to import
+    the backend.
+    """
+    global executor
+    with executor_lock:
+        if executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=CHECK_PROCESSES, mp_context=get_context("spawn")
+            )
+        return executor
+
+
+def check_meeting(export: Dict[str, Any]) -> Optional[str]:
+    """
+    Checks the export of a single meeting and returns the error message, if any.
+    This runs in the worker processes and must therefore be a module level function.
+    """
+    checker = Checker(
+        data=export,
+        mode="internal",
+        repair=True,
+        fields_to_remove={
+            "motion": [
+                "origin_id",
+                "derived_motion_ids",
+                "all_origin_id",
+                "all_derived_motion_ids",
+            ]
+        },
+    )
+    try:
+        checker.run_check()
+    except CheckException as ce:
+        return str(ce)
+    return None
+
+
+def completed(result: Optional[str]) -> "Future[Optional[str]]":
+    future: "Future[Optional[str]]" = Future()
+    future.set_result(result)
+    return future
+
+
 @register_presenter("check_database")
 class CheckDatabase(BasePresenter):
     """Check Database gets all non-deleted meetings, exports them,
-    and check them with the checker."""
+    and check them with the checker.
+
+    The meetings are exported one after another while the checks run in a process
+    pool. With stream set, the result of every meeting is sent as soon as it is
+    available. With incremental set, meetings which were checked without errors
+    before and did not change since are skipped."""
 
     schema = check_database_schema
 
@@ -47,30 +145,87 @@ class CheckDatabase(BasePresenter):
             meeting_ids = [self.data["meeting_id"]]
         else:
             meeting_ids = self.get_all_meeting_ids()
-        errors: Dict[int, str] = {}
-        for meeting_id in meeting_ids:
-            export = export_meeting(self.datastore, meeting_id)
-            checker = Checker(
-                data=export,
-                mode="internal",
-                repair=True,
-                fields_to_remove={
-                    "motion": [
-                        "origin_id",
-                        "derived_motion_ids",
-                        "all_origin_id",
-                        "all_derived_motion_ids",
-                    ]
-                },
-            )
-            try:
-                checker.run_check()
-            except CheckException as ce:
-                errors[meeting_id] = str(ce)
+        if self.data.get("stream"):
+            return StreamedDict(lambda: self.stream_results(meeting_ids))
+        errors: Dict[int, str] = {
+            meeting_id: error
+            for meeting_id, error in self.check_meetings(meeting_ids)
+            if error is not None
+        }
         if not errors:
             return {"ok": True, "errors": ""}
         return {"ok": False, "errors": self.gen_error_message(errors)}
 
+    def stream_results(self, meeting_ids: List[int]) -> Iterator[Tuple[str, Any]]:
+        errors: Dict[int, str] = {}
+
+        def get_meeting_results() -> Iterator[Tuple[str, Any]]:
+            for meeting_id, error in self.check_meetings(meeting_ids):
+                if error is not None:
+                    errors[meeting_id] = error
+                yield str(meeting_id), {"ok": error is None, "errors": error or ""}
+
+        # the response is sent after the presenter handler is done
+        with self.datastore.get_database_context():
+            yield "meetings", StreamedDict(get_meeting_results)
+        yield "ok", not errors
+        yield "errors", self.gen_error_message(errors)
+
+    def check_meetings(
+        self, meeting_ids: List[int]
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """
+        Exports and checks the given meetings and yields the error message of every
+        meeting in the given order. At most CHECK_PROCESSES checks are pending at the
+        same time, so that only few exports have to be kept in memory.
+        """
+        pool: Optional[ProcessPoolExecutor] = None
+        if len(meeting_ids) > 1 and CHECK_PROCESSES > 1:
+            pool = get_executor()
+        pending: Deque[Tuple[int, int, "Future[Optional[str]]"]] = deque()
+        try:
+            for meeting_id in meeting_ids:
+                if self.data.get("incremental"):
+                    position = get_meeting_position(self.datastore, meeting_id)
+                    if clean_checks.is_clean(meeting_id, position):
+                        pending.append((meeting_id, position, completed(None)))
+                        yield from self.get_done_results(pending)
+                        continue
+                fetcher = ExportFetcher(self.datastore)
+                export = export_meeting(self.datastore, meeting_id, fetcher)
+                self.logger.debug(
+                    f"Export of meeting {meeting_id} fetched: "
+                    + fetcher.format_timings()
+                )
+                if pool:
+                    future = pool.submit(check_meeting, export)
+                else:
+                    future = completed(check_meeting(export))
+                del export
+                pending.append((meeting_id, fetcher.position, future))
+                yield from self.get_done_results(pending)
+            while pending:
+                yield self.get_check_result(*pending.popleft())
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+    def get_done_results(
+        self, pending: Deque[Tuple[int, int, "Future[Optional[str]]"]]
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        while len(pending) > CHECK_PROCESSES or (pending and pending[0][2].done()):
+            yield self.get_check_result(*pending.popleft())
+
+    def get_check_result(
+        self, meeting_id: int, position: int, future: "Future[Optional[str]]"
+    ) -> Tuple[int, Optional[str]]:
+        error = future.result()
+        if error is None:
+            clean_checks.set_clean(meeting_id, position)
+        else:
+            clean_checks.discard(meeting_id)
+        return meeting_id, error
+
     def get_all_meeting_ids(self) -> List[int]:
         meetings = self.datastore.get_all(
             "meeting", ["id"], DeletedModelsBehaviour.NO_DELETED
@@ -1,14 +1,16 @@
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 import fastjsonschema
 from datastore.shared.util import strip_reserved_fields
 
 from openslides_backend.migrations import get_backend_migration_index
 
-from ..models.checker import Checker, CheckException
+from ..models.base import model_registry
+from ..models.checker import CheckException
+from ..models.streaming_checker import StreamingChecker
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
-from ..shared.exceptions import PermissionDenied
+from ..shared.exceptions import PermissionDenied, PresenterException
 from ..shared.schema import schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
@@ -26,8 +28,15 @@ check_database_schema = fastjsonschema.compile(
 
 @register_presenter("check_database_all")
 class CheckDatabaseAll(BasePresenter):
-    """Check Database All gets all non-deleted meetings, exports them,
-    and check them with the checker."""
+    """Check Database All checks all non-deleted models with the checker. The
+    collections are loaded and checked one by one, so that the whole datastore does
+    not have to be kept in memory.
+
+    All reads happen in the single database context of the presenter handler. Since
+    a collection is read after others were already checked, every loaded collection
+    is additionally compared with the ids and the highest meta_position read at the
+    start, so that a write between two reads fails the check instead of reporting
+    relation errors which do not exist."""
 
     schema = check_database_schema
 
@@ -40,9 +49,12 @@ class CheckDatabaseAll(BasePresenter):
             msg += f" Missing permission: {OrganizationManagementLevel.SUPERADMIN}"
             raise PermissionDenied(msg)
 
-        export = self.get_everything()
-        checker = Checker(
-            data=export,
+        self.position = 0
+        ids = self.get_ids()
+        checker = StreamingChecker(
+            loader=lambda collection: self.load_collection(collection, ids),
+            ids=ids,
+            migration_index=get_backend_migration_index(),
             mode="all",
         )
         try:
@@ -51,15 +63,45 @@ class CheckDatabaseAll(BasePresenter):
         except CheckException as ce:
             return {"ok": False, "errors": str(ce)}
 
-    def get_everything(self) -> Dict[str, Any]:
-        everything = self.datastore.get_everything()
-        export: Dict[str, Any] = {
-            collection: self.remove_meta_fields(everything[collection])
-            for collection in everything
-            if collection != "action_worker"
-        }
-        export["_migration_index"] = get_backend_migration_index()
-        return export
+    def get_ids(self) -> Dict[str, Set[int]]:
+        """
+        Returns the ids of all existing models per collection. Collections without
+        models are omitted.
+        """
+        ids: Dict[str, Set[int]] = {}
+        for collection in model_registry:
+            if collection == "action_worker":
+                continue
+            models = self.datastore.get_all(
+                collection, ["id", "meta_position"], lock_result=False
+            )
+            if models:
+                ids[collection] = set(models)
+                self.update_position(models)
+        return ids
+
+    def load_collection(
+        self, collection: str, ids: Dict[str, Set[int]]
+    ) -> Dict[str, Any]:
+        if collection not in ids:
+            return {}
+        models = self.datastore.get_all(collection, [], lock_result=False)
+        if set(models) != ids[collection] or self.update_position(models):
+            raise PresenterException(
+                "The datastore was changed during the check. Please try again."
+            )
+        return self.remove_meta_fields(models)
+
+    def update_position(self, models: Dict[int, Any]) -> bool:
+        """
+        Raises the position to the highest meta_position of the given models and
+        returns whether it was raised.
+        """
+        position = max(model.get("meta_position", 0) for model in models.values())
+        if position > self.position:
+            self.position = position
+            return True
+        return False
 
     def remove_meta_fields(self, res: Dict[int, Any]) -> Dict[str, Any]:
         dict_without_meta_fields = {}
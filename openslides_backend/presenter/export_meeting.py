@@ -1,11 +1,16 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
 import fastjsonschema
 
-from ..action.actions.meeting.export_helper import export_meeting
+from ..action.actions.meeting.export_helper import (
+    ExportFetcher,
+    export_meeting_collections,
+)
 from ..permissions.management_levels import OrganizationManagementLevel
 from ..permissions.permission_helper import has_organization_management_level
 from ..shared.exceptions import PermissionDenied
+from ..shared.json_stream import StreamedDict
+from ..shared.patterns import fqid_from_collection_and_id
 from ..shared.schema import required_id_schema, schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
@@ -40,18 +45,39 @@ class Export(BasePresenter):
             msg = "You are not allowed to perform presenter export_meeting."
             msg += f" Missing permission: {OrganizationManagementLevel.SUPERADMIN}"
             raise PermissionDenied(msg)
-        export_data = export_meeting(self.datastore, self.data["meeting_id"])
-        self.exclude_organization_tags_and_default_meeting_for_committee(export_data)
-        return export_data
+        # make sure the meeting exists before the response is started
+        self.datastore.get(
+            fqid_from_collection_and_id("meeting", self.data["meeting_id"]),
+            ["id"],
+            lock_result=False,
+        )
+        return StreamedDict(self.get_collections)
 
-    def exclude_organization_tags_and_default_meeting_for_committee(
-        self, export_data: Dict[str, Any]
-    ) -> None:
-        self.get_meeting_from_json(export_data).pop("organization_tag_ids", None)
-        self.get_meeting_from_json(export_data).pop(
-            "default_meeting_for_committee_id", None
+    def get_collections(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the exported collections one by one while the response is sent. Since
+        this happens after the presenter handler is done, the database context has to
+        be opened here again.
+        """
+        fetcher = ExportFetcher(self.datastore)
+        with self.datastore.get_database_context():
+            with self.datastore.get_read_only_context():
+                for collection, models in export_meeting_collections(
+                    self.datastore, self.data["meeting_id"], fetcher
+                ):
+                    if collection == "meeting":
+                        self.exclude_organization_tags_and_default_meeting_for_committee(
+                            models
+                        )
+                    yield collection, models
+        self.logger.debug(
+            f"Export of meeting {self.data['meeting_id']} fetched: "
+            + fetcher.format_timings()
         )
 
-    def get_meeting_from_json(self, export_data: Any) -> Any:
-        key = next(iter(export_data["meeting"]))
-        return export_data["meeting"][key]
+    def exclude_organization_tags_and_default_meeting_for_committee(
+        self, meetings: Dict[str, Any]
+    ) -> None:
+        meeting = next(iter(meetings.values()))
+        meeting.pop("organization_tag_ids", None)
+        meeting.pop("default_meeting_for_committee_id", None)
@@ -1,7 +1,7 @@
 from collections import defaultdict
+from contextlib import nullcontext
 from typing import Any, ContextManager, Dict, List, Optional, Sequence, Set, Union
 
-import simplejson as json
 from datastore.reader.core import (
     AggregateRequest,
     FilterRequest,
@@ -16,8 +16,8 @@ from datastore.reader.core import (
 from datastore.shared.di import injector
 from datastore.shared.services.read_database import HistoryInformation
 from datastore.shared.util import DeletedModelsBehaviour
-from simplejson.errors import JSONDecodeError
 
+from ...shared import json_codec
 from ...shared.exceptions import DatastoreException
 from ...shared.filters import And, Filter, FilterOperator, filter_visitor
 from ...shared.interfaces.collection_field_lock import (
@@ -70,8 +70,8 @@ class DatastoreAdapter(BaseDatastoreService):
         content, status_code = self.engine.retrieve(command.name, command.data)
         if len(content):
             try:
-                payload = json.loads(content)
-            except JSONDecodeError:
+                payload = json_codec.loads(content)
+            except json_codec.JSONDecodeError:
                 error_message = "Bad response from datastore service. Body does not contain valid JSON."
                 self.logger.error(error_message + f" Received: {str(content)}")
                 raise DatastoreException(error_message)
@@ -90,6 +90,10 @@ class DatastoreAdapter(BaseDatastoreService):
     def get_database_context(self) -> ContextManager[None]:
         return self.reader.get_database_context()
 
+    def get_read_only_context(self) -> ContextManager[None]:
+        # results are never cached, so there is nothing to skip
+        return nullcontext()
+
     @handle_datastore_errors
     def get(
         self,
@@ -1,11 +1,13 @@
 from collections import defaultdict
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Set, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from datastore.shared.util import DeletedModelsBehaviour
 
+from ...shared.exceptions import DatastoreLockedException
 from ...shared.interfaces.env import Env
 from ...shared.interfaces.logging import LoggingModule
+from ...shared.interfaces.write_request import WriteRequest
 from ...shared.patterns import (
     Collection,
     FullQualifiedId,
@@ -14,19 +16,50 @@ from ...shared.patterns import (
     id_from_fqid,
 )
 from ...shared.typing import ModelMap
+from ...shared.util import copy_json
 from .adapter import DatastoreAdapter
 from .commands import GetManyRequest
 from .interface import Engine, LockResult, MappedFieldsPerFqid, PartialModel
+from .shared_cache import SharedModelCache
 
 
 class CacheDatastoreAdapter(DatastoreAdapter):
+    """
+    Caches all locked reads for the duration of a request. If a shared model cache
+    is given, reads are additionally served from and stored in it across requests.
+
+    Values are copied when they are put into or taken out of a cache, so that the
+    caller may modify the result without altering the cache. Data which is read
+    from the datastore and not cached is returned as is. Inside the read only
+    context, no copies are made at all.
+    """
+
     cached_models: ModelMap
     cached_missing_fields: Dict[FullQualifiedId, Set[str]]
+    shared_cache: Optional[SharedModelCache]
+    read_only: bool
 
-    def __init__(self, engine: Engine, logging: LoggingModule, env: Env) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        logging: LoggingModule,
+        env: Env,
+        shared_cache: Optional[SharedModelCache] = None,
+    ) -> None:
         super().__init__(engine, logging, env)
         self.cached_models = defaultdict(dict)
         self.cached_missing_fields = defaultdict(set)
+        self.shared_cache = shared_cache
+        self.read_only = False
+
+    @contextmanager
+    def get_read_only_context(self) -> Iterator[None]:
+        previous = self.read_only
+        self.read_only = True
+        try:
+            yield
+        finally:
+            self.read_only = previous
 
     def get(
         self,
@@ -53,15 +86,21 @@ class CacheDatastoreAdapter(DatastoreAdapter):
         cached_model = results[collection_from_fqid(fqid)][id_from_fqid(fqid)]
         if not missing_fields_per_fqid:
             # nothing to do, we've got the full model
-            return deepcopy(cached_model)
+            return cached_model
 
-        result = super().get(
-            fqid, missing_fields_per_fqid[fqid], lock_result=lock_result
-        )
+        missing_fields = missing_fields_per_fqid[fqid]
+        result = self._get_from_shared_cache(fqid, missing_fields, lock_result)
+        if result is None:
+            result = super().get(
+                fqid,
+                self._add_position_field(missing_fields, lock_result),
+                lock_result=lock_result,
+            )
+            self._update_shared_cache(fqid, result, missing_fields, lock_result)
         if lock_result:
-            self._update_cache(fqid, result, missing_fields_per_fqid[fqid])
+            self._update_cache(fqid, result, missing_fields)
         result.update(cached_model)
-        return deepcopy(result)
+        return result
 
     def get_many(
         self,
@@ -98,7 +137,30 @@ class CacheDatastoreAdapter(DatastoreAdapter):
                     if lock_result:
                         fqid = fqid_from_collection_and_id(collection, id)
                         self._update_cache(fqid, model, missing_fields_per_fqid[fqid])
-        return deepcopy(results)
+        return results
+
+    def write(self, write_requests: Union[List[WriteRequest], WriteRequest]) -> None:
+        if not self.shared_cache:
+            return super().write(write_requests)
+        if isinstance(write_requests, WriteRequest):
+            write_requests = [write_requests]
+        try:
+            super().write(write_requests)
+        except DatastoreLockedException:
+            # some cached models may be outdated, so they have to be read again
+            self.shared_cache.invalidate_keys(
+                key for request in write_requests for key in request.locked_fields
+            )
+            raise
+        finally:
+            self.shared_cache.invalidate(
+                event["fqid"] for request in write_requests for event in request.events
+            )
+
+    def truncate_db(self) -> None:
+        super().truncate_db()
+        if self.shared_cache:
+            self.shared_cache.clear()
 
     def reset(self, hard: bool = True) -> None:
         super().reset()
@@ -124,7 +186,7 @@ class CacheDatastoreAdapter(DatastoreAdapter):
                         if field in self.cached_models[fqid]:
                             results[collection_from_fqid(fqid)][id_from_fqid(fqid)][
                                 field
-                            ] = self.cached_models[fqid][field]
+                            ] = self._copy(self.cached_models[fqid][field])
                         elif field not in self.cached_missing_fields[fqid]:
                             missing_fields_per_fqid[fqid].append(field)
                 else:
@@ -146,18 +208,91 @@ class CacheDatastoreAdapter(DatastoreAdapter):
     def _fetch_missing_fields_from_datastore_for_cache(
         self, missing_fields_per_fqid: MappedFieldsPerFqid, lock_result: bool
     ) -> Dict[Collection, Dict[int, PartialModel]]:
-        get_many_requests = [
-            GetManyRequest(collection_from_fqid(fqid), [id_from_fqid(fqid)], fields)
-            for fqid, fields in missing_fields_per_fqid.items()
-        ]
-        results = super().get_many(get_many_requests, lock_result=lock_result)
+        results: Dict[Collection, Dict[int, PartialModel]] = defaultdict(dict)
+        get_many_requests = []
+        for fqid, fields in missing_fields_per_fqid.items():
+            collection = collection_from_fqid(fqid)
+            id = id_from_fqid(fqid)
+            cached_model = self._get_from_shared_cache(fqid, fields, lock_result)
+            if cached_model is not None:
+                results[collection][id] = cached_model
+            else:
+                get_many_requests.append(
+                    GetManyRequest(
+                        collection, [id], self._add_position_field(fields, lock_result)
+                    )
+                )
+        if get_many_requests:
+            db_results = super().get_many(get_many_requests, lock_result=lock_result)
+            for collection, models in db_results.items():
+                for id, model in models.items():
+                    fqid = fqid_from_collection_and_id(collection, id)
+                    self._update_shared_cache(
+                        fqid, model, missing_fields_per_fqid[fqid], lock_result
+                    )
+                    results[collection][id] = model
         return results
 
+    def _get_from_shared_cache(
+        self, fqid: FullQualifiedId, mapped_fields: List[str], lock_result: LockResult
+    ) -> Optional[PartialModel]:
+        """
+        Returns the model from the shared cache if all mapped fields are cached and
+        locks them at the cached position.
+        """
+        if not self.shared_cache or not mapped_fields:
+            return None
+        cached = self.shared_cache.get(fqid, mapped_fields)
+        if cached is None:
+            return None
+        position, model = cached
+        model = self._copy(model)
+        if lock_result:
+            model["meta_position"] = position
+            locked_fields = (
+                lock_result if isinstance(lock_result, list) else mapped_fields
+            )
+            self.update_locked_fields_from_mapped_fields(
+                fqid, position, set(locked_fields)
+            )
+        return model
+
+    def _add_position_field(
+        self, mapped_fields: List[str], lock_result: LockResult
+    ) -> List[str]:
+        """
+        Unlocked reads do not fetch the meta_position by default, but it is needed to
+        store the result in the shared cache.
+        """
+        if self.shared_cache and mapped_fields and not lock_result:
+            return mapped_fields + ["meta_position"]
+        return mapped_fields
+
+    def _update_shared_cache(
+        self,
+        fqid: FullQualifiedId,
+        model: PartialModel,
+        mapped_fields: List[str],
+        lock_result: LockResult,
+    ) -> None:
+        if not self.shared_cache or not mapped_fields:
+            return
+        position = model.get("meta_position")
+        if isinstance(position, int):
+            self.shared_cache.update(fqid, position, self._copy(model), mapped_fields)
+        if not lock_result and "meta_position" not in mapped_fields:
+            model.pop("meta_position", None)
+
     def _update_cache(
         self, fqid: FullQualifiedId, model: Dict[str, Any], missing_fields: List[str]
     ) -> None:
         for field in missing_fields:
             if field in model:
-                self.cached_models[fqid][field] = model[field]
+                self.cached_models[fqid][field] = self._copy(model[field])
             else:
                 self.cached_missing_fields[fqid].add(field)
+
+    def _copy(self, value: Any) -> Any:
+        if self.read_only:
+            return value
+        return copy_json(value)
@@ -1,7 +1,6 @@
 from typing import Any, Dict, List, Optional, Set, Union
 
-import simplejson as json
-
+from ...shared import json_codec
 from ...shared.filters import _FilterBase as FilterInterface
 from ...shared.interfaces.write_request import WriteRequest
 from ...shared.patterns import Collection
@@ -64,8 +63,8 @@ class Command:
         ).lstrip("_")
 
     @property
-    def data(self) -> Optional[str]:
-        return json.dumps(self.get_raw_data())
+    def data(self) -> Optional[bytes]:
+        return json_codec.dumps(self.get_raw_data())
 
     def get_raw_data(self) -> CommandData:
         raise NotImplementedError()
@@ -98,16 +97,17 @@ class Write(Command):
         self.write_requests = write_requests
 
     @property
-    def data(self) -> str:
-        class WriteRequestJSONEncoder(json.JSONEncoder):
-            def default(self, o: Any) -> Any:
-                if isinstance(o, WriteRequest):
-                    return o.__dict__
-                if isinstance(o, FilterInterface):
-                    return o.to_dict()
-                return super().default(o)
-
-        return json.dumps(self.write_requests, cls=WriteRequestJSONEncoder)
+    def data(self) -> bytes:
+        def encode_write_request(o: Any) -> Any:
+            if isinstance(o, WriteRequest):
+                return o.__dict__
+            if isinstance(o, FilterInterface):
+                return o.to_dict()
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+
+        return json_codec.dumps(self.write_requests, encode_write_request)
 
 
 class WriteActionWorker(Write):
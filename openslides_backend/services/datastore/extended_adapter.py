@@ -1,7 +1,6 @@
 import builtins
 import re
 from collections import defaultdict
-from copy import deepcopy
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from datastore.shared.postgresql_backend import SqlQueryHelper
@@ -19,10 +18,12 @@ from ...shared.patterns import (
     id_from_fqid,
 )
 from ...shared.typing import DeletedModel, ModelMap
+from ...shared.util import copy_json
 from .cache_adapter import CacheDatastoreAdapter
 from .commands import GetManyRequest
 from .handle_datastore_errors import raise_datastore_error
 from .interface import Engine, LockResult, MappedFieldsPerFqid, PartialModel
+from .shared_cache import SharedModelCache
 
 MODEL_FIELD_SQL = "data->>%s"
 MODEL_FIELD_NUMERIC_SQL = r"\(data->%s\)::numeric"
@@ -67,8 +68,14 @@ class ExtendedDatastoreAdapter(CacheDatastoreAdapter):
 
     changed_models: ModelMap
 
-    def __init__(self, engine: Engine, logging: LoggingModule, env: Env) -> None:
-        super().__init__(engine, logging, env)
+    def __init__(
+        self,
+        engine: Engine,
+        logging: LoggingModule,
+        env: Env,
+        shared_cache: Optional[SharedModelCache] = None,
+    ) -> None:
+        super().__init__(engine, logging, env, shared_cache)
         self.changed_models = defaultdict(dict)
 
     def apply_changed_model(
@@ -85,6 +92,18 @@ class ExtendedDatastoreAdapter(CacheDatastoreAdapter):
         if "id" not in self.changed_models[fqid]:
             self.changed_models[fqid]["id"] = id_from_fqid(fqid)
 
+    def apply_changed_models(self, models: ModelMap) -> None:
+        """
+        Adds all given models to the changed_models at once. Existing models are
+        updated, the same as with apply_changed_model.
+        """
+        changed_models = self.changed_models
+        for fqid, instance in models.items():
+            changed_model = changed_models[fqid]
+            changed_model.update(instance)
+            if "id" not in changed_model:
+                changed_model["id"] = id_from_fqid(fqid)
+
     def get(
         self,
         fqid: FullQualifiedId,
@@ -407,7 +426,7 @@ class ExtendedDatastoreAdapter(CacheDatastoreAdapter):
         scope["collection_from_fqid"] = collection_from_fqid
         scope["id_from_fqid"] = id_from_fqid
         results = eval(filter_code, scope)
-        return deepcopy(results)
+        return copy_json(results)
 
     def _comparable(self, a: Any, b: Any) -> bool:
         """
@@ -1,14 +1,20 @@
-from typing import Optional, Tuple, Union
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 from ...shared.exceptions import DatastoreConnectionException
+from ...shared.interfaces.env import Env
 from ...shared.interfaces.logging import LoggingModule
 
 
 class HTTPEngine:
     """
     HTTP implementation of the Engine interface
+
+    All requests are sent through one pooled keep-alive session which is shared
+    by all threads of the worker.
     """
 
     READER_ENDPOINTS = [
@@ -29,20 +35,44 @@ class HTTPEngine:
         "delete_history_information",
         "write_action_worker",
     ]
+    # Endpoints which may safely be sent again if the connection was reset
+    # after the request was already transmitted.
+    IDEMPOTENT_ENDPOINTS = READER_ENDPOINTS + [
+        "truncate_db",
+        "delete_history_information",
+    ]
 
     def __init__(
         self,
         datastore_reader_url: str,
         datastore_writer_url: str,
         logging: LoggingModule,
+        env: Env,
     ):
         self.logger = logging.getLogger(__name__)
         self.datastore_reader_url = datastore_reader_url
         self.datastore_writer_url = datastore_writer_url
         self.headers = {"Content-Type": "application/json"}
+        self.retries = int(env.DATASTORE_CONNECTION_RETRIES)
+        self.session = self.create_session(
+            int(env.DATASTORE_CONNECTION_POOL_SIZE)
+            * int(env.OPENSLIDES_BACKEND_NUM_THREADS)
+        )
+
+    def create_session(self, pool_size: int) -> requests.Session:
+        """
+        Creates the session with one connection pool per datastore host. Failed
+        requests are retried in retrieve only.
+        """
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def retrieve(
-        self, endpoint: str, data: Optional[str]
+        self, endpoint: str, data: Optional[Union[bytes, str]]
     ) -> Tuple[Union[bytes, str], int]:
         """
         Throws 2 kinds of DatastoreConnectionException:
@@ -59,9 +89,66 @@ class HTTPEngine:
             raise DatastoreConnectionException(f"Endpoint {endpoint} does not exist.")
         url = "/".join((base_url, endpoint))
 
-        try:
-            response = requests.post(url=url, data=data, headers=self.headers)
-        except requests.exceptions.ConnectionError as e:
-            error_message = f"Cannot reach the datastore service on {url}. Error: {e}"
-            raise DatastoreConnectionException(error_message)
+        for attempt in range(1, self.retries + 2):
+            try:
+                response = self.session.post(url=url, data=data)
+                break
+            except requests.exceptions.ConnectionError as e:
+                if attempt <= self.retries and self.may_retry(endpoint, e):
+                    self.logger.debug(
+                        f"Connection to {url} failed, retry ({attempt}/{self.retries})."
+                    )
+                    continue
+                error_message = (
+                    f"Cannot reach the datastore service on {url}. Error: {e}"
+                )
+                raise DatastoreConnectionException(error_message)
+        self.logger.debug(f"Datastore connection pool: {self.get_pool_stats()}")
         return response.content, response.status_code
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of requests which reused a pooled connection (hits)
+        and the number of newly opened connections (misses) for all hosts. Many
+        misses compared to the hits mean that the pool is too small for the
+        number of threads.
+        """
+        hits = misses = 0
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                misses += pool.num_connections
+                hits += pool.num_requests - pool.num_connections
+        return {"hits": hits, "misses": misses}
+
+    def may_retry(self, endpoint: str, error: Exception) -> bool:
+        """
+        Idempotent endpoints are always retried. All other endpoints are only
+        retried if no connection could be established, since a connection which
+        is closed without a response does not tell whether the datastore already
+        processed the request.
+        """
+        if endpoint in self.IDEMPOTENT_ENDPOINTS:
+            return True
+        return any(isinstance(cause, NewConnectionError) for cause in get_causes(error))
+
+
+def get_causes(error: BaseException) -> Iterator[BaseException]:
+    """
+    Yields the error and all errors wrapped by it, since urllib3 and requests
+    pass the original errors as arguments.
+    """
+    errors = [error]
+    seen = set()
+    while errors:
+        error = errors.pop()
+        if id(error) in seen:
+            continue
+        seen.add(id(error))
+        yield error
+        wrapped = [*error.args, getattr(error, "reason", None), error.__cause__]
+        errors.extend(e for e in wrapped if isinstance(e, BaseException))
@@ -42,6 +42,13 @@ class BaseDatastoreService(Protocol):
     def get_database_context(self) -> ContextManager[None]:
         ...
 
+    @abstractmethod
+    def get_read_only_context(self) -> ContextManager[None]:
+        """
+        Inside this context, results are not copied from the internal caches. The
+        caller must not modify any nested values of the returned models.
+        """
+
     @abstractmethod
     def get(
         self,
@@ -260,12 +267,22 @@ class DatastoreService(BaseDatastoreService):
         Returns whether the given model was deleted during this request or not.
         """
 
+    @abstractmethod
+    def is_new(self, fqid: FullQualifiedId) -> bool:
+        """
+        Returns whether the given model was created during this request or not.
+        """
+
     @abstractmethod
     def apply_changed_model(
         self, fqid: FullQualifiedId, instance: PartialModel, replace: bool = False
     ) -> None:
         ...
 
+    @abstractmethod
+    def apply_changed_models(self, models: ModelMap) -> None:
+        ...
+
 
 class Engine(Protocol):
     """
@@ -274,6 +291,6 @@ class Engine(Protocol):
 
     @abstractmethod
     def retrieve(
-        self, endpoint: str, data: Optional[str]
+        self, endpoint: str, data: Optional[Union[bytes, str]]
     ) -> Tuple[Union[bytes, str], int]:
         ...
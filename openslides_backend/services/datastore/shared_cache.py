@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ...shared.interfaces.env import Env
+from ...shared.patterns import KEYSEPARATOR, FullQualifiedId
+from .interface import PartialModel
+
+MISSING = object()
+
+
+class SharedCacheEntry:
+    """
+    All cached fields of a single model, read at the given position.
+    """
+
+    def __init__(self, position: int) -> None:
+        self.position = position
+        self.timestamp = time.monotonic()
+        self.fields: Dict[str, Any] = {}
+
+
+class SharedModelCache:
+    """
+    Process-wide cache of model fields which is shared between all requests and
+    threads of a worker. Every model is tagged with the meta_position it was read
+    at, so that a newer read always replaces all previously cached fields of the
+    model and an older read never overwrites newer data.
+
+    The cache is bounded by the total number of cached fields; the least recently
+    used models are evicted first. Models written by this worker are invalidated
+    on write. Since writes of other workers cannot be observed, entries expire
+    after max_age seconds. Stale locked reads are detected by the datastore writer
+    and lead to a retry after the affected models were invalidated.
+    """
+
+    def __init__(self, max_size: int, max_age: float) -> None:
+        self.max_size = max_size
+        self.max_age = max_age
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.models: OrderedDict[FullQualifiedId, SharedCacheEntry] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(
+        self, fqid: FullQualifiedId, mapped_fields: Iterable[str]
+    ) -> Optional[Tuple[int, PartialModel]]:
+        """
+        Returns the position and the requested fields of the model, if all of them
+        are cached. Fields which do not exist in the model are omitted.
+        """
+        with self.lock:
+            entry = self.models.get(fqid)
+            if entry is not None and self._is_expired(entry):
+                self._remove(fqid)
+                entry = None
+            if entry is None or any(
+                field not in entry.fields for field in mapped_fields
+            ):
+                self.misses += 1
+                return None
+            self.models.move_to_end(fqid)
+            self.hits += 1
+            model = {}
+            for field in mapped_fields:
+                value = entry.fields[field]
+                if value is not MISSING:
+                    model[field] = value
+            return entry.position, model
+
+    def update(
+        self,
+        fqid: FullQualifiedId,
+        position: int,
+        model: PartialModel,
+        mapped_fields: Iterable[str],
+    ) -> None:
+        """
+        Caches the given fields of the model read at the given position.
+        """
+        with self.lock:
+            entry = self.models.get(fqid)
+            if entry is not None:
+                if entry.position > position:
+                    return
+                if entry.position < position or self._is_expired(entry):
+                    self._remove(fqid)
+                    entry = None
+            if entry is None:
+                entry = self.models[fqid] = SharedCacheEntry(position)
+            for field in mapped_fields:
+                if field.startswith("meta_"):
+                    continue
+                if field not in entry.fields:
+                    self.size += 1
+                entry.fields[field] = model.get(field, MISSING)
+            self.models.move_to_end(fqid)
+            while self.size > self.max_size and self.models:
+                self._remove(next(iter(self.models)))
+
+    def invalidate(self, fqids: Iterable[FullQualifiedId]) -> None:
+        with self.lock:
+            for fqid in fqids:
+                if fqid in self.models:
+                    self._remove(fqid)
+
+    def invalidate_keys(self, keys: Iterable[str]) -> None:
+        """
+        Invalidates all models of the given fqids and fqfields. Collection fields
+        are ignored.
+        """
+        fqids = []
+        for key in keys:
+            parts = key.split(KEYSEPARATOR)
+            if len(parts) > 1 and parts[1].isdigit():
+                fqids.append(KEYSEPARATOR.join(parts[:2]))
+        self.invalidate(fqids)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.models.clear()
+            self.size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "models": len(self.models),
+            "fields": self.size,
+        }
+
+    def _is_expired(self, entry: SharedCacheEntry) -> bool:
+        return time.monotonic() - entry.timestamp > self.max_age
+
+    def _remove(self, fqid: FullQualifiedId) -> None:
+        entry = self.models.pop(fqid)
+        self.size -= len(entry.fields)
+
+
+def create_shared_model_cache(env: Env) -> Optional[SharedModelCache]:
+    """
+    Returns the shared model cache if it is enabled via DATASTORE_SHARED_CACHE_SIZE.
+    """
+    max_size = int(env.DATASTORE_SHARED_CACHE_SIZE)
+    if max_size <= 0:
+        return None
+    return SharedModelCache(max_size, float(env.DATASTORE_SHARED_CACHE_MAX_AGE))
@@ -1,11 +1,65 @@
-from typing import Any, Dict
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
 
 import requests
+import simplejson as json
 
 from ...shared.exceptions import MediaServiceException
 from ...shared.interfaces.logging import LoggingModule
 from .interface import MediaService
 
+MEDIA_WORKERS = 8
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Base64 encoded files without line breaks only consist of characters which need no
+# escaping in JSON. All other files are escaped.
+BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/=]*")
+
+
+class UploadBody:
+    """
+    File-like JSON body of an upload request. The file is sent in chunks directly
+    from the given string, so that it is neither copied into a complete JSON
+    document nor encoded at once.
+    """
+
+    def __init__(self, file: str, payload: Dict[str, Any]) -> None:
+        if not BASE64_PATTERN.fullmatch(file):
+            file = json.dumps(file)[1:-1]
+        self.head = (json.dumps(payload)[:-1] + ', "file": "').encode()
+        self.file = file
+        self.tail = b'"}'
+        self.chunks = self.iter_chunks()
+        self.buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.head) + len(self.file) + len(self.tail)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        yield self.head
+        for i in range(0, len(self.file), UPLOAD_CHUNK_SIZE):
+            yield self.file[i : i + UPLOAD_CHUNK_SIZE].encode()
+        yield self.tail
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Returns the next size bytes of the body or all remaining bytes if size is
+        negative.
+        """
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
 
 class MediaServiceAdapter(MediaService):
     """
@@ -15,18 +69,31 @@ class MediaServiceAdapter(MediaService):
     def __init__(self, media_url: str, logging: LoggingModule) -> None:
         self.logger = logging.getLogger(__name__)
         self.media_url = media_url + "/"
+        self.session = requests.Session()
+        self.session.mount(
+            self.media_url,
+            requests.adapters.HTTPAdapter(pool_maxsize=MEDIA_WORKERS),
+        )
 
     def _upload(self, file: str, id: int, mimetype: str, subpath: str) -> None:
         url = self.media_url + subpath + "/"
-        payload = {"file": file, "id": id, "mimetype": mimetype}
+        payload = {"id": id, "mimetype": mimetype}
         self.logger.debug(f"Starting upload of mediafile/{id} (mimetype: {mimetype})")
-        self._handle_upload(url, payload, description="Upload of file: ")
+        self._handle_upload(
+            url, UploadBody(file, payload), description="Upload of file: "
+        )
         self.logger.debug("File successfully uploaded to the media service")
 
     def upload_mediafile(self, file: str, id: int, mimetype: str) -> None:
         subpath = "upload_mediafile"
         self._upload(file, id, mimetype, subpath)
 
+    def upload_mediafiles(self, files: List[Tuple[str, int, str]]) -> None:
+        self._run_concurrently(
+            partial(self.upload_mediafile, file, id, mimetype)
+            for file, id, mimetype in files
+        )
+
     def upload_resource(self, file: str, id: int, mimetype: str) -> None:
         subpath = "upload_resource"
         self._upload(file, id, mimetype, subpath)
@@ -34,14 +101,42 @@ class MediaServiceAdapter(MediaService):
     def duplicate_mediafile(self, source_id: int, target_id: int) -> None:
         url = self.media_url + "duplicate_mediafile/"
         payload = {"source_id": source_id, "target_id": target_id}
-        self._handle_upload(url, payload, description="Duplicate of mediafile: ")
+        self._handle_upload(
+            url, json.dumps(payload), description="Duplicate of mediafile: "
+        )
         self.logger.debug("File successfully duplicated on the media service")
 
-    def _handle_upload(
-        self, url: str, payload: Dict[str, Any], description: str
-    ) -> None:
+    def duplicate_mediafiles(self, ids: List[Tuple[int, int]]) -> None:
+        self._run_concurrently(
+            partial(self.duplicate_mediafile, source_id, target_id)
+            for source_id, target_id in ids
+        )
+
+    def _run_concurrently(self, calls: Iterable[Callable[[], None]]) -> None:
+        """
+        Runs the given calls with at most MEDIA_WORKERS requests at the same time.
+        The first error is raised after all running requests are finished; the
+        remaining calls are not started anymore.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=MEDIA_WORKERS, thread_name_prefix="media"
+        )
+        try:
+            futures: Deque[Future] = deque()
+            for call in calls:
+                futures.append(executor.submit(call))
+                if len(futures) >= MEDIA_WORKERS:
+                    futures.popleft().result()
+            while futures:
+                futures.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _handle_upload(self, url: str, data: Any, description: str) -> None:
         try:
-            response = requests.post(url, json=payload)
+            response = self.session.post(
+                url, data=data, headers={"Content-Type": "application/json"}
+            )
         except requests.exceptions.ConnectionError as e:
             msg = f"Connect to mediaservice failed. {e}"
             self.logger.debug(description + msg)
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import List, Protocol, Tuple
 
 
 class MediaService(Protocol):
@@ -15,6 +15,14 @@ class MediaService(Protocol):
         """
         ...
 
+    @abstractmethod
+    def upload_mediafiles(self, files: List[Tuple[str, int, str]]) -> None:
+        """
+        Uploads the given files, each given as file, id and mimetype, concurrently.
+        Throws a MediaServiceException, if any of the uploads fails.
+        """
+        ...
+
     @abstractmethod
     def upload_resource(self, file: str, id: int, mimetype: str) -> None:
         """
@@ -30,3 +38,12 @@ class MediaService(Protocol):
         any Error reported from MediaService-Request
         """
         ...
+
+    @abstractmethod
+    def duplicate_mediafiles(self, ids: List[Tuple[int, int]]) -> None:
+        """
+        Duplicates the given mediafiles, each given as source and target id,
+        concurrently. Throws a MediaServiceException, if any of the duplications
+        fails.
+        """
+        ...
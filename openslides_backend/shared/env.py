@@ -25,10 +25,14 @@ class Environment:
 
     vars = {
         "ACTION_PORT": "9002",
+        "DATASTORE_CONNECTION_POOL_SIZE": "2",
+        "DATASTORE_CONNECTION_RETRIES": "2",
         "DATASTORE_READER_HOST": "localhost",
         "DATASTORE_READER_PATH": "/internal/datastore/reader",
         "DATASTORE_READER_PORT": "9010",
         "DATASTORE_READER_PROTOCOL": "http",
+        "DATASTORE_SHARED_CACHE_MAX_AGE": "10",
+        "DATASTORE_SHARED_CACHE_SIZE": "0",
         "DATASTORE_WRITER_HOST": "localhost",
         "DATASTORE_WRITER_PATH": "/internal/datastore/writer",
         "DATASTORE_WRITER_PORT": "9011",
@@ -39,9 +43,13 @@ class Environment:
         "MEDIA_PORT": "9006",
         "MEDIA_PROTOCOL": "http",
         "OPENSLIDES_BACKEND_COMPONENT": "all",
+        "OPENSLIDES_BACKEND_JSON_CODEC": "orjson",
         "OPENSLIDES_BACKEND_NUM_WORKERS": "1",
         "OPENSLIDES_BACKEND_NUM_THREADS": "3",
         "OPENSLIDES_BACKEND_RAISE_4XX": "false",
+        "OPENSLIDES_BACKEND_SCHEMA_CACHE": "",
+        "OPENSLIDES_BACKEND_STARTUP_BUDGET": "0",
+        "OPENSLIDES_BACKEND_STARTUP_PROFILE": "",
         "OPENSLIDES_BACKEND_WORKER_TIMEOUT": "30",
         "OPENSLIDES_DEVELOPMENT": "false",
         "OPENSLIDES_LOGLEVEL": Loglevel.NOTSET.name,
@@ -71,6 +79,12 @@ class Environment:
     def is_otel_enabled(self) -> bool:
         return is_truthy(self.OPENTELEMETRY_ENABLED)
 
+    def is_startup_profile_enabled(self) -> bool:
+        return bool(self.OPENSLIDES_BACKEND_STARTUP_PROFILE)
+
+    def get_startup_budget(self) -> float:
+        return float(self.OPENSLIDES_BACKEND_STARTUP_BUDGET)
+
     def get_loglevel(self) -> str:
         lvl = self.OPENSLIDES_LOGLEVEL.upper()
         if lvl not in Loglevel.__members__:
@@ -0,0 +1,118 @@
+import os
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+import orjson
+import simplejson
+
+from .env import Environment
+
+JSONDefault = Callable[[Any], Any]
+
+
+class JSONDecodeError(ValueError):
+    pass
+
+
+class JSONCodec:
+    """
+    Encodes values to JSON bytes and decodes JSON bytes or strings. All codecs
+    encode Decimals as strings, since decimal values are strings in the models, and
+    named tuples as objects. Other unsupported values are passed to the given
+    default function.
+    """
+
+    def dumps(self, value: Any, default: Optional[JSONDefault] = None) -> bytes:
+        raise NotImplementedError()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        raise NotImplementedError()
+
+    def get_default(self, default: Optional[JSONDefault]) -> JSONDefault:
+        def encode_default(value: Any) -> Any:
+            if isinstance(value, Decimal):
+                return str(value)
+            if isinstance(value, tuple) and hasattr(value, "_asdict"):
+                return value._asdict()
+            if default is not None:
+                return default(value)
+            raise TypeError(
+                f"Object of type {type(value).__name__} is not JSON serializable"
+            )
+
+        return encode_default
+
+
+class SimplejsonCodec(JSONCodec):
+    def dumps(self, value: Any, default: Optional[JSONDefault] = None) -> bytes:
+        return simplejson.dumps(
+            value,
+            default=self.get_default(default),
+            separators=(",", ":"),
+            use_decimal=False,
+            ensure_ascii=False,
+        ).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return simplejson.loads(data)
+        except simplejson.JSONDecodeError as e:
+            raise JSONDecodeError(str(e)) from e
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Dataclasses and datetimes are passed to the default function like by the
+    simplejson codec instead of being encoded natively.
+    """
+
+    def __init__(self) -> None:
+        self.options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        self.default = self.get_default(None)
+
+    def dumps(self, value: Any, default: Optional[JSONDefault] = None) -> bytes:
+        return orjson.dumps(
+            value,
+            default=self.default if default is None else self.get_default(default),
+            option=self.options,
+        )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise JSONDecodeError(str(e)) from e
+
+
+codecs: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "simplejson": SimplejsonCodec,
+}
+
+
+def get_codec(env: Environment) -> JSONCodec:
+    """
+    Returns the codec configured for HTTP bodies and the datastore communication.
+    """
+    name = env.OPENSLIDES_BACKEND_JSON_CODEC
+    if name not in codecs:
+        raise ValueError(
+            f"Invalid OPENSLIDES_BACKEND_JSON_CODEC: {name}. "
+            f"Use one of: {', '.join(codecs)}"
+        )
+    return codecs[name]()
+
+
+codec = get_codec(Environment(os.environ))
+
+
+def dumps(value: Any, default: Optional[JSONDefault] = None) -> bytes:
+    return codec.dumps(value, default)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    return codec.loads(data)
@@ -0,0 +1,116 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from . import json_codec
+
+
+class StreamedDict:
+    """
+    A JSON object whose items are only produced while the response is serialized.
+    The given factory is called once when encoding starts and has to return an
+    iterable of key-value pairs. Every value is encoded and released before the next
+    one is requested, so that only a single value has to be kept in memory.
+    """
+
+    def __init__(self, items: Callable[[], Iterable[Tuple[str, Any]]]) -> None:
+        self.items = items
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}>"
+
+
+def contains_stream(value: Any) -> bool:
+    """
+    Checks whether the given value or one of its direct children is streamed.
+    """
+    if isinstance(value, StreamedDict):
+        return True
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return False
+    return any(isinstance(child, StreamedDict) for child in value)
+
+
+# Key of the member which is appended to the innermost open object if the stream
+# fails, so that clients can detect incomplete results.
+STREAM_ERROR_KEY = "stream_error"
+
+
+class StreamEncoder:
+    """
+    Encodes a value with streamed dicts and keeps track of the open containers, so
+    that the JSON can be completed if producing a streamed value fails.
+    """
+
+    def __init__(self) -> None:
+        # closing bytes of all open containers and whether they contain items yet
+        self.open_containers: List[List[Any]] = []
+        # whether a key or separator was written without the following value
+        self.pending_value = False
+
+    def encode(self, value: Any) -> Iterator[bytes]:
+        if not contains_stream(value):
+            # nothing is written if encoding fails
+            data = json_codec.dumps(value)
+            self.pending_value = False
+            yield data
+            return
+        if isinstance(value, (StreamedDict, dict)):
+            yield from self.encode_container(b"{", b"}")
+            container = self.open_containers[-1]
+            for key, item in value.items():
+                separator = b"," if container[1] else b""
+                yield separator + json_codec.dumps(str(key)) + b":"
+                container[1] = self.pending_value = True
+                yield from self.encode(item)
+        else:
+            yield from self.encode_container(b"[", b"]")
+            container = self.open_containers[-1]
+            for item in value:
+                if container[1]:
+                    yield b","
+                container[1] = self.pending_value = True
+                yield from self.encode(item)
+        self.open_containers.pop()
+        yield container[0]
+
+    def encode_container(self, start: bytes, end: bytes) -> Iterator[bytes]:
+        self.open_containers.append([end, False])
+        self.pending_value = False
+        yield start
+
+    def close(self, message: str) -> Iterator[bytes]:
+        """
+        Completes the JSON after an error. The error message is added to the
+        innermost open object or, if there is none, as object to the innermost list.
+        """
+        if self.pending_value:
+            yield b"null"
+        error = json_codec.dumps({STREAM_ERROR_KEY: message})
+        has_object = any(end == b"}" for end, _ in self.open_containers)
+        while self.open_containers:
+            end, has_items = self.open_containers.pop()
+            if error and (end == b"}" or not has_object):
+                member = error if end == b"]" else error[1:-1]
+                yield (b"," if has_items else b"") + member
+                error = b""
+            yield end
+
+
+def iter_encode(
+    value: Any, on_error: Optional[Callable[[Exception], str]] = None
+) -> Iterator[bytes]:
+    """
+    Encodes the given value to JSON and yields the result in chunks. Streamed dicts
+    are encoded item by item; all other values are encoded at once. If on_error is
+    given, exceptions while streaming are passed to it and the JSON is completed
+    with the returned message as error member instead of being truncated.
+    """
+    encoder = StreamEncoder()
+    try:
+        yield from encoder.encode(value)
+    except Exception as exception:
+        if on_error is None or not encoder.open_containers:
+            raise
+        message = on_error(exception)
+        yield from encoder.close(message)
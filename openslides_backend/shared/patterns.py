@@ -19,6 +19,7 @@ EXTENSION_REFERENCE_IDS_REGEX = rf"\[(?P<fqid>{FQID_REGEX_PART})\]"
 
 # Regexes as patterns
 ID_PATTERN = re.compile(ID_REGEX)
+FQID_PATTERN = re.compile(FQID_REGEX)
 COLLECTIONFIELD_PATTERN = re.compile(COLLECTIONFIELD_REGEX)
 DECIMAL_PATTERN = re.compile(DECIMAL_REGEX)
 COLOR_PATTERN = re.compile(COLOR_REGEX)
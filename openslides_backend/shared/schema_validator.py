@@ -0,0 +1,123 @@
+import hashlib
+import os
+import py_compile
+from importlib.util import module_from_spec, spec_from_file_location
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import fastjsonschema
+import simplejson as json
+
+from .env import Environment
+from .typing import Schema
+
+
+def get_schema_cache_path(env: Environment) -> str:
+    """
+    Returns the directory of the generated validator module, see build_schema_cache.
+    """
+    path = env.OPENSLIDES_BACKEND_SCHEMA_CACHE
+    if path and os.path.exists(path) and not os.path.isdir(path):
+        raise ValueError(
+            f"Invalid OPENSLIDES_BACKEND_SCHEMA_CACHE: {path} is not a directory"
+        )
+    return path
+
+
+SCHEMA_CACHE_PATH = get_schema_cache_path(Environment(os.environ))
+SCHEMA_CACHE_MODULE = "schema_validators"
+
+Validator = Callable[[Any], Any]
+ValidatorFactory = Callable[[], Validator]
+
+
+class SchemaValidator:
+    """
+    Validator for the given JSON schema which is only compiled when it is called
+    for the first time. Validators of equal schemas are shared.
+    """
+
+    __slots__ = ("schema", "validator")
+
+    def __init__(self, schema: Schema) -> None:
+        self.schema = schema
+        self.validator: Optional[Validator] = None
+
+    def __call__(self, data: Any) -> Any:
+        if self.validator is None:
+            self.validator = get_validator(self.schema)
+        return self.validator(data)
+
+
+validators: Dict[str, Validator] = {}
+cached_factories: Optional[Dict[str, ValidatorFactory]] = None
+cache_lock = Lock()
+
+
+def get_schema_hash(schema: Schema) -> str:
+    """
+    The hash also contains the version of fastjsonschema, since the generated code
+    depends on it.
+    """
+    data = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.md5(f"{fastjsonschema.VERSION}:{data}".encode()).hexdigest()
+
+
+def get_validator(schema: Schema) -> Validator:
+    key = get_schema_hash(schema)
+    if (validator := validators.get(key)) is None:
+        if factory := get_cached_factories().get(key):
+            validator = factory()
+        else:
+            validator = fastjsonschema.compile(schema)
+        validators[key] = validator
+    return validator
+
+
+def get_cached_factories() -> Dict[str, ValidatorFactory]:
+    global cached_factories
+    if cached_factories is None:
+        with cache_lock:
+            if cached_factories is None:
+                cached_factories = load_schema_cache(SCHEMA_CACHE_PATH)
+    return cached_factories
+
+
+def load_schema_cache(path: str) -> Dict[str, ValidatorFactory]:
+    filename = os.path.join(path, SCHEMA_CACHE_MODULE + ".py")
+    if not path or not os.path.isfile(filename):
+        return {}
+    spec = spec_from_file_location(SCHEMA_CACHE_MODULE, filename)
+    if spec is None or spec.loader is None:
+        return {}
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.VALIDATORS
+
+
+def build_schema_cache(path: str, schemas: Iterable[Schema]) -> int:
+    """
+    Writes the generated code of the validators of the given schemas into a module
+    in the given directory and returns the number of validators. Every validator is
+    wrapped into a factory function and keyed by the hash of its schema, so that
+    changed schemas are simply not found and compiled at runtime again.
+    """
+    code = ["VALIDATORS = {}"]
+    keys = set()
+    for schema in schemas:
+        key = get_schema_hash(schema)
+        if key in keys:
+            continue
+        keys.add(key)
+        source = fastjsonschema.compile_to_code(schema)
+        body = "\n".join(f"    {line}" if line else "" for line in source.splitlines())
+        code.append(
+            f"\n\ndef validator_{key}():\n{body}\n    return validate\n\n\n"
+            f'VALIDATORS["{key}"] = validator_{key}'
+        )
+    os.makedirs(path, exist_ok=True)
+    filename = os.path.join(path, SCHEMA_CACHE_MODULE + ".py")
+    with open(filename, "w") as f:
+        f.write("\n".join(code) + "\n")
+    py_compile.compile(filename, doraise=True)
+    return len(keys)
@@ -0,0 +1,196 @@
+import os
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import simplejson as json
+
+from .exceptions import BackendBaseException
+
+
+class StartupBudgetExceeded(BackendBaseException):
+    def __init__(self, seconds: float, budget: float) -> None:
+        super().__init__(
+            f"Startup took {seconds:.2f} seconds, the budget is {budget:.2f} seconds."
+        )
+
+
+class ProfilingLoader(Loader):
+    """
+    Wraps the loader of a module found by the ProfilingFinder and records the
+    execution of the module. All other attributes are taken from the wrapped loader,
+    which replaces the proxy again once the module is executed.
+    """
+
+    def __init__(self, loader: Loader, profiler: "StartupProfiler") -> None:
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        spec = module.__spec__
+        try:
+            if self.profiler.running:
+                with self.profiler.record_import(module.__name__):
+                    self.loader.exec_module(module)
+            else:
+                self.loader.exec_module(module)
+        finally:
+            module.__loader__ = self.loader
+            if spec is not None and spec.loader is self:
+                spec.loader = self.loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+
+class ProfilingFinder(MetaPathFinder):
+    """
+    Finds modules with the other finders and wraps the loaders of the found modules
+    to record their import time and allocated memory.
+    """
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self.profiler = profiler
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            if (spec := finder.find_spec(fullname, path, target)) is not None:
+                break
+        else:
+            return None
+        # builtin and frozen modules are loaded by classes shared by all modules
+        if (
+            spec.loader is not None
+            and not isinstance(spec.loader, type)
+            and hasattr(spec.loader, "exec_module")
+        ):
+            spec.loader = ProfilingLoader(spec.loader, self.profiler)
+        return spec
+
+
+class StartupProfiler:
+    """
+    Records the wall time and the allocated memory of the startup phases and of
+    all modules imported while the profiler is running. The memory is traced with
+    tracemalloc, which slows down the startup itself, so the profiler must only be
+    enabled to measure it. If it is not enabled, all methods do nothing.
+
+    The profiler may be stopped and started again, e.g. around the fork of a worker
+    process. The seconds and the peak memory then cover all runs.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.modules: Dict[str, Dict[str, float]] = {}
+        self.children_seconds: List[float] = []
+        self.finder = ProfilingFinder(self)
+        self.start_time = 0.0
+        self.seconds = 0.0
+        self.peak_memory = 0
+        self.started_tracemalloc = False
+        self.running = False
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        sys.meta_path.insert(0, self.finder)
+        self.start_time = perf_counter()
+        self.running = True
+
+    def stop(self) -> None:
+        if not self.enabled:
+            return
+        self.running = False
+        self.seconds += perf_counter() - self.start_time
+        sys.meta_path.remove(self.finder)
+        self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        memory = tracemalloc.get_traced_memory()[0]
+        try:
+            yield
+        finally:
+            self.phases[name] = {
+                "seconds": perf_counter() - start,
+                "memory": tracemalloc.get_traced_memory()[0] - memory,
+            }
+
+    @contextmanager
+    def record_import(self, name: str) -> Iterator[None]:
+        """
+        Records the time of the import of the given module with and without the
+        imports of other modules it triggered.
+        """
+        start = perf_counter()
+        memory = tracemalloc.get_traced_memory()[0]
+        self.children_seconds.append(0.0)
+        try:
+            yield
+        finally:
+            children_seconds = self.children_seconds.pop()
+            seconds = perf_counter() - start
+            if self.children_seconds:
+                self.children_seconds[-1] += seconds
+            self.modules[name] = {
+                "seconds": seconds,
+                "self_seconds": seconds - children_seconds,
+                "memory": tracemalloc.get_traced_memory()[0] - memory,
+            }
+
+    def get_report(self, top: int = 50) -> Dict[str, Any]:
+        """
+        Returns the report with the given number of modules with the highest import
+        time without their own imports.
+        """
+        modules = sorted(
+            self.modules.items(), key=lambda item: item[1]["self_seconds"], reverse=True
+        )
+        return {
+            "seconds": self.seconds,
+            "peak_memory": self.peak_memory,
+            "phases": self.phases,
+            "imported_modules": len(self.modules),
+            "modules": dict(modules[:top]),
+        }
+
+    def write_report(self, path: str) -> None:
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.get_report(), f, indent=2)
+
+    def check_budget(self, budget: float) -> None:
+        """
+        Raises an exception if the startup took longer than the given number of
+        seconds. A budget of 0 disables the check.
+        """
+        if self.enabled and budget and self.seconds > budget:
+            raise StartupBudgetExceeded(self.seconds, budget)
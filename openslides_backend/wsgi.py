@@ -7,6 +7,7 @@ from .http.views import ActionView, PresenterView
 from .services.auth.adapter import AuthenticationHTTPAdapter
 from .services.datastore.extended_adapter import ExtendedDatastoreAdapter
 from .services.datastore.http_engine import HTTPEngine
+from .services.datastore.shared_cache import create_shared_model_cache
 from .services.media.adapter import MediaServiceAdapter
 from .services.vote.adapter import VoteAdapter
 from .shared.env import Environment
@@ -25,9 +26,16 @@ class OpenSlidesBackendServices(containers.DeclarativeContainer):
     authentication = providers.Singleton(AuthenticationHTTPAdapter, logging)
     media = providers.Singleton(MediaServiceAdapter, config.media_url, logging)
     engine = providers.Singleton(
-        HTTPEngine, config.datastore_reader_url, config.datastore_writer_url, logging
+        HTTPEngine,
+        config.datastore_reader_url,
+        config.datastore_writer_url,
+        logging,
+        env,
+    )
+    shared_model_cache = providers.Singleton(create_shared_model_cache, env)
+    datastore = providers.Factory(
+        ExtendedDatastoreAdapter, engine, logging, env, shared_model_cache
     )
-    datastore = providers.Factory(ExtendedDatastoreAdapter, engine, logging, env)
     vote = providers.Singleton(VoteAdapter, config.vote_url, logging)
 
 
@@ -673,10 +673,10 @@ class MeetingClone(BaseActionTestCase):
                 },
             }
         )
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
-        self.media.duplicate_mediafile.assert_called_with(1, 2)
+        self.media.duplicate_mediafiles.assert_called_with([(1, 2)])
 
     def test_clone_with_mediafile_directory(self) -> None:
         self.test_models["meeting/1"]["user_ids"] = [1]
@@ -696,7 +696,7 @@ class MeetingClone(BaseActionTestCase):
         )
         self.assert_status_code(response, 200)
 
-        self.media.duplicate_mediafile = MagicMock()
+        self.media.duplicate_mediafiles = MagicMock()
         response = self.request("meeting.clone", {"meeting_id": 1})
         self.assert_status_code(response, 200)
 
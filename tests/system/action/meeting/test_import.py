@@ -1,7 +1,10 @@
 import base64
 import time
 from typing import Any, Dict, List, Optional, cast
+from unittest.mock import patch
 
+from openslides_backend.action.actions.meeting import import_
+from openslides_backend.action.actions.meeting.import_ import MeetingImport as Import
 from openslides_backend.migrations import get_backend_migration_index
 from openslides_backend.models.models import Meeting
 from openslides_backend.shared.util import (
@@ -911,7 +914,9 @@ class MeetingImport(BaseActionTestCase):
         self.assert_status_code(response, 200)
         mediafile = self.get_model("mediafile/1")
         assert mediafile.get("blob") is None
-        self.media.upload_mediafile.assert_called_with(file_content, 1, "text/plain")
+        self.media.upload_mediafiles.assert_called_with(
+            [(file_content, 1, "text/plain")]
+        )
 
     def test_inherited_access_group_ids_none(self) -> None:
         request_data = self.create_request_data(
@@ -1907,6 +1912,44 @@ class MeetingImport(BaseActionTestCase):
             "motion/3", {"title": "motion/6", "state_extension": "[motion/2]"}
         )
 
+    def test_with_dict_migrations(self) -> None:
+        """test for the import of data which only needs dict migrations, here 0038 and 0039"""
+        data = self.create_request_data({})
+        meeting = data["meeting"]["meeting"]["1"]
+        meeting["default_projector_$_ids"] = [
+            *cast(List[str], Meeting.default_projector__ids.replacement_enum),
+            "user",
+        ]
+        meeting["default_projector_$user_ids"] = [1]
+        projector = data["meeting"]["projector"]["1"]
+        projector["used_as_default_$_in_meeting_id"] = [
+            *cast(List[str], Meeting.default_projector__ids.replacement_enum),
+            "user",
+        ]
+        projector["used_as_default_$user_in_meeting_id"] = 1
+        data["meeting"]["_migration_index"] = 38
+        migrated: List[Dict[str, Any]] = []
+
+        def migrate_data(action: Import, instance: Dict[str, Any]) -> Dict[str, Any]:
+            migrated.append(Import.migrate_data(action, instance))
+            return migrated[-1]
+
+        with patch.object(Import, "migrate_data", migrate_data), patch.object(
+            import_, "MigrationWrapper"
+        ) as migration_wrapper:
+            response = self.request("meeting.import", data)
+        self.assert_status_code(response, 200)
+        migration_wrapper.assert_not_called()
+        assert migrated[0]["meeting"]["_migration_index"] == current_migration_index
+        meeting = self.assert_model_exists(
+            "meeting/2", {"default_projector_$user_ids": None}
+        )
+        assert "user" not in meeting["default_projector_$_ids"]
+        projector = self.assert_model_exists(
+            "projector/2", {"used_as_default_$user_in_meeting_id": None}
+        )
+        assert "user" not in projector["used_as_default_$_in_meeting_id"]
+
     def test_without_migration_index(self) -> None:
         data = self.create_request_data({})
         del data["meeting"]["_migration_index"]
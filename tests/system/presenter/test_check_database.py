@@ -1,6 +1,8 @@
 from typing import Any, Dict
+from unittest.mock import patch
 
 from openslides_backend.permissions.management_levels import OrganizationManagementLevel
+from openslides_backend.presenter import check_database
 
 from .base import BasePresenterTestCase
 
@@ -506,7 +508,7 @@ class TestCheckDatabase(BasePresenterTestCase):
         assert data["ok"] is True
         assert not data["errors"]
 
-    def test_relation_2(self) -> None:
+    def set_two_meetings(self) -> None:
         self.set_models(
             {
                 "organization/1": {
@@ -728,11 +730,74 @@ class TestCheckDatabase(BasePresenterTestCase):
                 },
             }
         )
+
+    def test_relation_2(self) -> None:
+        self.set_two_meetings()
         status_code, data = self.request("check_database", {})
         assert status_code == 200
         assert data["ok"] is True
         assert not data["errors"]
 
+    def test_process_pool(self) -> None:
+        self.set_two_meetings()
+        self.update_model("meeting/2", {"projector_countdown_default_time": "60"})
+        with patch.object(check_database, "CHECK_PROCESSES", 2), patch.object(
+            check_database, "get_executor", wraps=check_database.get_executor
+        ) as get_executor:
+            status_code, data = self.request("check_database", {})
+        assert status_code == 200
+        get_executor.assert_called_once()
+        assert data["ok"] is False
+        assert "Meeting 1" not in data["errors"]
+        assert "Meeting 2" in data["errors"]
+        assert (
+            "meeting/2/projector_countdown_default_time: Type error" in data["errors"]
+        )
+
+    def test_stream(self) -> None:
+        self.set_two_meetings()
+        self.update_model("meeting/2", {"projector_countdown_default_time": "60"})
+        with patch.object(check_database, "CHECK_PROCESSES", 2):
+            status_code, data = self.request("check_database", {"stream": True})
+        assert status_code == 200
+        assert data["meetings"]["1"] == {"ok": True, "errors": ""}
+        assert data["meetings"]["2"]["ok"] is False
+        assert (
+            "meeting/2/projector_countdown_default_time"
+            in data["meetings"]["2"]["errors"]
+        )
+        assert data["ok"] is False
+        assert data["errors"].startswith("Meeting 2\n")
+
+    def test_incremental(self) -> None:
+        self.set_two_meetings()
+        self.addCleanup(check_database.clean_checks.positions.clear)
+        check_database.clean_checks.positions.clear()
+        with patch.object(check_database, "CHECK_PROCESSES", 2), patch.object(
+            check_database, "export_meeting", wraps=check_database.export_meeting
+        ) as export_meeting:
+            status_code, data = self.request("check_database", {"incremental": True})
+            assert status_code == 200
+            assert data["ok"] is True
+            assert export_meeting.call_count == 2
+
+            export_meeting.reset_mock()
+            status_code, data = self.request("check_database", {"incremental": True})
+            assert status_code == 200
+            assert data["ok"] is True
+            export_meeting.assert_not_called()
+
+            self.update_model("meeting/2", {"projector_countdown_default_time": "60"})
+            status_code, data = self.request("check_database", {"incremental": True})
+            assert status_code == 200
+            assert data["ok"] is False
+            assert "Meeting 2" in data["errors"]
+            assert [call[0][1] for call in export_meeting.call_args_list] == [2]
+
+            status_code, data = self.request("check_database", {"incremental": True})
+            assert data["ok"] is False
+            assert [call[0][1] for call in export_meeting.call_args_list] == [2, 2]
+
     def test_no_permissions(self) -> None:
         self.set_models(
             {
@@ -64,6 +64,7 @@ def create_test_application(view: Type[View]) -> WSGIApplication:
     services = OpenSlidesBackendServices(
         config=env.get_service_url(),
         logging=MagicMock(),
+        env=env,
     )
     services.vote = providers.Singleton(
         TestVoteAdapter, services.config.vote_url, MagicMock()
@@ -73,6 +74,9 @@ def create_test_application(view: Type[View]) -> WSGIApplication:
         side_effect=side_effect_for_upload_method
     )
     mock_media_service.upload_resource = Mock(side_effect=side_effect_for_upload_method)
+    mock_media_service.upload_mediafiles = Mock(
+        side_effect=side_effect_for_upload_many_method
+    )
     services.media = MagicMock(return_value=mock_media_service)
 
     # Create WSGI application instance. Inject logging module, view class and services container.
@@ -91,6 +95,11 @@ def side_effect_for_upload_method(
         raise MediaServiceException("Mocked error on media service upload")
 
 
+def side_effect_for_upload_many_method(files: List[Tuple[str, int, str]]) -> None:
+    for file in files:
+        side_effect_for_upload_method(*file)
+
+
 def get_route_path(route_function: RouteFunction, name: str = "") -> str:
     route_options_list = getattr(route_function, ROUTE_OPTIONS_ATTR)
     for route_options in route_options_list:
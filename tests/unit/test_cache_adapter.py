@@ -0,0 +1,49 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.services.datastore.extended_adapter import (
+    ExtendedDatastoreAdapter,
+)
+from openslides_backend.shared.util import copy_json
+
+
+def test_copy_json() -> None:
+    value: Dict[str, Any] = {"a": [1, {"b": [2]}], "c": "d"}
+    copy = copy_json(value)
+    assert copy == value
+    assert copy["a"] is not value["a"]
+    assert copy["a"][1]["b"] is not value["a"][1]["b"]
+
+
+class TestCacheDatastoreAdapterCopies(TestCase):
+    def setUp(self) -> None:
+        patcher = patch(
+            "openslides_backend.services.datastore.adapter.DatastoreAdapter.get_many"
+        )
+        self.get_many_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.get_many_mock.side_effect = self._get_many
+        self.adapter = ExtendedDatastoreAdapter(MagicMock(), MagicMock(), MagicMock())
+        self.request = GetManyRequest("a", [1], ["f"])
+
+    def _get_many(
+        self, get_many_requests: List[GetManyRequest], *args: Any, **kwargs: Any
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        return {"a": {1: {"f": [1, 2], "meta_position": 1}}}
+
+    def test_modify_result(self) -> None:
+        result = self.adapter.get_many([self.request])
+        result["a"][1]["f"].append(3)
+        result = self.adapter.get_many([self.request])
+        assert result["a"][1]["f"] == [1, 2]
+        self.get_many_mock.assert_called_once()
+
+    def test_read_only(self) -> None:
+        self.adapter.get_many([self.request])
+        with self.adapter.get_read_only_context():
+            result = self.adapter.get_many([self.request])
+            assert self.adapter.read_only
+        assert not self.adapter.read_only
+        assert result["a"][1]["f"] is self.adapter.cached_models["a/1"]["f"]
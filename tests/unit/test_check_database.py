@@ -0,0 +1,73 @@
+from typing import Any, Dict, Optional
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import simplejson as json
+
+from openslides_backend.presenter import check_database
+from openslides_backend.presenter.check_database import CheckDatabase, CleanChecks
+from openslides_backend.shared.json_stream import StreamedDict, iter_encode
+
+
+class CheckDatabaseTest(TestCase):
+    def setUp(self) -> None:
+        self.positions = {1: 10, 2: 20, 3: 30}
+        self.checked: Dict[int, int] = {}
+        self.exported: Dict[int, int] = {}
+
+        def export_meeting(datastore: Any, meeting_id: int, fetcher: Any) -> Any:
+            self.exported[meeting_id] = self.exported.get(meeting_id, 0) + 1
+            fetcher.position = self.positions[meeting_id]
+            return {"meeting": {str(meeting_id): {"id": meeting_id}}}
+
+        def check_meeting(export: Dict[str, Any]) -> Optional[str]:
+            meeting_id = int(next(iter(export["meeting"])))
+            self.checked[meeting_id] = self.checked.get(meeting_id, 0) + 1
+            return "broken" if meeting_id == 2 else None
+
+        for target, mock in (
+            ("export_meeting", export_meeting),
+            ("get_meeting_position", lambda _, id: self.positions[id]),
+            ("check_meeting", check_meeting),
+            ("CHECK_PROCESSES", 1),
+            ("clean_checks", CleanChecks()),
+        ):
+            patcher = patch.object(check_database, target, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_presenter(self, data: Dict[str, Any]) -> CheckDatabase:
+        return CheckDatabase(data, MagicMock(), MagicMock(), MagicMock(), 1)
+
+    def test_check_meetings(self) -> None:
+        presenter = self.get_presenter({})
+        assert list(presenter.check_meetings([1, 2, 3])) == [
+            (1, None),
+            (2, "broken"),
+            (3, None),
+        ]
+
+    def test_incremental(self) -> None:
+        list(self.get_presenter({}).check_meetings([1, 2, 3]))
+        self.positions[3] = 31
+        presenter = self.get_presenter({"incremental": True})
+        assert list(presenter.check_meetings([1, 2, 3])) == [
+            (1, None),
+            (2, "broken"),
+            (3, None),
+        ]
+        assert self.checked == {1: 1, 2: 2, 3: 2}
+        assert self.exported == {1: 1, 2: 2, 3: 2}
+
+    def test_stream(self) -> None:
+        presenter = self.get_presenter({"stream": True})
+        stream = StreamedDict(lambda: presenter.stream_results([1, 2]))
+        data = json.loads(b"".join(iter_encode(stream)))
+        assert data == {
+            "meetings": {
+                "1": {"ok": True, "errors": ""},
+                "2": {"ok": False, "errors": "broken"},
+            },
+            "ok": False,
+            "errors": "Meeting 2\nbroken",
+        }
@@ -0,0 +1,85 @@
+import copy
+import json
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.models import checker
+from openslides_backend.presenter import check_database_all
+from openslides_backend.presenter.check_database_all import CheckDatabaseAll
+from openslides_backend.shared.exceptions import PresenterException
+
+
+class CheckDatabaseAllTest(TestCase):
+    example_data: Dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open("global/data/example-data.json") as f:
+            cls.example_data = json.load(f)
+
+    def setUp(self) -> None:
+        self.data = copy.deepcopy(self.example_data)
+        for collection, models in self.data.items():
+            if not collection.startswith("_"):
+                for model in models.values():
+                    model["meta_position"] = 1
+        self.loaded: List[str] = []
+        self.datastore = MagicMock()
+        self.datastore.get_all.side_effect = self.get_all
+        for module, target, mock in (
+            (checker, "get_backend_migration_index", self.get_migration_index),
+            (
+                check_database_all,
+                "get_backend_migration_index",
+                self.get_migration_index,
+            ),
+            (check_database_all, "has_organization_management_level", lambda *_: True),
+        ):
+            patcher = patch.object(module, target, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_migration_index(self) -> int:
+        return self.data["_migration_index"]
+
+    def get_all(
+        self, collection: str, fields: List[str], lock_result: bool
+    ) -> Dict[int, Any]:
+        if not fields:
+            self.loaded.append(collection)
+        return {
+            int(id): {
+                field: value
+                for field, value in model.items()
+                if not fields or field in fields
+            }
+            for id, model in copy.deepcopy(self.data.get(collection, {})).items()
+        }
+
+    def get_presenter(self) -> CheckDatabaseAll:
+        return CheckDatabaseAll({}, MagicMock(), self.datastore, MagicMock(), 1)
+
+    def test_check(self) -> None:
+        assert self.get_presenter().get_result() == {"ok": True}
+
+    def test_write_between_loads(self) -> None:
+        def get_all(
+            collection: str, fields: List[str], lock_result: bool
+        ) -> Dict[int, Any]:
+            if self.loaded == ["meeting"]:
+                self.data["tag"]["4"] = {
+                    "id": 4,
+                    "name": "Tag4",
+                    "meeting_id": 1,
+                    "meta_position": 2,
+                }
+                self.data["meeting"]["1"]["tag_ids"].append(4)
+                self.data["meeting"]["1"]["meta_position"] = 2
+            return self.get_all(collection, fields, lock_result)
+
+        self.datastore.get_all.side_effect = get_all
+        with self.assertRaises(PresenterException) as context:
+            self.get_presenter().get_result()
+        assert "changed during the check" in context.exception.message
+        assert self.loaded[-1] == "tag"
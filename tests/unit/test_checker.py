@@ -0,0 +1,127 @@
+import copy
+import json
+from typing import Any, Dict
+from unittest import TestCase
+from unittest.mock import patch
+
+from openslides_backend.models import checker
+from openslides_backend.models.checker import (
+    Checker,
+    CheckException,
+    check_number_list,
+    checker_map,
+    find_invalid_values,
+)
+
+
+class CheckerReverseIndexTest(TestCase):
+    example_data: Dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open("global/data/example-data.json") as f:
+            cls.example_data = json.load(f)
+
+    def setUp(self) -> None:
+        self.data = copy.deepcopy(self.example_data)
+        patcher = patch.object(
+            checker,
+            "get_backend_migration_index",
+            lambda: self.data["_migration_index"],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reverse_index(self) -> None:
+        self.checker = Checker(self.data)
+        self.checker.run_check()
+        index = self.checker.reverse_index[("meeting", "group_ids")]
+        assert index[1] == frozenset(self.data["meeting"]["1"]["group_ids"])
+        assert ("meeting", "name") not in self.checker.reverse_index
+
+    def test_timings(self) -> None:
+        self.checker = Checker(self.data)
+        self.checker.run_check()
+        assert set(self.checker.timings) == {
+            collection for collection in self.data if not collection.startswith("_")
+        }
+        assert "meeting" in self.checker.format_timings()
+
+    def test_corrupt_reverse_relation(self) -> None:
+        self.data["meeting"]["1"]["group_ids"].remove(1)
+        with self.assertRaises(CheckException) as context:
+            Checker(self.data).run_check()
+        assert (
+            "group/1/meeting_id: Relation Error:  points to meeting/1/group_ids, but"
+            " the reverse relation for it is corrupt"
+        ) in str(context.exception)
+
+    def test_remove_fields_before_check(self) -> None:
+        self.data["motion"]["1"]["origin_id"] = 2
+        self.data["motion"]["2"]["derived_motion_ids"] = [1]
+        Checker(
+            self.data,
+            repair=True,
+            fields_to_remove={"motion": ["origin_id", "derived_motion_ids"]},
+        ).run_check()
+        assert "origin_id" not in self.data["motion"]["1"]
+        assert "derived_motion_ids" not in self.data["motion"]["2"]
+
+
+class ColumnTypeCheckTest(TestCase):
+    def test_column_checkers(self) -> None:
+        values = [
+            None,
+            1,
+            True,
+            1.5,
+            "1.000000",
+            "#00ff00",
+            "a\n",
+            "1.000000\n",
+            [1, 2],
+            [1, None],
+            ["a", None],
+            [1, "a"],
+            {"a": 1},
+            "",
+        ]
+        for check in set(checker_map.values()):
+            assert find_invalid_values(values, check) == [
+                index for index, value in enumerate(values) if not check(value)
+            ], check.__name__
+
+    def test_number_list_with_none(self) -> None:
+        assert find_invalid_values([[1, None], [None]], check_number_list) == []
+        assert check_number_list([1, None])
+
+    def test_type_errors_of_column(self) -> None:
+        with open("global/data/example-data.json") as f:
+            data = json.load(f)
+        data["motion"]["1"]["sequential_number"] = "1"
+        data["motion"]["2"]["sequential_number"] = 2.0
+        type_checker = Checker(data)
+        for model in data["motion"].values():
+            type_checker.check_types(model, "motion")
+        type_checker.check_column_types("motion")
+        assert [error.split(":")[0] for error in type_checker.errors] == [
+            "motion/1/sequential_number",
+            "motion/2/sequential_number",
+        ]
+
+    def test_type_errors_in_model_order(self) -> None:
+        with open("global/data/example-data.json") as f:
+            data = json.load(f)
+        data["motion"]["1"]["sequential_number"] = "1"
+        data["motion"]["1"]["category_id"] = 99
+        data["motion"]["2"]["sequential_number"] = 2.0
+        type_checker = Checker(data)
+        for model in data["motion"].values():
+            type_checker.check_types(model, "motion")
+            type_checker.check_relations(model, "motion")
+        type_checker.check_column_types("motion")
+        assert [error.split(":")[0] for error in type_checker.errors] == [
+            "motion/1/sequential_number",
+            "motion/1/category_id",
+            "motion/2/sequential_number",
+        ]
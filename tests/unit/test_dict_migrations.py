@@ -0,0 +1,68 @@
+from importlib import import_module
+from typing import Any
+from unittest import TestCase
+
+from openslides_backend.migrations import get_migrations_after
+from openslides_backend.migrations.dict_migration import DictMigrationMixin
+
+
+def get_migration(module_name: str) -> Any:
+    return import_module(
+        f"openslides_backend.migrations.migrations.{module_name}"
+    ).Migration()
+
+
+class DictMigrationTest(TestCase):
+    def test_get_migrations_after(self) -> None:
+        migrations = get_migrations_after(37)
+        assert [migration.target_migration_index for migration in migrations][:3] == [
+            38,
+            39,
+            40,
+        ]
+
+    def test_recent_migrations_are_dict_migrations(self) -> None:
+        assert all(
+            isinstance(migration, DictMigrationMixin)
+            for migration in get_migrations_after(38)
+        )
+
+    def test_remove_user_default_projector(self) -> None:
+        models = {
+            "meeting": {
+                "1": {
+                    "id": 1,
+                    "default_projector_$_ids": ["user", "motion"],
+                    "default_projector_$user_ids": [1],
+                    "default_projector_$motion_ids": [1],
+                }
+            },
+            "projector": {
+                "1": {
+                    "id": 1,
+                    "used_as_default_$_in_meeting_id": ["user"],
+                    "used_as_default_$user_in_meeting_id": 1,
+                }
+            },
+        }
+        get_migration("0038_remove_user_default_projector").migrate_models(models)
+        assert models == {
+            "meeting": {
+                "1": {
+                    "id": 1,
+                    "default_projector_$_ids": ["motion"],
+                    "default_projector_$motion_ids": [1],
+                }
+            },
+            "projector": {"1": {"id": 1}},
+        }
+
+    def test_add_default_language(self) -> None:
+        models = {"organization": {"1": {"id": 1}, "2": {"default_language": "de"}}}
+        get_migration("0039_add_default_language").migrate_models(models)
+        assert models == {
+            "organization": {
+                "1": {"id": 1, "default_language": "en"},
+                "2": {"default_language": "de"},
+            }
+        }
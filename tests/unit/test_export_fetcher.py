@@ -0,0 +1,89 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.meeting.export_helper import (
+    ExportFetcher,
+    FetchPlan,
+    get_meeting_position,
+)
+from openslides_backend.services.datastore.commands import GetManyRequest
+
+
+class ExportFetcherTest(TestCase):
+    def setUp(self) -> None:
+        self.datastore = MagicMock()
+        self.requests: List[GetManyRequest] = []
+
+        def get_many(
+            requests: List[GetManyRequest], **kwargs: Any
+        ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+            self.requests.extend(requests)
+            return {
+                request.collection: {
+                    id: {"id": id, "meta_position": id} for id in request.ids
+                }
+                for request in requests
+            }
+
+        self.datastore.get_many.side_effect = get_many
+        self.plan: FetchPlan = [
+            ("motion", list(range(1, 6)), []),
+            ("topic", [], []),
+            ("user", [7, 8], ["id", "username"]),
+        ]
+
+    def test_fetch_batches(self) -> None:
+        fetcher = ExportFetcher(self.datastore, batch_size=2)
+        result = list(fetcher.fetch(self.plan))
+        assert [collection for collection, _ in result] == ["motion", "topic", "user"]
+        assert sorted(result[0][1]) == [1, 2, 3, 4, 5]
+        assert result[1][1] == {}
+        assert [request.ids for request in self.requests] == [
+            [1, 2],
+            [3, 4],
+            [5],
+            [7, 8],
+        ]
+        assert self.requests[3].mapped_fields == {"id", "username"}
+        assert set(fetcher.timings) == {"motion", "user"}
+        self.datastore.get_database_context.assert_not_called()
+
+    def test_fetch_abort(self) -> None:
+        fetcher = ExportFetcher(self.datastore, batch_size=1)
+        results = fetcher.fetch(self.plan)
+        assert next(results)[0] == "motion"
+        results.close()
+        assert len(self.requests) == 5
+
+    def test_get_meeting_position(self) -> None:
+        self.datastore.get.return_value = {
+            "meta_position": 3,
+            "user_ids": [12],
+            "motion_ids": [4, 9],
+            "topic_ids": [5],
+        }
+
+        def get_many(
+            requests: List[GetManyRequest], **kwargs: Any
+        ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+            self.requests.extend(requests)
+            return {
+                request.collection: {
+                    id: {"id": id, "meta_position": id, "supporter_ids": [14]}
+                    if request.collection == "motion"
+                    else {"id": id, "meta_position": id}
+                    for id in request.ids
+                }
+                for request in requests
+            }
+
+        self.datastore.get_many.side_effect = get_many
+        assert get_meeting_position(self.datastore, 1) == 14
+        assert "user_ids" in self.datastore.get.call_args[0][1]
+        requests = {request.collection: request for request in self.requests}
+        assert requests["topic"].mapped_fields == {"meta_position"}
+        assert {"meta_position", "supporter_ids"} <= requests["motion"].mapped_fields
+        assert requests["user"].mapped_fields == {"meta_position"}
+        assert sorted(requests["user"].ids) == [12, 14]
+        assert list(requests)[-1] == "user"
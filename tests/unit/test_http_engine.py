@@ -0,0 +1,114 @@
+from http.client import RemoteDisconnected
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from openslides_backend.services.datastore.http_engine import HTTPEngine
+from openslides_backend.shared.env import Environment
+from openslides_backend.shared.exceptions import DatastoreConnectionException
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class TestHTTPEngine(TestCase):
+    def setUp(self) -> None:
+        env = Environment({"DATASTORE_CONNECTION_RETRIES": "2"})
+        self.engine = HTTPEngine(
+            "http://reader/internal", "http://writer/internal", MagicMock(), env
+        )
+
+    def test_pool_size(self) -> None:
+        adapter = self.engine.session.get_adapter("http://writer/internal/write")
+        assert adapter._pool_maxsize == 2 * 3  # type: ignore
+
+    def test_retry_idempotent_endpoint(self) -> None:
+        response = MagicMock(content=b"{}", status_code=200)
+        with patch.object(
+            self.engine.session,
+            "post",
+            side_effect=[requests.exceptions.ConnectionError("reset"), response],
+        ) as post:
+            content, status_code = self.engine.retrieve("truncate_db", None)
+        assert post.call_count == 2
+        assert content == b"{}"
+        assert status_code == 200
+
+    def test_retry_idempotent_endpoint_exhausted(self) -> None:
+        with patch.object(
+            self.engine.session,
+            "post",
+            side_effect=requests.exceptions.ConnectionError("reset"),
+        ) as post:
+            with self.assertRaises(DatastoreConnectionException):
+                self.engine.retrieve("truncate_db", None)
+        assert post.call_count == 3
+
+    def test_no_retry_write(self) -> None:
+        with patch.object(
+            self.engine.session,
+            "post",
+            side_effect=requests.exceptions.ConnectionError(
+                ProtocolError("Connection aborted.", ConnectionResetError())
+            ),
+        ) as post:
+            with self.assertRaises(DatastoreConnectionException):
+                self.engine.retrieve("write", "{}")
+        assert post.call_count == 1
+
+    def test_retry_write_not_connected(self) -> None:
+        error = requests.exceptions.ConnectionError(
+            MaxRetryError(MagicMock(), "/", NewConnectionError(MagicMock(), "refused"))
+        )
+        with patch.object(self.engine.session, "post", side_effect=error) as post:
+            with self.assertRaises(DatastoreConnectionException):
+                self.engine.retrieve("write", "{}")
+        assert post.call_count == 3
+
+    def test_no_retry_write_closed_connection(self) -> None:
+        error = requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.", RemoteDisconnected("closed"))
+        )
+        with patch.object(self.engine.session, "post", side_effect=error) as post:
+            with self.assertRaises(DatastoreConnectionException):
+                self.engine.retrieve("write", "{}")
+        assert post.call_count == 1
+
+    def test_pool_stats(self) -> None:
+        pool = MagicMock(num_requests=10, num_connections=3)
+        adapter = self.engine.session.get_adapter("http://writer/internal/write")
+        with patch.object(
+            adapter.poolmanager, "pools", {"writer": pool}  # type: ignore
+        ):
+            assert self.engine.get_pool_stats() == {"hits": 7, "misses": 3}
+
+    def test_pool_stats_keep_alive(self) -> None:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        engine = HTTPEngine(url, url, MagicMock(), Environment({}))
+        for _ in range(3):
+            assert engine.retrieve("write", "{}") == (b"{}", 200)
+        assert engine.get_pool_stats() == {"hits": 2, "misses": 1}
+
+    def test_unknown_endpoint(self) -> None:
+        with self.assertRaises(DatastoreConnectionException):
+            self.engine.retrieve("unknown", None)
@@ -0,0 +1,78 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+from openslides_backend.shared.json_codec import (
+    JSONDecodeError,
+    OrjsonCodec,
+    SimplejsonCodec,
+    get_codec,
+)
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+@dataclass
+class Dummy:
+    a: int
+
+
+class JSONCodecTest(TestCase):
+    codecs = (OrjsonCodec(), SimplejsonCodec())
+
+    def test_dumps(self) -> None:
+        value = {
+            "decimal": Decimal("1.500000"),
+            "point": Point(1, 2),
+            "tuple": (1, "ä"),
+            1: [None, True, 1.5],
+        }
+        for codec in self.codecs:
+            data = codec.dumps(value)
+            assert isinstance(data, bytes)
+            assert codec.loads(data) == {
+                "decimal": "1.500000",
+                "point": {"x": 1, "y": 2},
+                "tuple": [1, "ä"],
+                "1": [None, True, 1.5],
+            }
+
+    def test_dumps_default(self) -> None:
+        def default(value: Any) -> Any:
+            if isinstance(value, Dummy):
+                return {"dummy": value.a}
+            raise TypeError()
+
+        for codec in self.codecs:
+            assert codec.loads(codec.dumps([Dummy(1)], default)) == [{"dummy": 1}]
+            with pytest.raises(TypeError):
+                codec.dumps(Dummy(1))
+            with pytest.raises(TypeError):
+                codec.dumps(datetime.now())
+            with pytest.raises(TypeError):
+                codec.dumps({1, 2})
+
+    def test_loads(self) -> None:
+        for codec in self.codecs:
+            assert codec.loads('{"a": [1, 2.5]}') == {"a": [1, 2.5]}
+            assert codec.loads(b'"\\u00e4"') == "ä"
+            with pytest.raises(JSONDecodeError):
+                codec.loads(b"{")
+            with pytest.raises(JSONDecodeError):
+                codec.loads("")
+
+    def test_get_codec(self) -> None:
+        env = MagicMock(OPENSLIDES_BACKEND_JSON_CODEC="simplejson")
+        assert isinstance(get_codec(env), SimplejsonCodec)
+        env.OPENSLIDES_BACKEND_JSON_CODEC = "json"
+        with pytest.raises(ValueError) as e:
+            get_codec(env)
+        assert str(e.value) == (
+            "Invalid OPENSLIDES_BACKEND_JSON_CODEC: json. Use one of: orjson, simplejson"
+        )
@@ -0,0 +1,86 @@
+from typing import Any, Iterator, Tuple
+from unittest import TestCase
+
+import simplejson as json
+
+from openslides_backend.shared import json_codec
+from openslides_backend.shared.json_stream import (
+    StreamedDict,
+    contains_stream,
+    iter_encode,
+)
+
+
+class JsonStreamTest(TestCase):
+    def setUp(self) -> None:
+        self.produced = 0
+
+    def get_items(self) -> Iterator[Tuple[str, Any]]:
+        for collection in ("meeting", "motion", "user"):
+            self.produced += 1
+            yield collection, {"1": {"id": 1, "name": collection}}
+
+    def test_contains_stream(self) -> None:
+        stream = StreamedDict(self.get_items)
+        assert contains_stream(stream)
+        assert contains_stream([stream])
+        assert contains_stream({"a": stream})
+        assert not contains_stream([{"a": 1}])
+        assert not contains_stream("abc")
+        assert self.produced == 0
+
+    def test_iter_encode_lazy(self) -> None:
+        chunks = iter_encode([StreamedDict(self.get_items)])
+        assert next(chunks) == b"["
+        assert self.produced == 0
+        assert json.loads(b"[" + b"".join(chunks)) == [
+            {
+                "meeting": {"1": {"id": 1, "name": "meeting"}},
+                "motion": {"1": {"id": 1, "name": "motion"}},
+                "user": {"1": {"id": 1, "name": "user"}},
+            }
+        ]
+        assert self.produced == 3
+
+    def test_iter_encode_nested(self) -> None:
+        value = {"a": [1, 2], "b": StreamedDict(lambda: iter([])), "c": None}
+        assert json.loads(b"".join(iter_encode(value))) == {
+            "a": [1, 2],
+            "b": {},
+            "c": None,
+        }
+
+    def test_iter_encode_plain(self) -> None:
+        value = [{"a": 1}, "b"]
+        assert list(iter_encode(value)) == [json_codec.dumps(value)]
+
+    def get_failing_items(self) -> Iterator[Tuple[str, Any]]:
+        yield "meeting", {"1": {"id": 1}}
+        raise ValueError("broken")
+
+    def test_iter_encode_error(self) -> None:
+        errors = []
+
+        def on_error(exception: Exception) -> str:
+            errors.append(exception)
+            return "failed"
+
+        value = {"a": StreamedDict(self.get_failing_items)}
+        data = b"".join(iter_encode(value, on_error))
+        assert json.loads(data) == {
+            "a": {"meeting": {"1": {"id": 1}}, "stream_error": "failed"}
+        }
+        assert len(errors) == 1
+
+    def test_iter_encode_error_pending_value(self) -> None:
+        def get_items() -> Iterator[Tuple[str, Any]]:
+            yield "a", [StreamedDict(self.get_failing_items)]
+
+        data = b"".join(iter_encode(StreamedDict(get_items), lambda e: "failed"))
+        assert json.loads(data) == {
+            "a": [{"meeting": {"1": {"id": 1}}, "stream_error": "failed"}]
+        }
+
+    def test_iter_encode_error_raised(self) -> None:
+        with self.assertRaises(ValueError):
+            b"".join(iter_encode([StreamedDict(self.get_failing_items)]))
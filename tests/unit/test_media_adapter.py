@@ -0,0 +1,98 @@
+import base64
+import json
+from typing import Any, List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+from openslides_backend.services.media.adapter import (
+    UPLOAD_CHUNK_SIZE,
+    MediaServiceAdapter,
+    UploadBody,
+)
+from openslides_backend.shared.exceptions import MediaServiceException
+
+
+def read_body(body: UploadBody) -> bytes:
+    chunks: List[bytes] = []
+    while chunk := body.read(8192):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class UploadBodyTest(TestCase):
+    def test_body(self) -> None:
+        file = "dGVzdA==" * UPLOAD_CHUNK_SIZE
+        body = UploadBody(file, {"id": 1, "mimetype": "text/plain"})
+        data = read_body(body)
+        assert len(data) == len(body)
+        assert json.loads(data) == {"id": 1, "mimetype": "text/plain", "file": file}
+
+    def test_body_escaped(self) -> None:
+        body = UploadBody('a"\\ä', {"id": 1})
+        data = read_body(body)
+        assert len(data) == len(body)
+        assert json.loads(data) == {"id": 1, "file": 'a"\\ä'}
+
+    def test_body_wrapped_base64(self) -> None:
+        file = base64.encodebytes(b"test" * 100).decode()
+        assert "\n" in file
+        body = UploadBody(file, {"id": 1})
+        data = b"".join(body.iter_chunks())
+        assert len(data) == len(body)
+        assert json.loads(data) == {"id": 1, "file": file}
+
+    def test_read_size(self) -> None:
+        body = UploadBody("dGVzdA==", {"id": 1})
+        data = b"".join(body.iter_chunks())
+        assert [body.read(5) for _ in range(0, len(data), 5)] == [
+            data[i : i + 5] for i in range(0, len(data), 5)
+        ]
+        assert body.read(5) == b""
+
+    def test_read_all(self) -> None:
+        body = UploadBody("dGVzdA==" * UPLOAD_CHUNK_SIZE, {"id": 1})
+        first = body.read(3)
+        assert first + body.read() == b"".join(body.iter_chunks())
+        assert body.read() == b""
+
+
+class MediaServiceAdapterTest(TestCase):
+    def setUp(self) -> None:
+        self.adapter = MediaServiceAdapter("http://media", MagicMock())
+        self.session = MagicMock()
+        self.session.post.return_value.status_code = 200
+        self.adapter.session = self.session
+
+    def test_duplicate_mediafiles(self) -> None:
+        self.adapter.duplicate_mediafiles([(i, i + 100) for i in range(20)])
+        payloads = [
+            json.loads(call[1]["data"]) for call in self.session.post.call_args_list
+        ]
+        assert sorted(payload["source_id"] for payload in payloads) == list(range(20))
+        assert all(
+            payload["target_id"] == payload["source_id"] + 100 for payload in payloads
+        )
+
+    def test_upload_mediafiles(self) -> None:
+        self.adapter.upload_mediafiles([("dGVzdA==", 1, "text/plain")])
+        call = self.session.post.call_args
+        assert call[0][0] == "http://media/upload_mediafile/"
+        assert json.loads(read_body(call[1]["data"])) == {
+            "id": 1,
+            "mimetype": "text/plain",
+            "file": "dGVzdA==",
+        }
+
+    def test_upload_mediafiles_error(self) -> None:
+        def post(url: str, data: Any, **kwargs: Any) -> Any:
+            response = MagicMock()
+            response.status_code = 500 if b'"id": 3' in data.head else 200
+            return response
+
+        self.session.post.side_effect = post
+        with pytest.raises(MediaServiceException):
+            self.adapter.upload_mediafiles(
+                [("dGVzdA==", i, "text/plain") for i in range(10)]
+            )
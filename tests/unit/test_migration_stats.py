@@ -0,0 +1,58 @@
+from typing import Any, List, Optional
+from unittest import TestCase
+
+from openslides_backend.migrations.migration_stats import (
+    MigrationStats,
+    instrument_migration,
+    migration_stats,
+)
+
+
+class MigrationStatsTest(TestCase):
+    def test_stats(self) -> None:
+        stats = MigrationStats()
+        stats.add_position("0001_a", 10, 1.0)
+        stats.add_position("0001_a", 30, 1.0)
+        stats.add_position("0002_b", 5, 0.5)
+        result = stats.get_stats(remaining_positions=10)
+        assert result["migrations"]["0001_a"] == {
+            "positions": 2,
+            "events": 40,
+            "seconds": 2.0,
+            "events_per_second": 20.0,
+            "positions_per_second": 1.0,
+        }
+        assert result["migrations"]["0002_b"]["events_per_second"] == 10.0
+        assert result["eta"] == 15
+
+    def test_stats_empty(self) -> None:
+        stats = MigrationStats()
+        assert stats.get_stats(remaining_positions=10) == {
+            "migrations": {},
+            "eta": None,
+        }
+        stats.add_position("0001_a", 10, 1.0)
+        stats.reset()
+        assert stats.get_stats() == {"migrations": {}, "eta": None}
+
+    def test_instrument_migration(self) -> None:
+        class Migration:
+            def position_init(self) -> None:
+                pass
+
+            def migrate_event(self, event: Any) -> Optional[List[Any]]:
+                return None
+
+            def get_additional_events(self) -> Optional[List[Any]]:
+                return None
+
+        Migration.__module__ = "migrations.0001_a"
+        migration = instrument_migration(Migration)()  # type: ignore
+        migration_stats.reset()
+        migration.position_init()
+        for event in range(3):
+            migration.migrate_event(event)
+        migration.get_additional_events()
+        stats = migration_stats.get_stats()["migrations"]["0001_a"]
+        assert stats["positions"] == 1
+        assert stats["events"] == 3
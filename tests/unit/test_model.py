@@ -6,6 +6,7 @@ from fastjsonschema import validate
 from openslides_backend.action.util.default_schema import DefaultSchema
 from openslides_backend.models import fields
 from openslides_backend.models.base import Model
+from openslides_backend.models.models import User
 from openslides_backend.shared.exceptions import ActionException
 
 
@@ -84,6 +85,43 @@ class ModelBaseTester(TestCase):
             [field.own_field_name for field in FakeModel().get_fields()],
         )
 
+    def test_get_relation_fields(self) -> None:
+        self.assertEqual(
+            ["fake_model_2_generic_ids", "fake_model_2_ids"],
+            [field.own_field_name for field in FakeModel().get_relation_fields()],
+        )
+        self.assertEqual(
+            ["generic_relation_field", "relation_field"],
+            [
+                field.own_field_name
+                for field in FakeModel2().get_relation_fields_to("fake_model")
+            ],
+        )
+        self.assertEqual((), FakeModel2().get_relation_fields_to("unknown"))
+
+    def test_get_required_fields(self) -> None:
+        self.assertEqual(
+            ["id", "text"],
+            [field.own_field_name for field in FakeModel().get_required_fields()],
+        )
+
+    def test_try_get_structured_field(self) -> None:
+        user = User()
+        template_field = user.get_field("group__ids")
+        self.assertIs(user.try_get_field("group_$_ids"), template_field)
+        self.assertIs(user.try_get_field("group_$42_ids"), template_field)
+        self.assertIsNone(user.try_get_field("group_$42_idsx"))
+        self.assertIsNone(user.try_get_field("unknown_$42_ids"))
+        hits = User.try_get_structured_field.cache_info().hits  # type: ignore
+        user.try_get_field("group_$42_ids")
+        self.assertEqual(
+            User.try_get_structured_field.cache_info().hits, hits + 1  # type: ignore
+        )
+
+    def test_model_singleton(self) -> None:
+        self.assertIs(FakeModel(), FakeModel())
+        self.assertIsNot(FakeModel(), FakeModel2())
+
     def test_own_collection_attr(self) -> None:
         rels = [
             FakeModel().get_field("fake_model_2_ids"),
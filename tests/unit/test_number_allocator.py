@@ -0,0 +1,48 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from datastore.shared.util import DeletedModelsBehaviour
+
+from openslides_backend.action.util.number_allocator import NumberAllocator
+from openslides_backend.shared.filters import FilterOperator
+
+
+class NumberAllocatorTest(TestCase):
+    def setUp(self) -> None:
+        self.datastore = MagicMock()
+        self.datastore.max.return_value = 5
+        self.allocator = NumberAllocator(self.datastore)
+        self.filter = FilterOperator("meeting_id", "=", 1)
+
+    def test_allocate_consecutive(self) -> None:
+        numbers = [
+            self.allocator.allocate("motion", self.filter, "sequential_number")
+            for _ in range(3)
+        ]
+        assert numbers == [6, 7, 8]
+        self.datastore.max.assert_called_once_with(
+            collection="motion",
+            filter=self.filter,
+            field="sequential_number",
+            get_deleted_models=DeletedModelsBehaviour.NO_DELETED,
+        )
+
+    def test_allocate_empty(self) -> None:
+        self.datastore.max.return_value = None
+        assert self.allocator.allocate("group", self.filter, "weight") == 1
+
+    def test_allocate_per_key(self) -> None:
+        assert self.allocator.allocate("motion", self.filter, "sequential_number") == 6
+        assert self.allocator.allocate("topic", self.filter, "sequential_number") == 6
+        assert self.allocator.allocate("motion", self.filter, "weight") == 6
+        assert self.datastore.max.call_count == 3
+
+    def test_reserve(self) -> None:
+        assert self.allocator.allocate("group", self.filter, "weight") == 6
+        self.allocator.reserve("group", self.filter, "weight", 10)
+        self.allocator.reserve("group", self.filter, "weight", 3)
+        assert self.allocator.allocate("group", self.filter, "weight") == 11
+
+    def test_reserve_before_allocate(self) -> None:
+        self.allocator.reserve("group", self.filter, "weight", 10)
+        assert self.allocator.allocate("group", self.filter, "weight") == 6
@@ -1,5 +1,12 @@
-from openslides_backend.permissions.permission_helper import is_child_permission
-from openslides_backend.permissions.permissions import Permissions
+from openslides_backend.permissions.permission_helper import (
+    is_child_permission,
+    is_implied_by_any,
+)
+from openslides_backend.permissions.permissions import (
+    Permissions,
+    permission_ancestors,
+    permission_descendants,
+)
 
 
 def test_is_child_permission_equal() -> None:
@@ -42,3 +49,24 @@ def test_is_child_permission_different_collections() -> None:
     assert not is_child_permission(
         Permissions.AgendaItem.CAN_SEE, Permissions.Motion.CAN_MANAGE
     )
+
+
+def test_permission_closure_consistent() -> None:
+    for permission, ancestors in permission_ancestors.items():
+        assert permission in ancestors
+        for ancestor in ancestors:
+            assert permission in permission_descendants[ancestor]
+
+
+def test_is_implied_by_any() -> None:
+    assert is_implied_by_any(
+        Permissions.Motion.CAN_SEE,
+        [[Permissions.AgendaItem.CAN_SEE], [Permissions.Motion.CAN_MANAGE]],
+    )
+
+
+def test_is_implied_by_any_not_implied() -> None:
+    assert not is_implied_by_any(
+        Permissions.Motion.CAN_MANAGE,
+        [[Permissions.AgendaItem.CAN_MANAGE], [Permissions.Motion.CAN_SEE], []],
+    )
@@ -0,0 +1,84 @@
+from typing import Any, Dict
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.permissions.management_levels import OrganizationManagementLevel
+from openslides_backend.permissions.permission_helper import has_perm
+from openslides_backend.permissions.permission_resolver import get_permission_resolver
+from openslides_backend.permissions.permissions import Permissions
+
+
+class PermissionResolverTest(TestCase):
+    def setUp(self) -> None:
+        self.user: Dict[str, Any] = {"group_$1_ids": [1]}
+        self.groups: Dict[int, Dict[str, Any]] = {
+            1: {"permissions": [Permissions.Motion.CAN_MANAGE]}
+        }
+        self.datastore = MagicMock()
+        self.datastore.locked_fields = {}
+        self.datastore.changed_models = {}
+        self.datastore.get.side_effect = lambda *args, **kwargs: self.user
+
+        def get_many(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            self.datastore.locked_fields["group/1/permissions"] = 42
+            return {"group": self.groups}
+
+        self.datastore.get_many.side_effect = get_many
+        self.resolver = get_permission_resolver(self.datastore)
+
+    def test_resolver_per_datastore(self) -> None:
+        assert get_permission_resolver(self.datastore) is self.resolver
+        assert get_permission_resolver(MagicMock()) is not self.resolver
+
+    def test_memoized(self) -> None:
+        for _ in range(3):
+            assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        assert not has_perm(self.datastore, 1, Permissions.AgendaItem.CAN_SEE, 1)
+        assert self.datastore.get.call_count == 1
+        assert self.datastore.get_many.call_count == 1
+        assert self.resolver.get_stats() == {"hits": 3, "misses": 1}
+
+    def test_locks_reapplied(self) -> None:
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        self.datastore.locked_fields = {}
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        assert self.datastore.locked_fields == {"group/1/permissions": 42}
+
+    def test_changed_model_invalidates(self) -> None:
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        self.groups[1] = {"permissions": []}
+        self.datastore.changed_models["group/1"] = self.groups[1]
+        assert not has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        assert self.resolver.get_stats() == {"hits": 0, "misses": 2}
+
+    def test_reset(self) -> None:
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        self.resolver.reset()
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        assert self.datastore.get.call_count == 2
+
+    def test_superadmin(self) -> None:
+        self.user = {
+            "organization_management_level": OrganizationManagementLevel.SUPERADMIN
+        }
+        assert has_perm(self.datastore, 1, Permissions.AgendaItem.CAN_MANAGE, 1)
+        self.datastore.get_many.assert_not_called()
+
+    def test_admin_group(self) -> None:
+        self.groups[1]["admin_group_for_meeting_id"] = 1
+        assert has_perm(self.datastore, 1, Permissions.AgendaItem.CAN_MANAGE, 1)
+
+    def test_no_groups(self) -> None:
+        self.user = {}
+        assert not has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        self.datastore.get_many.assert_not_called()
+
+    def test_group_permissions(self) -> None:
+        self.groups[2] = {"permissions": [Permissions.AgendaItem.CAN_SEE]}
+        assert self.resolver.get_group_permissions(self.datastore, 1, 1) == (
+            frozenset([Permissions.Motion.CAN_MANAGE]),
+            frozenset([Permissions.AgendaItem.CAN_SEE]),
+        )
+        assert has_perm(self.datastore, 1, Permissions.AgendaItem.CAN_SEE, 1)
+        assert has_perm(self.datastore, 1, Permissions.Motion.CAN_SEE, 1)
+        assert not has_perm(self.datastore, 1, Permissions.AgendaItem.CAN_MANAGE, 1)
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from openslides_backend.migrations.migration_stats import (
+    instrument_migration,
+    migration_stats,
+)
+from openslides_backend.migrations.position_local import (
+    PositionLocalMigrationMixin,
+    PositionLocalPool,
+    position_local_pool,
+)
+
+
+class Event:
+    def __init__(self, fqid: str, data: Any) -> None:
+        self.fqid = fqid
+        self.data = data
+
+
+class DoubleMigration(PositionLocalMigrationMixin):
+    """
+    Doubles the data of all motions and orders the events by their fqid.
+    """
+
+    target_migration_index = 2
+    migrated_events = 0
+
+    def position_init(self) -> None:
+        pass
+
+    def order_events(self, events: List[Event]) -> List[Event]:
+        return sorted(events, key=lambda event: event.fqid)
+
+    def migrate_event(self, event: Event) -> Optional[List[Event]]:
+        DoubleMigration.migrated_events += 1
+        if event.fqid.startswith("motion/"):
+            return [Event(event.fqid, event.data * 2)]
+        return None
+
+    def get_additional_events(self) -> Optional[List[Event]]:
+        return None
+
+
+def get_events(position: int) -> List[Event]:
+    return [Event(f"user/{position}", position), Event(f"motion/{position}", position)]
+
+
+class PositionLocalTest(TestCase):
+    def setUp(self) -> None:
+        self.positions = {position: get_events(position) for position in range(1, 8)}
+        self.reads: List[Tuple[int, int, int]] = []
+        DoubleMigration.migrated_events = 0
+
+    def read_positions(
+        self, migration_index: int, after_position: int, limit: int
+    ) -> List[Tuple[int, List[Any]]]:
+        self.reads.append((migration_index, after_position, limit))
+        return [
+            (position, get_events(position))
+            for position in sorted(self.positions)
+            if position > after_position
+        ][:limit]
+
+    def assert_results(self, position: int, results: Any) -> None:
+        assert results is not None
+        migrated_events, additional_events = results
+        assert migrated_events[0] is not None
+        assert [(e.fqid, e.data) for e in migrated_events[0]] == [
+            (f"motion/{position}", position * 2)
+        ]
+        assert migrated_events[1] is None
+        assert additional_events is None
+
+    def test_migrate_batches(self) -> None:
+        pool = PositionLocalPool(self.read_positions, batch_size=2, processes=2)
+        pool.start()
+        try:
+            for position in range(1, 8):
+                results = pool.get_results(DoubleMigration, get_events(position))  # type: ignore
+                self.assert_results(position, results)
+        finally:
+            pool.stop()
+        assert self.reads[:4] == [(1, 0, 2), (1, 2, 2), (1, 4, 2), (1, 6, 2)]
+        assert DoubleMigration.migrated_events == 0
+
+    def test_skipped_and_unknown_positions(self) -> None:
+        pool = PositionLocalPool(self.read_positions, batch_size=3, processes=2)
+        pool.start()
+        try:
+            self.assert_results(2, pool.get_results(DoubleMigration, get_events(2)))  # type: ignore
+            assert pool.get_results(DoubleMigration, get_events(10)) is None  # type: ignore
+            self.assert_results(4, pool.get_results(DoubleMigration, get_events(4)))  # type: ignore
+        finally:
+            pool.stop()
+
+    def test_single_process(self) -> None:
+        pool = PositionLocalPool(self.read_positions, processes=1)
+        pool.start()
+        assert pool.get_results(DoubleMigration, get_events(1)) is None  # type: ignore
+        pool.stop()
+        assert self.reads == []
+
+    def test_instrumented_migration(self) -> None:
+        migration = instrument_migration(DoubleMigration)()  # type: ignore
+        migration_stats.reset()
+        with patch.object(
+            position_local_pool, "read_positions", self.read_positions
+        ), patch.object(position_local_pool, "processes", 2):
+            position_local_pool.start()
+            try:
+                for position in range(1, 4):
+                    migration.position_init()
+                    events = migration.order_events(get_events(position))
+                    results = [migration.migrate_event(event) for event in events]
+                    additional_events = migration.get_additional_events()
+                    self.assert_results(position, (results, additional_events))
+            finally:
+                position_local_pool.stop()
+        assert DoubleMigration.migrated_events == 0
+        stats: Dict[str, Any] = migration_stats.get_stats()["migrations"]
+        assert stats["test_position_local"]["positions"] == 3
+        assert stats["test_position_local"]["events"] == 6
@@ -0,0 +1,96 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.util.prefetch import prefetch
+from openslides_backend.services.datastore.commands import GetManyRequest
+
+
+class TestPrefetch(TestCase):
+    def setUp(self) -> None:
+        self.data: Dict[str, Dict[int, Dict[str, Any]]] = {
+            "poll": {
+                1: {"meeting_id": 1, "entitled_group_ids": [1, 2]},
+                2: {"meeting_id": 1, "entitled_group_ids": [2, 3]},
+            },
+            "meeting": {1: {"default_group_id": 4}},
+            "group": {i: {"user_ids": [i]} for i in range(1, 5)},
+        }
+        self.datastore = MagicMock()
+        self.datastore.get_many.side_effect = self.get_many
+
+    def get_many(
+        self, requests: List[GetManyRequest], **kwargs: Any
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        return {
+            request.collection: {
+                id: self.data[request.collection][id]
+                for id in request.ids
+                if id in self.data.get(request.collection, {})
+            }
+            for request in requests
+        }
+
+    def get_requests(self, call_index: int) -> Dict[str, GetManyRequest]:
+        requests = self.datastore.get_many.call_args_list[call_index][0][0]
+        return {request.collection: request for request in requests}
+
+    def test_one_request_per_level(self) -> None:
+        prefetch(
+            self.datastore,
+            "poll",
+            [{"id": 1}, {"id": 2}, {"id": 3}],
+            {
+                "id": ["state"],
+                "id.meeting_id": ["name"],
+                "id.meeting_id.default_group_id": ["permissions"],
+                "id.entitled_group_ids": ["user_ids"],
+            },
+        )
+        assert self.datastore.get_many.call_count == 3
+        poll_request = self.get_requests(0)["poll"]
+        assert sorted(poll_request.ids) == [1, 2, 3]
+        assert poll_request.mapped_fields == {
+            "state",
+            "meeting_id",
+            "entitled_group_ids",
+        }
+        second_level = self.get_requests(1)
+        assert second_level["meeting"].ids == [1]
+        assert second_level["meeting"].mapped_fields == {"name", "default_group_id"}
+        assert sorted(second_level["group"].ids) == [1, 2, 3]
+        third_level = self.get_requests(2)
+        assert third_level["group"].ids == [4]
+        assert third_level["group"].mapped_fields == {"permissions"}
+
+    def test_use_changed_models(self) -> None:
+        prefetch(
+            self.datastore,
+            "poll",
+            [{"id": 1}],
+            {"id.meeting_id": ["name"]},
+            use_changed_models=False,
+        )
+        assert self.datastore.get_many.call_count == 2
+        for call in self.datastore.get_many.call_args_list:
+            assert call[1] == {"use_changed_models": False}
+
+    def test_skip_malformed_values(self) -> None:
+        prefetch(
+            self.datastore,
+            "poll",
+            [{"meeting_id": "1"}, {"meeting_id": None}],
+            {"meeting_id": ["name"]},
+        )
+        self.datastore.get_many.assert_not_called()
+
+    def test_generic_relation(self) -> None:
+        prefetch(
+            self.datastore,
+            "poll",
+            [{"content_object_id": "motion/1"}, {"content_object_id": "topic/2"}],
+            {"content_object_id": ["meeting_id"]},
+        )
+        requests = self.get_requests(0)
+        assert requests["motion"].ids == [1]
+        assert requests["topic"].ids == [2]
@@ -0,0 +1,75 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.action.relations.relation_manager import RelationManager
+from openslides_backend.models.models import Group, User
+from openslides_backend.services.datastore.commands import GetManyRequest
+
+
+class RelationManagerPrefetchTest(TestCase):
+    def setUp(self) -> None:
+        self.datastore = MagicMock()
+        self.datastore.is_new.return_value = False
+        self.datastore.is_deleted.return_value = False
+        self.db: Dict[str, Dict[int, Dict[str, Any]]] = {
+            "user": {
+                1: {"group_$1_ids": [3, 5], "is_present_in_meeting_ids": [4]},
+                2: {},
+            },
+        }
+        self.requests: List[List[GetManyRequest]] = []
+
+        def get_many(
+            requests: List[GetManyRequest], **kwargs: Any
+        ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+            self.requests.append(requests)
+            return {
+                request.collection: {
+                    id: self.db.get(request.collection, {}).get(id, {})
+                    for id in request.ids
+                }
+                for request in requests
+            }
+
+        self.datastore.get_many.side_effect = get_many
+        self.relation_manager = RelationManager(self.datastore)
+
+    def test_prefetch_relations(self) -> None:
+        self.relation_manager.prefetch_relations(
+            User(),
+            [
+                {
+                    "id": 1,
+                    "group_$_ids": {"1": [2, 3]},
+                    "is_present_in_meeting_ids": [4],
+                },
+                {"id": 2, "is_present_in_meeting_ids": [4], "username": "test"},
+            ],
+        )
+        assert len(self.requests) == 2
+        current, reverse = self.requests
+        assert current == [
+            GetManyRequest(
+                "user", [1, 2], ["group_$1_ids", "is_present_in_meeting_ids"]
+            )
+        ]
+        assert self.datastore.get_many.call_args_list[0][1] == {
+            "use_changed_models": False
+        }
+        reverse_ids = {request.collection: request.ids for request in reverse}
+        assert sorted(reverse_ids["group"]) == [2, 5]
+        assert reverse_ids["meeting"] == [4]
+
+    def test_prefetch_relations_new_model(self) -> None:
+        self.datastore.is_new.side_effect = lambda fqid: fqid == "group/1"
+        self.relation_manager.prefetch_relations(
+            Group(), [{"id": 1, "mediafile_access_group_ids": [2], "name": "test"}]
+        )
+        assert self.requests == [
+            [GetManyRequest("mediafile", [2], ["access_group_ids"])]
+        ]
+
+    def test_prefetch_relations_no_relations(self) -> None:
+        self.relation_manager.prefetch_relations(User(), [{"id": 1, "username": "a"}])
+        self.datastore.get_many.assert_not_called()
@@ -0,0 +1,93 @@
+from typing import Any, Dict
+from unittest import TestCase
+
+import pytest
+
+import openslides_backend.models.models  # noqa: F401
+from openslides_backend.action.util.remap import ReplaceMap, get_remapper
+from openslides_backend.shared.exceptions import ActionException
+
+ALLOWED_COLLECTIONS = ("meeting", "motion", "group", "user", "agenda_item", "topic")
+
+
+class RemapTest(TestCase):
+    def setUp(self) -> None:
+        self.replace_map: ReplaceMap = {
+            "meeting": {1: 11},
+            "motion": {2: 12, 3: 13},
+            "group": {4: 14, 5: 15},
+            "user": {6: 16},
+            "agenda_item": {7: 17},
+            "topic": {8: 18},
+        }
+
+    def remap(self, collection: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        for field in list(entry.keys()):
+            get_remapper(collection, field, ALLOWED_COLLECTIONS)(
+                entry, field, self.replace_map
+            )
+        return entry
+
+    def test_relations(self) -> None:
+        assert self.remap(
+            "motion",
+            {
+                "id": 2,
+                "meeting_id": 1,
+                "lead_motion_id": None,
+                "amendment_ids": [3],
+                "title": "test",
+            },
+        ) == {
+            "id": 12,
+            "meeting_id": 11,
+            "lead_motion_id": None,
+            "amendment_ids": [13],
+            "title": "test",
+        }
+
+    def test_generic_relations(self) -> None:
+        assert self.remap("agenda_item", {"id": 7, "content_object_id": "topic/8"}) == {
+            "id": 17,
+            "content_object_id": "topic/18",
+        }
+        assert self.remap(
+            "motion",
+            {"id": 2, "state_extension_reference_ids": ["motion/2", "motion/3"]},
+        ) == {"id": 12, "state_extension_reference_ids": ["motion/12", "motion/13"]}
+
+    def test_extension(self) -> None:
+        assert self.remap(
+            "motion",
+            {
+                "id": 2,
+                "state_extension": "a [motion/3] b",
+                "recommendation_extension": "",
+            },
+        ) == {
+            "id": 12,
+            "state_extension": "a [motion/13] b",
+            "recommendation_extension": "",
+        }
+
+    def test_template_fields(self) -> None:
+        assert self.remap(
+            "user",
+            {"id": 6, "group_$_ids": ["1"], "group_$1_ids": [4, 5], "meeting_ids": [1]},
+        ) == {
+            "id": 16,
+            "group_$_ids": ["11"],
+            "group_$11_ids": [14, 15],
+            "meeting_ids": None,
+        }
+
+    def test_not_allowed_collection(self) -> None:
+        assert self.remap("meeting", {"id": 1, "committee_id": 9}) == {
+            "id": 11,
+            "committee_id": 9,
+        }
+
+    def test_unknown_field(self) -> None:
+        with pytest.raises(ActionException) as e:
+            get_remapper("motion", "unknown", ALLOWED_COLLECTIONS)
+        assert str(e.value.message) == "motion/unknown is not allowed."
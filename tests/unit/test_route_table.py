@@ -0,0 +1,53 @@
+from typing import Optional, Tuple
+from unittest import TestCase
+
+from openslides_backend.http.request import Request
+from openslides_backend.http.views.base_view import BaseView, get_route_table, route
+from openslides_backend.shared.interfaces.wsgi import ResponseBody
+
+
+class DummyView(BaseView):
+    @route(["handle_request", "handle_separately"])
+    def dummy_route(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
+        return {}, None
+
+    @route("health", method="GET", json=False)
+    def health_route(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
+        return {}, None
+
+    @route("item/[0-9]+", internal=True)
+    def item_route(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
+        return {}, None
+
+
+class RouteTableTest(TestCase):
+    def test_paths(self) -> None:
+        route_table = get_route_table(DummyView)
+        assert route_table is get_route_table(DummyView)
+        assert set(route_table.paths) == {
+            "/system/dummy/handle_request",
+            "/system/dummy/handle_request/",
+            "/system/dummy/handle_separately",
+            "/system/dummy/handle_separately/",
+            "/system/dummy/health",
+            "/system/dummy/health/",
+        }
+
+    def test_get(self) -> None:
+        route_table = get_route_table(DummyView)
+        for path, function in (
+            ("/system/dummy/handle_request", DummyView.dummy_route),
+            ("/system/dummy/handle_separately/", DummyView.dummy_route),
+            ("/system/dummy/health", DummyView.health_route),
+            ("/internal/item/42", DummyView.item_route),
+            ("/internal/item/42/", DummyView.item_route),
+        ):
+            route_options = route_table.get(path)
+            assert route_options is not None
+            assert route_options["function"] is function
+        for path in (
+            "/system/dummy/handle_request?query",
+            "/system/dummy/unknown",
+            "/internal/item/abc",
+        ):
+            assert route_table.get(path) is None
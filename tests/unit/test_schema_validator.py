@@ -0,0 +1,68 @@
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import fastjsonschema
+import pytest
+
+from openslides_backend.shared.schema_validator import (
+    SchemaValidator,
+    build_schema_cache,
+    get_schema_cache_path,
+    get_schema_hash,
+    load_schema_cache,
+)
+from openslides_backend.shared.typing import Schema
+
+
+class SchemaValidatorTest(TestCase):
+    def test_lazy(self) -> None:
+        validator = SchemaValidator({"type": "integer", "minimum": 1})
+        assert validator.validator is None
+        validator(1)
+        assert validator.validator is not None
+        with pytest.raises(fastjsonschema.JsonSchemaException):
+            validator(0)
+
+    def test_shared(self) -> None:
+        first = SchemaValidator({"type": "string", "maxLength": 3})
+        second = SchemaValidator({"maxLength": 3, "type": "string"})
+        first("a")
+        second("b")
+        assert first.validator is second.validator
+
+    def test_schema_cache(self) -> None:
+        schemas: List[Schema] = [
+            {"type": ["integer", "null"], "minimum": 1},
+            {"type": "string", "pattern": "^[a-z]+$"},
+            {"type": "string", "pattern": "^[a-z]+$"},
+        ]
+        with TemporaryDirectory() as path:
+            assert build_schema_cache(path, schemas) == 2
+            factories = load_schema_cache(path)
+        assert set(factories) == {get_schema_hash(schema) for schema in schemas}
+        validator = factories[get_schema_hash(schemas[1])]()
+        validator("abc")
+        with pytest.raises(fastjsonschema.JsonSchemaException) as e:
+            validator("ABC")
+        assert e.value.message == "data must match pattern ^[a-z]+$"
+
+    def test_schema_cache_missing(self) -> None:
+        assert load_schema_cache("") == {}
+        with TemporaryDirectory() as path:
+            assert load_schema_cache(path) == {}
+
+    def test_schema_cache_path(self) -> None:
+        env = MagicMock(OPENSLIDES_BACKEND_SCHEMA_CACHE="")
+        assert get_schema_cache_path(env) == ""
+        with TemporaryDirectory() as path:
+            env.OPENSLIDES_BACKEND_SCHEMA_CACHE = path
+            assert get_schema_cache_path(env) == path
+        with NamedTemporaryFile() as f:
+            env.OPENSLIDES_BACKEND_SCHEMA_CACHE = f.name
+            with pytest.raises(ValueError) as e:
+                get_schema_cache_path(env)
+        assert str(e.value) == (
+            f"Invalid OPENSLIDES_BACKEND_SCHEMA_CACHE: {f.name} is not a directory"
+        )
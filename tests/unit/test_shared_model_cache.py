@@ -0,0 +1,130 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.services.datastore.extended_adapter import (
+    ExtendedDatastoreAdapter,
+)
+from openslides_backend.services.datastore.shared_cache import SharedModelCache
+from openslides_backend.shared.exceptions import DatastoreLockedException
+from openslides_backend.shared.interfaces.event import EventType
+from openslides_backend.shared.interfaces.write_request import WriteRequest
+
+
+class TestSharedModelCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = SharedModelCache(max_size=4, max_age=60)
+
+    def test_get_all_fields_cached(self) -> None:
+        self.cache.update("a/1", 5, {"f": 1}, ["f", "g"])
+        assert self.cache.get("a/1", ["f", "g"]) == (5, {"f": 1})
+        assert self.cache.get("a/1", ["f", "h"]) is None
+        assert self.cache.get_stats()["hits"] == 1
+        assert self.cache.get_stats()["misses"] == 1
+
+    def test_newer_position_replaces_model(self) -> None:
+        self.cache.update("a/1", 5, {"f": 1, "g": 1}, ["f", "g"])
+        self.cache.update("a/1", 6, {"f": 2}, ["f"])
+        assert self.cache.get("a/1", ["f"]) == (6, {"f": 2})
+        assert self.cache.get("a/1", ["g"]) is None
+
+    def test_older_position_is_ignored(self) -> None:
+        self.cache.update("a/1", 6, {"f": 2}, ["f"])
+        self.cache.update("a/1", 5, {"f": 1}, ["f"])
+        assert self.cache.get("a/1", ["f"]) == (6, {"f": 2})
+
+    def test_lru_eviction(self) -> None:
+        self.cache.update("a/1", 1, {"f": 1, "g": 1}, ["f", "g"])
+        self.cache.update("a/2", 1, {"f": 1, "g": 1}, ["f", "g"])
+        self.cache.get("a/1", ["f"])
+        self.cache.update("a/3", 1, {"f": 1}, ["f"])
+        assert self.cache.get("a/2", ["f"]) is None
+        assert self.cache.get("a/1", ["f"]) is not None
+        assert self.cache.get_stats()["fields"] == 3
+
+    def test_expired(self) -> None:
+        cache = SharedModelCache(max_size=4, max_age=-1)
+        cache.update("a/1", 1, {"f": 1}, ["f"])
+        assert cache.get("a/1", ["f"]) is None
+
+    def test_invalidate_keys(self) -> None:
+        self.cache.update("a/1", 1, {"f": 1}, ["f"])
+        self.cache.update("a/2", 1, {"f": 1}, ["f"])
+        self.cache.invalidate_keys(["a/1/f", "a/f"])
+        assert self.cache.get("a/1", ["f"]) is None
+        assert self.cache.get("a/2", ["f"]) is not None
+
+
+class TestCacheDatastoreAdapterWithSharedCache(TestCase):
+    def setUp(self) -> None:
+        self.shared_cache = SharedModelCache(max_size=100, max_age=60)
+        patcher = patch(
+            "openslides_backend.services.datastore.adapter.DatastoreAdapter.get_many"
+        )
+        self.get_many_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.get_many_mock.side_effect = self._get_many
+        self.write_mock = self.patch_adapter_method("write")
+
+    def patch_adapter_method(self, method: str) -> Any:
+        patcher = patch(
+            f"openslides_backend.services.datastore.adapter.DatastoreAdapter.{method}"
+        )
+        mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mock
+
+    def _get_many(
+        self, get_many_requests: List[GetManyRequest], *args: Any, **kwargs: Any
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        model = {"f": 1, "meta_position": 3}
+        return {
+            request.collection: {
+                id: {field: model[field] for field in request.mapped_fields}
+                for id in request.ids
+            }
+            for request in get_many_requests
+        }
+
+    def create_adapter(self) -> ExtendedDatastoreAdapter:
+        return ExtendedDatastoreAdapter(
+            MagicMock(), MagicMock(), MagicMock(), self.shared_cache
+        )
+
+    def test_unlocked_read_served_from_shared_cache(self) -> None:
+        request = GetManyRequest("a", [1], ["f"])
+        result = self.create_adapter().get_many([request], lock_result=False)
+        assert result == {"a": {1: {"f": 1}}}
+        result = self.create_adapter().get_many([request], lock_result=False)
+        assert result == {"a": {1: {"f": 1}}}
+        self.get_many_mock.assert_called_once()
+
+    def test_locked_read_from_shared_cache_locks_fields(self) -> None:
+        request = GetManyRequest("a", [1], ["f"])
+        self.create_adapter().get_many([request], lock_result=False)
+        adapter = self.create_adapter()
+        result = adapter.get_many([request])
+        assert result == {"a": {1: {"f": 1, "meta_position": 3}}}
+        assert adapter.locked_fields == {"a/1/f": 3}
+        self.get_many_mock.assert_called_once()
+
+    def test_write_invalidates(self) -> None:
+        request = GetManyRequest("a", [1], ["f"])
+        adapter = self.create_adapter()
+        adapter.get_many([request], lock_result=False)
+        adapter.write(
+            WriteRequest(
+                events=[{"type": EventType.Update, "fqid": "a/1", "fields": {"f": 2}}]
+            )
+        )
+        assert self.shared_cache.get("a/1", ["f"]) is None
+
+    def test_broken_lock_invalidates(self) -> None:
+        self.shared_cache.update("a/2", 1, {"f": 1}, ["f"])
+        self.write_mock.side_effect = DatastoreLockedException("")
+        with self.assertRaises(DatastoreLockedException):
+            self.create_adapter().write(
+                WriteRequest(events=[], locked_fields={"a/2/f": 1})
+            )
+        assert self.shared_cache.get("a/2", ["f"]) is None
@@ -0,0 +1,166 @@
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import pytest
+import simplejson as json
+
+from openslides_backend.shared.env import Environment
+from openslides_backend.shared.startup_profiler import (
+    ProfilingLoader,
+    StartupBudgetExceeded,
+    StartupProfiler,
+)
+
+# Used if OPENSLIDES_BACKEND_STARTUP_BUDGET is not set. The profiled startup of the
+# action component took about 7 seconds on a development machine, tracemalloc
+# included, so the budget leaves room for slower machines but catches regressions.
+DEFAULT_STARTUP_BUDGET = 15.0
+
+# Runs the startup of main.py like gunicorn does: the import of main.py covers the
+# import and register_services phases, load covers the wsgi, otel and application
+# phases and writes the report to the given directory.
+PROFILE_STARTUP = """
+import os
+import sys
+
+os.environ["OPENSLIDES_BACKEND_STARTUP_PROFILE"] = sys.argv[1]
+
+from openslides_backend import main
+from openslides_backend.shared.env import Environment
+
+env = Environment(os.environ)
+main.OpenSlidesBackendGunicornApplication("ActionView", env).load()
+"""
+
+
+class StartupProfilerTest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        sys.path.insert(0, self.tmp_dir.name)
+        self.addCleanup(sys.path.remove, self.tmp_dir.name)
+        for name, code in (
+            (
+                "startup_profiler_outer",
+                "import startup_profiler_inner\nx = [0] * 10000",
+            ),
+            ("startup_profiler_inner", "y = [0] * 100000"),
+        ):
+            with open(os.path.join(self.tmp_dir.name, name + ".py"), "w") as f:
+                f.write(code)
+
+    def tearDown(self) -> None:
+        for name in ("startup_profiler_outer", "startup_profiler_inner"):
+            sys.modules.pop(name, None)
+
+    def test_profile(self) -> None:
+        profiler = StartupProfiler()
+        profiler.start()
+        with profiler.phase("import"):
+            import startup_profiler_outer  # type: ignore # noqa: F401
+        profiler.stop()
+        assert profiler.finder not in sys.meta_path
+        assert set(profiler.phases) == {"import"}
+        outer = profiler.modules["startup_profiler_outer"]
+        inner = profiler.modules["startup_profiler_inner"]
+        assert outer["seconds"] >= inner["seconds"]
+        assert outer["self_seconds"] < outer["seconds"]
+        assert inner["self_seconds"] == inner["seconds"]
+        assert inner["memory"] > 0
+        assert outer["memory"] > inner["memory"]
+        assert profiler.phases["import"]["memory"] >= outer["memory"]
+        assert profiler.peak_memory >= outer["memory"]
+
+        path = os.path.join(self.tmp_dir.name, "report", "startup.json")
+        profiler.write_report(path)
+        with open(path) as f:
+            report = json.load(f)
+        assert report["imported_modules"] == 2
+        assert list(report["modules"]) == sorted(
+            report["modules"],
+            key=lambda name: report["modules"][name]["self_seconds"],
+            reverse=True,
+        )
+
+    def test_restart(self) -> None:
+        profiler = StartupProfiler()
+        profiler.start()
+        with profiler.phase("import"):
+            import startup_profiler_inner  # type: ignore # noqa: F401
+        profiler.stop()
+        seconds = profiler.seconds
+        profiler.start()
+        with profiler.phase("application"):
+            import startup_profiler_outer  # noqa: F401
+        profiler.stop()
+        assert profiler.finder not in sys.meta_path
+        assert list(profiler.phases) == ["import", "application"]
+        assert set(profiler.modules) == {
+            "startup_profiler_inner",
+            "startup_profiler_outer",
+        }
+        assert profiler.seconds > seconds > 0
+        assert profiler.peak_memory > 0
+
+    def test_import_after_stop(self) -> None:
+        profiler = StartupProfiler()
+        profiler.start()
+        with profiler.phase("import"):
+            import startup_profiler_inner  # noqa: F401
+        profiler.stop()
+        module = sys.modules.pop("startup_profiler_inner")
+        assert not isinstance(module.__loader__, ProfilingLoader)
+        assert module.__spec__ and module.__spec__.loader is module.__loader__
+        assert "exec_module" not in vars(module.__loader__)
+
+        import startup_profiler_outer  # noqa: F401
+
+        assert set(profiler.modules) == {"startup_profiler_inner"}
+
+    def test_disabled(self) -> None:
+        profiler = StartupProfiler(False)
+        profiler.start()
+        with profiler.phase("import"):
+            import startup_profiler_outer  # noqa: F401
+        profiler.stop()
+        assert profiler.phases == {}
+        assert profiler.modules == {}
+        profiler.check_budget(0.000001)
+
+    def test_budget(self) -> None:
+        profiler = StartupProfiler()
+        profiler.seconds = 2
+        profiler.check_budget(0)
+        profiler.check_budget(3)
+        with pytest.raises(StartupBudgetExceeded) as e:
+            profiler.check_budget(1)
+        assert (
+            e.value.message == "Startup took 2.00 seconds, the budget is 1.00 seconds."
+        )
+
+    def test_startup_budget(self) -> None:
+        """
+        Profiles the startup of the action component in a fresh interpreter.
+        """
+        budget = Environment(os.environ).get_startup_budget()
+        path = os.path.join(self.tmp_dir.name, "profile")
+        subprocess.run(
+            [sys.executable, "-c", PROFILE_STARTUP, path], check=True, timeout=300
+        )
+        (filename,) = os.listdir(path)
+        assert filename.startswith("startup-ActionView-")
+        with open(os.path.join(path, filename)) as f:
+            report = json.load(f)
+        assert list(report["phases"]) == [
+            "import",
+            "register_services",
+            "wsgi",
+            "otel",
+            "application",
+        ]
+        profiler = StartupProfiler()
+        profiler.seconds = report["seconds"]
+        profiler.check_budget(budget or DEFAULT_STARTUP_BUDGET)
@@ -0,0 +1,81 @@
+import copy
+import json
+from typing import Any, Dict, Set
+from unittest import TestCase
+from unittest.mock import patch
+
+from openslides_backend.models import checker
+from openslides_backend.models.checker import Checker, CheckException
+from openslides_backend.models.streaming_checker import (
+    StreamingChecker,
+    get_check_order,
+)
+
+
+class StreamingCheckerTest(TestCase):
+    example_data: Dict[str, Any]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open("global/data/example-data.json") as f:
+            cls.example_data = json.load(f)
+
+    def setUp(self) -> None:
+        self.data = copy.deepcopy(self.example_data)
+        patcher = patch.object(
+            checker,
+            "get_backend_migration_index",
+            lambda: self.data["_migration_index"],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_errors(self, checker: Checker) -> Set[str]:
+        try:
+            checker.run_check()
+        except CheckException as e:
+            return set(str(e).split("\n"))
+        return set()
+
+    def get_streaming_errors(self) -> Set[str]:
+        data = copy.deepcopy(self.data)
+        ids = {
+            collection: set(int(id) for id in models)
+            for collection, models in data.items()
+            if not collection.startswith("_") and models
+        }
+        loaded = []
+
+        def loader(collection: str) -> Dict[str, Any]:
+            loaded.append(collection)
+            return data.pop(collection, {})
+
+        streaming_checker = StreamingChecker(loader, ids, self.data["_migration_index"])
+        errors = self.get_errors(streaming_checker)
+        assert sorted(loaded) == sorted(streaming_checker.allowed_collections)
+        assert not streaming_checker.index
+        assert not streaming_checker.pending
+        return errors
+
+    def test_example_data(self) -> None:
+        assert self.get_streaming_errors() == set()
+
+    def test_same_errors(self) -> None:
+        self.data["motion"]["1"]["state_id"] = 2
+        self.data["tag"]["1"]["tagged_ids"] = []
+        self.data["user"]["1"]["group_$1_ids"].append(42)
+        errors = self.get_errors(Checker(copy.deepcopy(self.data)))
+        assert len(errors) >= 3
+        assert self.get_streaming_errors() == errors
+
+    def test_missing_model(self) -> None:
+        del self.data["agenda_item"]["1"]
+        errors = self.get_errors(Checker(copy.deepcopy(self.data)))
+        assert errors
+        assert self.get_streaming_errors() == errors
+
+    def test_check_order(self) -> None:
+        collections = ["theme", "meeting", "group", "organization"]
+        order = get_check_order(collections)
+        assert sorted(order) == sorted(collections)
+        assert order[0] == "meeting"
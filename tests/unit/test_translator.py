@@ -0,0 +1,57 @@
+from io import BytesIO
+from threading import Barrier, Thread
+from typing import Dict
+from unittest import TestCase
+
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
+
+from openslides_backend.i18n.catalog import MESSAGES_PATH, MessageCatalog
+from openslides_backend.i18n.translator import Translator, translate
+
+
+class MessageCatalogTest(TestCase):
+    def test_get(self) -> None:
+        catalog = Catalog(locale="de")
+        catalog.add("Motion", "Antrag")
+        catalog.add("Ä", "Ä-de")
+        catalog.add("Agenda", "Tagesordnung")
+        catalog.add("Untranslated", "")
+        mo = BytesIO()
+        write_mo(mo, catalog)
+        message_catalog = MessageCatalog(mo.getvalue())
+        assert message_catalog.get("Motion") == "Antrag"
+        assert message_catalog.get("Agenda") == "Tagesordnung"
+        assert message_catalog.get("Ä") == "Ä-de"
+        assert message_catalog.get("Untranslated") is None
+        assert message_catalog.get("Unknown") is None
+        assert message_catalog.get("") is None
+
+    def test_load(self) -> None:
+        for file in MESSAGES_PATH.glob("*.po"):
+            assert MessageCatalog.load(file.stem).get("Yes")
+
+
+class TranslatorTest(TestCase):
+    def test_threads(self) -> None:
+        barrier = Barrier(2)
+        results: Dict[str, str] = {}
+
+        def run(language: str) -> None:
+            Translator.set_translation_language(language)
+            barrier.wait()
+            results[language] = translate("Yes")
+
+        threads = [Thread(target=run, args=(lang,)) for lang in ("de", "en")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {"de": "Ja", "en": "Yes"}
+        assert Translator.current_language == "en"
+
+    def test_language_header(self) -> None:
+        Translator.set_translation_language("fr;q=0.9,de-DE;q=0.8")
+        assert translate("Yes") == "Ja"
+        Translator.set_translation_language(None)
+        assert translate("Yes") == "Yes"